@@ -0,0 +1,108 @@
+"""Shared helpers for the scripts in this directory (not part of the package)."""
+
+from __future__ import annotations
+
+import logging
+import sys
+
+import numpy as np
+
+from chirp.config_manager import ConfigManager
+from chirp.logger import get_logger
+from chirp.parakeet_manager import ParakeetManager
+
+SAMPLE_RATE = 16_000
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    if sys.platform.startswith("win"):
+        import ctypes
+        from ctypes import wintypes
+
+        class _Counters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = _Counters()
+        counters.cb = ctypes.sizeof(_Counters)
+        ctypes.windll.psapi.GetProcessMemoryInfo(
+            ctypes.windll.kernel32.GetCurrentProcess(),
+            ctypes.byref(counters),
+            counters.cb,
+        )
+        return counters.PeakWorkingSetSize / 2**20
+
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, KiB on Linux.
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def resident_mb() -> tuple[float, float]:
+    """Current (private, file-backed) resident memory in MiB; Linux only, else NaN.
+
+    File-backed pages (e.g. memory-mapped weights) can be shared with other
+    processes mapping the same file; private pages cannot.
+    """
+    values = {"RssAnon": float("nan"), "RssFile": float("nan")}
+    try:
+        with open("/proc/self/status", encoding="ascii") as handle:
+            for line in handle:
+                key, _, rest = line.partition(":")
+                if key in values:
+                    values[key] = int(rest.split()[0]) / 2**10
+    except OSError:
+        pass
+    return values["RssAnon"], values["RssFile"]
+
+
+def synthetic_speech(seconds: float, *, seed: int = 0) -> np.ndarray:
+    """Speech-like test signal: syllable-rate modulated noise with short pauses."""
+    rng = np.random.default_rng(seed)
+    samples = int(seconds * SAMPLE_RATE)
+    t = np.arange(samples, dtype=np.float32) / SAMPLE_RATE
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 4.0 * t))
+    # Roughly one 400 ms pause every 3 s, as between phrases.
+    envelope[(t % 3.0) > 2.6] = 0.0
+    carrier = rng.standard_normal(samples).astype(np.float32)
+    return (0.1 * envelope * carrier).astype(np.float32)
+
+
+def load_manager(manager_type=ParakeetManager, **overrides) -> ParakeetManager:
+    """ParakeetManager (or ``manager_type``) built from config.toml, with keyword overrides."""
+    logger = get_logger(level=logging.WARNING)
+    config_manager = ConfigManager()
+    config = config_manager.load()
+    model_dir = config_manager.model_dir(config.parakeet_model, config.parakeet_quantization)
+    kwargs = dict(
+        model_name=config.parakeet_model,
+        quantization=config.parakeet_quantization,
+        provider_key=config.onnx_providers,
+        threads=config.threads,
+        logger=logger,
+        model_dir=model_dir,
+        timeout=0,
+        chunk_seconds=config.long_form_chunk_seconds,
+        chunk_overlap=config.long_form_overlap_seconds,
+        pool_size=config.session_pool_size,
+        warmup_seconds=config.model_warmup_seconds,
+        cache_dir=config_manager.model_cache_dir(model_dir)
+        if config.optimized_model_cache
+        else None,
+        onnx_settings=config.onnx,
+        mmap_weights=config.mmap_weights,
+    )
+    kwargs.update(overrides)
+    return manager_type(**kwargs)
@@ -0,0 +1,160 @@
+"""Capture-path benchmark: per-callback cost and stop-time latency.
+
+Compares the preallocated ``RecordingBuffer`` against the previous
+``list.append(indata.copy())`` + ``np.concatenate`` approach by replaying
+PortAudio-sized blocks for recordings of various lengths. The preallocated
+sink sizes and grows its buffer like ``AudioCapture``: the reservation is
+capped at ``MAX_PREALLOCATED_SECONDS`` and longer recordings are grown ahead
+of time on a background thread. The replay runs far faster than realtime,
+where that copy finishes within a few block periods, so it is waited for
+between callbacks, outside the timed region.
+
+    uv run python benchmarks/bench_audio_capture.py
+    uv run python benchmarks/bench_audio_capture.py --durations 45 600 --block 256
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from chirp.audio_buffer import PendingGrowth, PrerollRing, RecordingBuffer
+from chirp.audio_capture import GROW_AHEAD_FRACTION, MAX_PREALLOCATED_SECONDS
+
+SAMPLE_RATE = 16_000
+
+
+class LegacyFrames:
+    def __init__(self) -> None:
+        self._frames: list[np.ndarray] = []
+
+    def write(self, block: np.ndarray) -> None:
+        self._frames.append(block.copy())
+
+    def finish(self) -> np.ndarray:
+        audio = np.concatenate(self._frames, axis=0)
+        self._frames.clear()
+        return audio.reshape(-1)
+
+
+class Preallocated:
+    """Mirrors AudioCapture: capped reservation, growth built off the callback."""
+
+    def __init__(self, seconds: float) -> None:
+        capacity = int(min(seconds + 1.0, MAX_PREALLOCATED_SECONDS) * SAMPLE_RATE)
+        self._buffer = RecordingBuffer(capacity=capacity)
+        self._buffer.reset()
+        self._lock = threading.Lock()
+        self._grower: threading.Thread | None = None
+        self.growths = 0
+
+    def write(self, block: np.ndarray) -> None:
+        growth = None
+        with self._lock:
+            self._buffer.write(block)
+            if self._grower is None and self._buffer.needs_room(GROW_AHEAD_FRACTION):
+                growth = self._buffer.begin_growth()
+                self._grower = threading.Thread(target=self._grow, args=(growth,))
+        if growth is not None:
+            self._grower.start()
+
+    def _grow(self, growth: PendingGrowth) -> None:
+        growth.fill()
+        with self._lock:
+            self.growths += self._buffer.finish_growth(growth)
+            self._grower = None
+
+    def settle(self) -> None:
+        grower = self._grower
+        if grower is not None:
+            grower.join()
+
+    def finish(self) -> np.ndarray:
+        self.settle()
+        return self._buffer.view().reshape(-1)
+
+
+class IdlePreroll:
+    """Always-listening cost: the callback feeds the pre-roll ring between recordings."""
+
+    def __init__(self, preroll_ms: float) -> None:
+        self._ring = PrerollRing(capacity=int(SAMPLE_RATE * preroll_ms / 1000))
+        self._target = RecordingBuffer(capacity=self._ring.capacity)
+
+    def write(self, block: np.ndarray) -> None:
+        self._ring.write(block)
+
+    def finish(self) -> np.ndarray:
+        # Mirrors AudioCapture.start(): the ring is drained into the new recording.
+        self._target.reset()
+        self._ring.drain_into(self._target)
+        return self._target.view().reshape(-1)
+
+
+def _run(sink, seconds: float, block: int) -> tuple[np.ndarray, float]:
+    indata = np.random.default_rng(0).standard_normal((block, 1)).astype(np.float32)
+    callbacks = int(seconds * SAMPLE_RATE) // block
+    costs = np.empty(callbacks, dtype=np.float64)
+    clock = time.perf_counter_ns
+    for i in range(callbacks):
+        t0 = clock()
+        sink.write(indata)
+        costs[i] = clock() - t0
+        settle = getattr(sink, "settle", None)
+        if settle is not None:
+            settle()
+    t0 = time.perf_counter()
+    audio = sink.finish()
+    stop_ms = (time.perf_counter() - t0) * 1000
+    assert 0 < audio.size <= callbacks * block
+    return costs, stop_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--durations",
+        type=float,
+        nargs="+",
+        default=[45.0, 600.0, 7200.0],
+        help="Recording lengths in seconds",
+    )
+    parser.add_argument("--block", type=int, default=512, help="Frames per callback")
+    parser.add_argument(
+        "--preroll-ms", type=float, default=300.0, help="Pre-roll ring size"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'impl':<13}{'duration':>10}{'cb mean us':>12}{'cb p99 us':>11}"
+        f"{'cb max us':>11}{'stop ms':>10}"
+    )
+    for seconds in args.durations:
+        for name, sink in (
+            ("legacy", LegacyFrames()),
+            ("preallocated", Preallocated(seconds)),
+        ):
+            costs, stop_ms = _run(sink, seconds, args.block)
+            print(
+                f"{name:<13}{seconds:>9.0f}s{costs.mean() / 1000:>12.2f}"
+                f"{np.percentile(costs, 99) / 1000:>11.2f}{costs.max() / 1000:>11.1f}"
+                f"{stop_ms:>10.2f}"
+            )
+            del sink
+
+    # For the pre-roll row "duration" is idle time and "stop" is the drain at start().
+    ring = IdlePreroll(args.preroll_ms)
+    costs, drain_ms = _run(ring, 60.0, args.block)
+    print(
+        f"{'preroll idle':<13}{60:>9.0f}s{costs.mean() / 1000:>12.2f}"
+        f"{np.percentile(costs, 99) / 1000:>11.2f}{costs.max() / 1000:>11.1f}"
+        f"{drain_ms:>10.2f}"
+    )
+    print(f"pre-roll ring: {args.preroll_ms:.0f} ms = {ring._ring.nbytes} bytes, fixed")
+
+
+if __name__ == "__main__":
+    main()
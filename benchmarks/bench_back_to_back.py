@@ -0,0 +1,128 @@
+"""Back-to-back dictation benchmark: a burst of utterances, serial vs pipelined.
+
+Simulates a user dictating ``--utterances`` phrases in a row. Speaking is
+a sleep of the phrase length (times ``--speak-scale``) plus ``--gap``
+between phrases. Modes:
+
+* ``serial``     - each phrase is transcribed and pasted before the next
+  one starts, as when stopping a recording waited for its transcript
+* ``pipeline/N`` - the next phrase starts at once; phrases go through the
+  app's ``Pipeline`` with N inference workers and are pasted in order
+
+Columns: burst wall time from the first start to the last paste, phrases
+per minute, and median stop-to-paste latency. Each mode runs in a fresh
+subprocess. Requires the model from `chirp-setup`.
+
+    uv run python benchmarks/bench_back_to_back.py
+    uv run python benchmarks/bench_back_to_back.py --utterances 8 --seconds 4 --workers 1 2 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _util import SAMPLE_RATE, load_manager, synthetic_speech  # noqa: E402
+
+from chirp.pipeline import Pipeline, Stage  # noqa: E402
+
+
+def _child(mode: str, utterances: int, seconds: float, gap: float, speak_scale: float) -> None:
+    manager = load_manager()
+    phrases = [synthetic_speech(seconds, seed=index) for index in range(utterances)]
+    manager.transcribe(phrases[0], sample_rate=SAMPLE_RATE)  # untimed warm-up
+    pasted: list[int] = []
+    latencies: list[float] = []
+
+    def inference(item):
+        index, audio, stopped_at = item
+        manager.transcribe(audio, sample_rate=SAMPLE_RATE)
+        return index, audio, stopped_at
+
+    def paste(item):
+        index, _, stopped_at = item
+        pasted.append(index)
+        latencies.append(time.perf_counter() - stopped_at)
+        return item
+
+    pipeline = None
+    if mode != "serial":
+        pipeline = Pipeline(
+            [Stage("inference", inference, workers=int(mode)), Stage("inject", paste)]
+        )
+    started = time.perf_counter()
+    for index, audio in enumerate(phrases):
+        time.sleep(seconds * speak_scale)  # speaking
+        item = (index, audio, time.perf_counter())
+        if pipeline is None:
+            paste(inference(item))
+        else:
+            pipeline.submit(item)
+        time.sleep(gap)
+    if pipeline is not None:
+        pipeline.join()
+        pipeline.close()
+    elapsed = time.perf_counter() - started
+    if pasted != sorted(pasted):
+        raise SystemExit(f"pasted out of order: {pasted}")
+    print(json.dumps({"elapsed": elapsed, "latency": statistics.median(latencies)}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--utterances", type=int, default=6)
+    parser.add_argument("--seconds", type=float, default=3.0, help="length of each phrase")
+    parser.add_argument("--gap", type=float, default=0.3, help="pause between phrases")
+    parser.add_argument("--speak-scale", type=float, default=1.0)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child, args.utterances, args.seconds, args.gap, args.speak_scale)
+        return
+
+    print(f"{args.utterances} phrases of {args.seconds:.1f}s, {args.gap:.1f}s apart")
+    print(f"{'mode':<12}{'burst s':>9}{'phrases/min':>13}{'latency s':>11}{'speedup':>9}")
+    baseline = None
+    for mode in ["serial", *map(str, args.workers)]:
+        proc = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--child",
+                mode,
+                "--utterances",
+                str(args.utterances),
+                "--seconds",
+                str(args.seconds),
+                "--gap",
+                str(args.gap),
+                "--speak-scale",
+                str(args.speak_scale),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        label = mode if mode == "serial" else f"pipeline/{mode}"
+        if proc.returncode != 0:
+            print(f"{label:<12}  failed: {proc.stderr.strip().splitlines()[-1:]}")
+            continue
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        baseline = baseline or result["elapsed"]
+        print(
+            f"{label:<12}{result['elapsed']:>9.1f}"
+            f"{args.utterances * 60 / result['elapsed']:>13.1f}"
+            f"{result['latency']:>11.2f}{baseline / result['elapsed']:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Batch-throughput benchmark: utterances/sec of transcribe_batch vs batch size.
+
+A fixed set of dictation-length utterances (2-12 s, shuffled) is transcribed
+once per batch size. Batch size 1 is the one-call-per-utterance baseline.
+Each batch size runs in a fresh subprocess so peak memory is per size.
+Requires the model from `chirp-setup`.
+
+    uv run python benchmarks/bench_batch_throughput.py
+    uv run python benchmarks/bench_batch_throughput.py --utterances 64 --batch-sizes 1 4 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _util import SAMPLE_RATE, load_manager, peak_rss_mb, synthetic_speech  # noqa: E402
+
+
+def _utterances(count: int) -> list[np.ndarray]:
+    rng = np.random.default_rng(0)
+    return [
+        synthetic_speech(float(seconds), seed=index)
+        for index, seconds in enumerate(rng.uniform(2.0, 12.0, size=count))
+    ]
+
+
+def _child(utterances: int, batch_size: int) -> None:
+    manager = load_manager()
+    waveforms = _utterances(utterances)
+    # Untimed pass to warm up the session at this batch size.
+    manager.transcribe_batch(
+        waveforms[:batch_size], sample_rate=SAMPLE_RATE, max_batch_size=batch_size
+    )
+    started = time.perf_counter()
+    manager.transcribe_batch(waveforms, sample_rate=SAMPLE_RATE, max_batch_size=batch_size)
+    elapsed = time.perf_counter() - started
+    audio_seconds = sum(waveform.size for waveform in waveforms) / SAMPLE_RATE
+    print(
+        json.dumps(
+            {"elapsed": elapsed, "audio_seconds": audio_seconds, "peak_rss_mb": peak_rss_mb()}
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--utterances", type=int, default=32)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--child", nargs=2, type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(*args.child)
+        return
+
+    print(f"{os.cpu_count()} logical CPUs, {args.utterances} utterances of 2-12 s")
+    print(f"{'batch':>6}{'elapsed s':>11}{'utt/s':>8}{'RTF':>8}{'speedup':>9}{'peak MiB':>10}")
+    baseline = None
+    for batch_size in args.batch_sizes:
+        proc = subprocess.run(
+            [sys.executable, __file__, "--child", str(args.utterances), str(batch_size)],
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            print(f"{batch_size:>6}  failed: {proc.stderr.strip().splitlines()[-1:]}")
+            continue
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        baseline = baseline or result["elapsed"]
+        print(
+            f"{batch_size:>6}{result['elapsed']:>11.1f}"
+            f"{args.utterances / result['elapsed']:>8.2f}"
+            f"{result['elapsed'] / result['audio_seconds']:>8.3f}"
+            f"{baseline / result['elapsed']:>8.2f}x{result['peak_rss_mb']:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Hotkey hook latency: running the command in the hook vs posting it to the controller.
+
+The keyboard hook blocks system-wide input until its callback returns.
+``inline`` runs a stand-in command (``--command-ms`` of work, like opening
+the device and starting a chime) in the callback, as ``toggle_recording``
+used to. ``controller`` hands it to ``chirp.controller.Controller`` and
+``async`` to the event loop of ``chirp.async_core.AsyncCore``.
+Reports callback latency percentiles in microseconds. Needs no model.
+
+    uv run python benchmarks/bench_hotkey_latency.py
+    uv run python benchmarks/bench_hotkey_latency.py --presses 500 --command-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import time
+
+from chirp.async_core import AsyncCore
+from chirp.controller import Controller
+
+
+def _measure(callback, presses: int, interval: float) -> list[float]:
+    latencies = []
+    for _ in range(presses):
+        started = time.perf_counter()
+        callback()
+        latencies.append(time.perf_counter() - started)
+        time.sleep(interval)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--presses", type=int, default=200)
+    parser.add_argument("--command-ms", type=float, default=5.0)
+    parser.add_argument("--interval-ms", type=float, default=2.0, help="time between presses")
+    args = parser.parse_args()
+
+    def command() -> None:
+        time.sleep(args.command_ms / 1000)
+
+    interval = args.interval_ms / 1000
+    controllers = {
+        "controller": Controller(logger=logging.getLogger("bench")),
+        "async": AsyncCore(logger=logging.getLogger("bench")),
+    }
+    results = {"inline": _measure(command, args.presses, interval)}
+    for mode, controller in controllers.items():
+        results[mode] = _measure(controller.hotkey("toggle", command), args.presses, interval)
+        controller.close()
+
+    print(f"{args.presses} presses, {args.command_ms:.1f} ms command")
+    print(f"{'mode':<12}{'p50 us':>10}{'p99 us':>10}{'max us':>10}")
+    for mode, latencies in results.items():
+        latencies.sort()
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(
+            f"{mode:<12}{statistics.median(latencies) * 1e6:>10.1f}"
+            f"{p99 * 1e6:>10.1f}{latencies[-1] * 1e6:>10.1f}"
+        )
+    for mode, controller in controllers.items():
+        stats = controller.stats()
+        print(
+            f"{mode}: {stats.commands} commands, queue wait {stats.mean_queue * 1000:.1f} ms "
+            f"mean / {stats.max_queue_seconds * 1000:.1f} ms max"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Stop-to-text latency against utterance length, batch vs incremental.
+
+Batch decodes the whole utterance after stop. Incremental decodes the
+phrases closed by ``find_segment_end`` "during recording" (untimed here)
+and only the remaining tail after stop. Requires the model from
+`chirp-setup`.
+
+    uv run python benchmarks/bench_incremental.py
+    uv run python benchmarks/bench_incremental.py --seconds 3 10 40 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _util import SAMPLE_RATE, load_manager, synthetic_speech  # noqa: E402
+
+from chirp.config_manager import ConfigManager  # noqa: E402
+from chirp.long_form import find_segment_end  # noqa: E402
+
+
+def _tail_start(audio, min_seconds: float, max_seconds: float) -> int:
+    offset = 0
+    while True:
+        end = find_segment_end(
+            audio[offset:], SAMPLE_RATE, min_seconds=min_seconds, max_seconds=max_seconds
+        )
+        if end is None:
+            return offset
+        offset += end
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, nargs="+", default=[3, 10, 20, 40])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    config = ConfigManager().load()
+    manager = load_manager()
+    manager.transcribe(synthetic_speech(1.0), sample_rate=SAMPLE_RATE)  # warm up
+
+    print(f"{'utterance':>10}{'batch ms':>10}{'incr ms':>10}{'tail s':>8}")
+    for seconds in args.seconds:
+        audio = synthetic_speech(seconds, seed=int(seconds))
+        tail = audio[
+            _tail_start(
+                audio, config.incremental_min_seconds, config.incremental_max_seconds
+            ) :
+        ]
+        batch, incremental = [], []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            manager.transcribe(audio, sample_rate=SAMPLE_RATE)
+            batch.append(time.perf_counter() - started)
+            started = time.perf_counter()
+            manager.transcribe(tail, sample_rate=SAMPLE_RATE)
+            incremental.append(time.perf_counter() - started)
+        print(
+            f"{seconds:>9.0f}s{statistics.median(batch) * 1000:>10.0f}"
+            f"{statistics.median(incremental) * 1000:>10.0f}{tail.size / SAMPLE_RATE:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
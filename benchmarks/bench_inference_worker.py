@@ -0,0 +1,121 @@
+"""Inference-worker benchmark: in-process ParakeetManager vs InferenceWorker.
+
+Each mode runs in a fresh subprocess. Columns:
+
+* ``latency``  - median transcription time per clip length
+* ``ipc ms``   - worker round trip minus time in the model (copy, pipe, wake-up)
+* ``tick ms``  - worst delay of a 1 ms Python timer thread during inference,
+  a stand-in for the keyboard hook and audio callback competing for the GIL
+* ``idle MiB`` - private resident memory of this process after unloading
+
+Requires the model from `chirp-setup`.
+
+    uv run python benchmarks/bench_inference_worker.py
+    uv run python benchmarks/bench_inference_worker.py --seconds 1 5 30 --repeats 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _util import SAMPLE_RATE, load_manager, resident_mb, synthetic_speech  # noqa: E402
+
+from chirp.inference_worker import InferenceWorker  # noqa: E402
+
+
+class _TickMonitor:
+    """Thread that sleeps 1 ms at a time and records how late it wakes up."""
+
+    def __init__(self) -> None:
+        self.worst = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            started = time.perf_counter()
+            time.sleep(0.001)
+            self.worst = max(self.worst, time.perf_counter() - started - 0.001)
+
+    def stop(self) -> float:
+        self._stop.set()
+        self._thread.join()
+        return self.worst
+
+
+def _child(mode: str, seconds: list[float], repeats: int) -> None:
+    worker = mode == "worker"
+    manager = load_manager(manager_type=InferenceWorker) if worker else load_manager()
+    results: dict = {"latency": {}, "ipc_ms": {}, "tick_ms": {}}
+    for length in seconds:
+        audio = synthetic_speech(length)
+        manager.transcribe(audio, sample_rate=SAMPLE_RATE)  # untimed warm-up
+        latencies, ipc = [], []
+        ticks = _TickMonitor()
+        for _ in range(repeats):
+            started = time.perf_counter()
+            manager.transcribe(audio, sample_rate=SAMPLE_RATE)
+            latencies.append(time.perf_counter() - started)
+            if worker:
+                ipc.append(manager.metrics.last_ipc_seconds)
+        results["tick_ms"][length] = ticks.stop() * 1000
+        results["latency"][length] = statistics.median(latencies)
+        results["ipc_ms"][length] = statistics.median(ipc) * 1000 if ipc else 0.0
+    manager.unload()
+    results["idle_mb"] = resident_mb()[0]
+    manager.close()
+    print(json.dumps(results))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, nargs="+", default=[1.0, 5.0, 20.0])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child, args.seconds, args.repeats)
+        return
+
+    print(f"{'mode':<11}{'clip s':>7}{'latency s':>11}{'ipc ms':>8}{'tick ms':>9}{'idle MiB':>10}")
+    for mode in ("in-process", "worker"):
+        proc = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--child",
+                mode,
+                "--repeats",
+                str(args.repeats),
+                "--seconds",
+                *map(str, args.seconds),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            print(f"{mode:<11}  failed: {proc.stderr.strip().splitlines()[-1:]}")
+            continue
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        for index, length in enumerate(args.seconds):
+            key = str(length)
+            idle = f"{result['idle_mb']:>10.0f}" if index == 0 else ""
+            print(
+                f"{mode:<11}{length:>7.0f}{result['latency'][key]:>11.3f}"
+                f"{result['ipc_ms'][key]:>8.1f}{result['tick_ms'][key]:>9.1f}{idle}"
+            )
+
+
+if __name__ == "__main__":
+    main()
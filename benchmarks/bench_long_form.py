@@ -0,0 +1,82 @@
+"""Long-form transcription benchmark: peak RSS and real-time factor.
+
+Each (duration, mode) pair runs in a fresh subprocess so peak RSS is not
+inherited from a previous run. Requires the model from `chirp-setup`.
+
+    uv run python benchmarks/bench_long_form.py
+    uv run python benchmarks/bench_long_form.py --minutes 1 10 --single
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _util import SAMPLE_RATE, load_manager, peak_rss_mb, synthetic_speech  # noqa: E402
+
+
+def _child(minutes: float, chunk_seconds: float) -> None:
+    manager = load_manager(chunk_seconds=chunk_seconds)
+    baseline = peak_rss_mb()
+    audio = synthetic_speech(minutes * 60)
+    started = time.perf_counter()
+    manager.transcribe(audio, sample_rate=SAMPLE_RATE)
+    elapsed = time.perf_counter() - started
+    print(
+        json.dumps(
+            {
+                "elapsed": elapsed,
+                "rtf": elapsed / (minutes * 60),
+                "peak_rss_mb": peak_rss_mb(),
+                "model_rss_mb": baseline,
+            }
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, nargs="+", default=[1.0, 10.0, 60.0])
+    parser.add_argument("--chunk-seconds", type=float, default=60.0)
+    parser.add_argument(
+        "--single",
+        action="store_true",
+        help="Also run the whole waveform in one call (may exhaust memory for long inputs)",
+    )
+    parser.add_argument("--child", nargs=2, type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(*args.child)
+        return
+
+    modes = [("chunked", args.chunk_seconds)]
+    if args.single:
+        modes.append(("single", 0.0))
+
+    print(f"{'mode':<9}{'audio':>8}{'elapsed s':>11}{'RTF':>8}{'model MiB':>11}{'peak MiB':>10}")
+    for minutes in args.minutes:
+        for name, chunk_seconds in modes:
+            proc = subprocess.run(
+                [sys.executable, __file__, "--child", str(minutes), str(chunk_seconds)],
+                capture_output=True,
+                text=True,
+            )
+            if proc.returncode != 0:
+                print(f"{name:<9}{minutes:>6.0f}m  failed: {proc.stderr.strip().splitlines()[-1:]}")
+                continue
+            result = json.loads(proc.stdout.strip().splitlines()[-1])
+            print(
+                f"{name:<9}{minutes:>6.0f}m{result['elapsed']:>11.1f}{result['rtf']:>8.3f}"
+                f"{result['model_rss_mb']:>11.0f}{result['peak_rss_mb']:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
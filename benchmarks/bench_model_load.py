@@ -0,0 +1,117 @@
+"""Model-load benchmark: cold start, idle reload and memory with the model cache.
+
+Each row runs in fresh subprocesses, as at app start. Rows:
+
+* ``original``  - graphs optimized from the raw ONNX files (cache disabled)
+* ``build``     - first load with an empty cache; optimizes and saves the graphs
+* ``cached``    - later loads that read the saved graphs
+* ``mmap``      - cached graphs with weights memory-mapped (``mmap_weights``)
+
+"reload" is an unload followed by ``ensure_loaded()`` in the same process, as
+after ``model_timeout``. "private"/"shared" split the resident memory after
+loading into anonymous pages and file-backed pages (Linux only); mapped
+weights show up as shared and are counted once across processes.
+
+The cache lives in a temporary directory so the real one is left alone.
+Requires the model from `chirp-setup`.
+
+    uv run python benchmarks/bench_model_load.py
+    uv run python benchmarks/bench_model_load.py --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _util import load_manager, peak_rss_mb, resident_mb  # noqa: E402
+
+
+def _child(cache_dir: str, mmap_weights: bool) -> None:
+    started = time.perf_counter()
+    manager = load_manager(
+        warmup_seconds=0.0,
+        timeout=3600.0,
+        cache_dir=Path(cache_dir) if cache_dir else None,
+        mmap_weights=mmap_weights,
+    )
+    load = time.perf_counter() - started
+    private, shared = resident_mb()
+
+    manager._last_access = float("-inf")  # make the idle deadline due now
+    manager._unload_model()
+    started = time.perf_counter()
+    manager.ensure_loaded()
+    reload = time.perf_counter() - started
+    manager.close()
+    print(
+        json.dumps(
+            {
+                "load": load,
+                "reload": reload,
+                "private_mb": private,
+                "shared_mb": shared,
+                "peak_rss_mb": peak_rss_mb(),
+            }
+        )
+    )
+
+
+def _run(cache_dir: str, mmap_weights: bool = False) -> dict:
+    proc = subprocess.run(
+        [sys.executable, __file__, "--child", cache_dir, str(int(mmap_weights))],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"load failed: {proc.stderr.strip().splitlines()[-1:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _median(results: list[dict], key: str) -> float:
+    return statistics.median(result[key] for result in results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="Processes per row")
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        _child(args.child[0], args.child[1] == "1")
+        return
+
+    with tempfile.TemporaryDirectory(prefix="chirp-ort-cache-") as cache_dir:
+        rows = {
+            "original": [_run("") for _ in range(args.runs)],
+            "build": [_run(cache_dir)],
+            "cached": [_run(cache_dir) for _ in range(args.runs)],
+            "mmap": [_run(cache_dir, mmap_weights=True) for _ in range(args.runs)],
+        }
+
+    print(
+        f"{'load':<10}{'runs':>6}{'load s':>8}{'reload s':>10}"
+        f"{'private MiB':>13}{'shared MiB':>12}{'peak MiB':>10}"
+    )
+    for name, results in rows.items():
+        print(
+            f"{name:<10}{len(results):>6}{_median(results, 'load'):>8.2f}"
+            f"{_median(results, 'reload'):>10.2f}{_median(results, 'private_mb'):>13.0f}"
+            f"{_median(results, 'shared_mb'):>12.0f}{_median(results, 'peak_rss_mb'):>10.0f}"
+        )
+    original = _median(rows["original"], "load")
+    print(f"cached load is {original / _median(rows['cached'], 'load'):.2f}x faster than original")
+    print(f"mmap load is {original / _median(rows['mmap'], 'load'):.2f}x faster than original")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Session-pool benchmark: wall-clock time of chunked decoding, single vs pooled.
+
+Each pool size runs in a fresh subprocess so memory and thread pools are not
+shared between runs. Requires the model from `chirp-setup`.
+
+    uv run python benchmarks/bench_session_pool.py
+    uv run python benchmarks/bench_session_pool.py --minutes 20 --pool-sizes 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _util import SAMPLE_RATE, load_manager, peak_rss_mb, synthetic_speech  # noqa: E402
+
+
+def _child(minutes: float, pool_size: int, chunk_seconds: float) -> None:
+    manager = load_manager(pool_size=pool_size, chunk_seconds=chunk_seconds)
+    audio = synthetic_speech(minutes * 60)
+    # First call creates the pool sessions; time the second.
+    manager.transcribe(audio[: SAMPLE_RATE * int(chunk_seconds) * 2], sample_rate=SAMPLE_RATE)
+    started = time.perf_counter()
+    manager.transcribe(audio, sample_rate=SAMPLE_RATE)
+    elapsed = time.perf_counter() - started
+    print(json.dumps({"elapsed": elapsed, "peak_rss_mb": peak_rss_mb()}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=10.0)
+    parser.add_argument("--chunk-seconds", type=float, default=60.0)
+    parser.add_argument(
+        "--pool-sizes",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, max(1, (os.cpu_count() or 1) // 8)}),
+    )
+    parser.add_argument("--child", nargs=3, type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        minutes, pool_size, chunk_seconds = args.child
+        _child(minutes, int(pool_size), chunk_seconds)
+        return
+
+    print(f"{os.cpu_count()} logical CPUs, {args.minutes:.0f} min of audio")
+    print(f"{'sessions':>9}{'elapsed s':>11}{'RTF':>8}{'speedup':>9}{'peak MiB':>10}")
+    baseline = None
+    for pool_size in args.pool_sizes:
+        proc = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--child",
+                str(args.minutes),
+                str(pool_size),
+                str(args.chunk_seconds),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            print(f"{pool_size:>9}  failed: {proc.stderr.strip().splitlines()[-1:]}")
+            continue
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        baseline = baseline or result["elapsed"]
+        print(
+            f"{pool_size:>9}{result['elapsed']:>11.1f}"
+            f"{result['elapsed'] / (args.minutes * 60):>8.3f}"
+            f"{baseline / result['elapsed']:>8.2f}x{result['peak_rss_mb']:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
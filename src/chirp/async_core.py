@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+
+from .controller import Controller
+from .pipeline import Stage, StageStats, format_stats
+
+
+class AsyncCore(Controller):
+    """``Controller`` backed by an asyncio event loop on one thread.
+
+    Commands posted by the hook, timers and the audio callback become loop
+    callbacks (``call_soon_threadsafe``), and ``AsyncPipeline`` runs each
+    dictation as a task on the same loop, so commands never overlap each
+    other or the stage bookkeeping. App state is still shared with other
+    threads: hand-offs run on the blocking worker, segments arrive from the
+    segmenter thread and inference runs on the pipeline's executor, so the
+    app keeps its locks.
+
+    Blocking work a command needs (the segmenter join and stop chime of a
+    hand-off, model preloads) goes to ``run_blocking()``, one worker thread
+    that runs it in call order. Opening and closing the input device on
+    start and stop still run in the command, on the loop, and delay the
+    commands queued behind them.
+    """
+
+    def _start(self) -> None:
+        self._blocking = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="Blocking"
+        )
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="EventLoop", daemon=True)
+        self._thread.start()
+
+    @property
+    def in_loop(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def call_soon(self, fn: Callable[..., Any], *args: Any) -> None:
+        """Run ``fn(*args)`` on the loop: now if called from it, else next."""
+        if self.in_loop:
+            fn(*args)
+        else:
+            self.loop.call_soon_threadsafe(fn, *args)
+
+    def run(self, coro) -> Any:
+        """Run ``coro`` on the loop from another thread and return its result."""
+        if self.in_loop:
+            raise RuntimeError("AsyncCore.run() would block its own event loop")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def run_blocking(
+        self, name: str, fn: Callable[..., Any], *args: Any
+    ) -> concurrent.futures.Future:
+        """Run ``fn(*args)`` on the blocking worker, after the work queued before it."""
+        future = self._blocking.submit(fn, *args)
+        future.add_done_callback(lambda done: self._report_blocking(name, done))
+        return future
+
+    def close(self) -> None:
+        """Run the commands and blocking work already queued, then stop the loop."""
+        if self.loop.is_closed():
+            return
+        if not self.in_loop:
+            self.run(asyncio.sleep(0))  # runs after the queued commands
+        self._blocking.shutdown(wait=True)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+    def _enqueue(
+        self, name: str, fn: Callable[..., Any], args: tuple, posted_at: float
+    ) -> None:
+        self.loop.call_soon_threadsafe(self._execute, name, fn, args, posted_at)
+
+    def _report_blocking(self, name: str, future: concurrent.futures.Future) -> None:
+        error = future.exception()
+        if error is not None:
+            self._logger.error("Command %s failed: %s", name, error, exc_info=error)
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+
+class AsyncPipeline:
+    """``Pipeline`` with each item as a task on an ``AsyncCore`` loop.
+
+    Stages run on the loop; ``blocking`` stages (inference) go to an
+    executor with ``workers`` threads each, and ``coro`` stages are
+    awaited. Items leave every stage in submission order, as in
+    ``Pipeline``. Waiting for a stage is an awaited semaphore rather than a
+    thread blocked on a queue, so there is no queue size; ``depth`` counts
+    the items waiting.
+    """
+
+    def __init__(
+        self,
+        core: AsyncCore,
+        stages: Sequence[Stage],
+        *,
+        on_done: Optional[Callable[[Any, Optional[BaseException]], None]] = None,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        if not stages:
+            raise ValueError("a pipeline needs at least one stage")
+        self._core = core
+        self._stages = list(stages)
+        self._on_done = on_done
+        self._logger = logger or logging.getLogger("chirp")
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=sum(max(1, s.workers) for s in self._stages if s.blocking) or 1,
+            thread_name_prefix="Inference",
+        )
+        self._slots = [asyncio.Semaphore(max(1, stage.workers)) for stage in self._stages]
+        # Sequence number of the next item allowed to enter the first stage,
+        # and to leave each stage.
+        self._admitted = 0
+        self._turns = [0] * len(self._stages)
+        self._turn_changed = asyncio.Condition()
+        self._next_seq = 0
+        self._seq_lock = threading.Lock()
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats = {stage.name: StageStats() for stage in self._stages}
+        self._stats_lock = threading.Lock()
+
+    @property
+    def stage_names(self) -> List[str]:
+        return [stage.name for stage in self._stages]
+
+    def submit(self, item: Any) -> None:
+        """Start ``item`` on the loop; never blocks.
+
+        The sequence number is taken here, not when the loop gets to the
+        item, so the order of ``submit()`` calls holds across threads.
+        """
+        with self._seq_lock:
+            seq, self._next_seq = self._next_seq, self._next_seq + 1
+        self._core.call_soon(self._start_item, seq, item)
+
+    def run(self, item: Any) -> Any:
+        """Run ``item`` through every stage and wait; see ``Pipeline.run()``."""
+        return self._core.run(self._run_inline(item))
+
+    def join(self) -> None:
+        """Wait until every submitted item has left the pipeline."""
+        self._core.run(self._drain())
+
+    def stats(self) -> Dict[str, StageStats]:
+        with self._stats_lock:
+            return {name: replace(stats) for name, stats in self._stats.items()}
+
+    def summary(self) -> str:
+        return format_stats(self.stats())
+
+    def close(self) -> None:
+        """Finish submitted items, then shut the executor down."""
+        self.join()
+        self._executor.shutdown()
+
+    def _start_item(self, seq: int, item: Any) -> None:
+        task = self._core.loop.create_task(self._walk(seq, item))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _drain(self) -> None:
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def _walk(self, seq: int, item: Any) -> None:
+        await self._admit(seq)
+        alive = True
+        for index in range(len(self._stages)):
+            if alive:
+                try:
+                    result = await self._call(index, item)
+                except Exception as exc:
+                    self._finish(item, exc)
+                    alive = False
+                else:
+                    if result is None:
+                        self._finish(item, None)
+                        alive = False
+                    else:
+                        item = result
+            # Finished items still take their turn so later ones are not held.
+            await self._take_turn(index, seq)
+        if alive:
+            self._finish(item, None)
+
+    async def _run_inline(self, item: Any) -> Any:
+        for index in range(len(self._stages)):
+            try:
+                result = await self._call(index, item)
+            except Exception as exc:
+                self._finish(item, exc)
+                raise
+            if result is None:
+                self._finish(item, None)
+                return None
+            item = result
+        self._finish(item, None)
+        return item
+
+    async def _admit(self, seq: int) -> None:
+        # Tasks can start out of order when submit() races across threads.
+        async with self._turn_changed:
+            await self._turn_changed.wait_for(lambda: self._admitted == seq)
+            self._admitted += 1
+            self._turn_changed.notify_all()
+
+    async def _take_turn(self, index: int, seq: int) -> None:
+        async with self._turn_changed:
+            if self._turns[index] != seq:
+                with self._stats_lock:
+                    self._stats[self._stages[index].name].reordered += 1
+                await self._turn_changed.wait_for(lambda: self._turns[index] == seq)
+            self._turns[index] += 1
+            self._turn_changed.notify_all()
+
+    async def _call(self, index: int, item: Any) -> Any:
+        stage = self._stages[index]
+        stats = self._stats[stage.name]
+        queued_at = time.perf_counter()
+        with self._stats_lock:
+            stats.depth += 1
+            stats.max_depth = max(stats.max_depth, stats.depth)
+        async with self._slots[index]:
+            started = time.perf_counter()
+            with self._stats_lock:
+                stats.depth -= 1
+            failed = False
+            result = None
+            try:
+                if stage.coro is not None:
+                    result = await stage.coro(item)
+                elif stage.blocking:
+                    result = await self._core.loop.run_in_executor(
+                        self._executor, stage.fn, item
+                    )
+                else:
+                    result = stage.fn(item)
+                return result
+            except Exception:
+                failed = True
+                raise
+            finally:
+                with self._stats_lock:
+                    stats.processed += 1
+                    stats.service_seconds += time.perf_counter() - started
+                    stats.wait_seconds += started - queued_at
+                    if failed:
+                        stats.failed += 1
+                    elif result is None:
+                        stats.dropped += 1
+
+    def _finish(self, item: Any, error: Optional[BaseException]) -> None:
+        if self._on_done is not None:
+            try:
+                self._on_done(item, error)
+            except Exception:
+                self._logger.exception("Pipeline completion callback failed")
+        elif error is not None:
+            self._logger.error("Pipeline item failed: %s", error, exc_info=error)
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass(slots=True)
+class PendingGrowth:
+    """A larger backing array being filled away from the writer's thread.
+
+    Made by ``RecordingBuffer.begin_growth()``; see there for the protocol.
+    """
+
+    generation: int
+    source: np.ndarray
+    copied: int  # samples of ``source`` that fill() copies
+    target: Optional[np.ndarray] = None
+
+    def fill(self) -> None:
+        """Allocate double the capacity and copy the samples written so far."""
+        capacity, channels = self.source.shape
+        target = np.empty((capacity * 2, channels), dtype=self.source.dtype)
+        target[: self.copied] = self.source[: self.copied]
+        self.target = target
+
+
+class RecordingBuffer:
+    """Preallocated sample store that the capture callback writes into in place.
+
+    Blocks are copied straight into a single backing array, so the realtime
+    audio thread never allocates in the common case and ``view()`` can hand the
+    recording over as a contiguous slice without concatenating anything. When a
+    recording outgrows the preallocation the array doubles (amortised O(1)).
+    To keep that copy off the realtime thread, ``begin_growth()`` lets another
+    thread build the larger array ahead of time.
+
+    The array returned by ``view()`` is owned by the caller from then on; the
+    next ``reset()`` starts a fresh backing array instead of overwriting it.
+    On Linux and macOS ``np.empty`` only reserves address space, so untouched
+    capacity costs no physical memory; Windows commits the whole allocation
+    against the commit limit, so keep ``capacity`` modest and let it grow.
+    """
+
+    def __init__(self, *, capacity: int, channels: int = 1, dtype: str = "float32") -> None:
+        self.channels = channels
+        self.dtype = np.dtype(dtype)
+        self._initial_capacity = max(1, int(capacity))
+        self._data = self._allocate(self._initial_capacity)
+        self._size = 0
+        self._detached = False
+        self._generation = 0  # bumped by reset(); stale growths are dropped
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._data.shape[0]
+
+    def reset(self) -> None:
+        if self._detached:
+            self._data = self._allocate(self._initial_capacity)
+            self._detached = False
+        self._size = 0
+        self._generation += 1
+
+    def needs_room(self, fraction: float) -> bool:
+        """True once the samples fill more than ``fraction`` of the capacity."""
+        return self._size > self._data.shape[0] * fraction
+
+    def begin_growth(self) -> PendingGrowth:
+        """Start doubling the capacity without making the writer wait for it.
+
+        Call under the writer's lock, ``fill()`` the result without it, then
+        pass it to ``finish_growth()`` under the lock again. Written samples
+        never change, so the bulk copy runs while writes continue; only the
+        samples written meanwhile are copied in ``finish_growth()``.
+        """
+        return PendingGrowth(self._generation, self._data, self._size)
+
+    def finish_growth(self, pending: PendingGrowth) -> bool:
+        """Switch to the grown array; False if the buffer moved on meanwhile."""
+        if (
+            pending.target is None
+            or pending.generation != self._generation
+            or pending.source is not self._data
+            or self._detached
+        ):
+            return False  # reset, handed out, or grown by write() in the meantime
+        pending.target[pending.copied : self._size] = self._data[pending.copied : self._size]
+        self._data = pending.target
+        return True
+
+    def write(self, block: np.ndarray) -> None:
+        frames = block.shape[0]
+        end = self._size + frames
+        if end > self._data.shape[0]:
+            self._grow(end)
+        self._data[self._size : end] = block.reshape(frames, self.channels)
+        self._size = end
+
+    def view(self) -> np.ndarray:
+        self._detached = True
+        return self._data[: self._size]
+
+    def peek(self, start: int = 0) -> np.ndarray:
+        """Samples from ``start`` to the current end, while recording continues.
+
+        Samples already written never change, and growing keeps old arrays
+        alive for existing views, so the slice stays valid after later writes.
+        """
+        return self._data[start : self._size]
+
+    def _grow(self, required: int) -> None:
+        capacity = self._data.shape[0]
+        while capacity < required:
+            capacity *= 2
+        grown = self._allocate(capacity)
+        grown[: self._size] = self._data[: self._size]
+        self._data = grown
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        return np.empty((capacity, self.channels), dtype=self.dtype)
+
+
+class PrerollRing:
+    """Fixed-size ring holding the most recent samples seen while not recording.
+
+    Memory is allocated once up front, so keeping the microphone warm costs a
+    bounded ``nbytes`` no matter how long the app sits idle.
+    """
+
+    def __init__(self, *, capacity: int, channels: int = 1, dtype: str = "float32") -> None:
+        self.channels = channels
+        self._data = np.zeros((max(1, int(capacity)), channels), dtype=np.dtype(dtype))
+        self._head = 0  # next write position
+        self._filled = 0
+
+    def __len__(self) -> int:
+        return self._filled
+
+    @property
+    def capacity(self) -> int:
+        return self._data.shape[0]
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    def clear(self) -> None:
+        self._head = 0
+        self._filled = 0
+
+    def write(self, block: np.ndarray) -> None:
+        capacity = self._data.shape[0]
+        block = block.reshape(-1, self.channels)
+        if block.shape[0] >= capacity:
+            self._data[:] = block[-capacity:]
+            self._head = 0
+            self._filled = capacity
+            return
+        frames = block.shape[0]
+        first = min(frames, capacity - self._head)
+        self._data[self._head : self._head + first] = block[:first]
+        if first < frames:
+            self._data[: frames - first] = block[first:]
+        self._head = (self._head + frames) % capacity
+        self._filled = min(capacity, self._filled + frames)
+
+    def drain_into(self, target: RecordingBuffer) -> int:
+        """Append the buffered samples, oldest first, to ``target`` and clear."""
+        filled = self._filled
+        if filled:
+            start = (self._head - filled) % self._data.shape[0]
+            if start + filled <= self._data.shape[0]:
+                target.write(self._data[start : start + filled])
+            else:
+                target.write(self._data[start:])
+                target.write(self._data[: self._head])
+        self.clear()
+        return filled
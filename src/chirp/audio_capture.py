@@ -1,11 +1,27 @@
 from __future__ import annotations
 
+import logging
 import threading
-from typing import Callable, Optional
+import time
+from typing import Callable, Iterator, Optional, Tuple
 
 import numpy as np
 import sounddevice as sd
 
+from .audio_buffer import PendingGrowth, PrerollRing, RecordingBuffer
+from .long_form import SILENCE_DB, find_segment_end
+from .scheduler import Scheduler, TimerHandle, get_scheduler
+from .vad import SilenceEndpointer
+
+# Reservation used when recordings have no length limit; the buffer grows past it.
+DEFAULT_PREALLOCATED_SECONDS = 60.0
+# Longer limits start at this size and grow by doubling; Windows commits the
+# whole reservation (7200 s would be ~460 MB of float32).
+MAX_PREALLOCATED_SECONDS = 300.0
+# Once a recording fills this much of the buffer, a background thread builds
+# the doubled array so the callback never copies the recording itself.
+GROW_AHEAD_FRACTION = 0.5
+
 
 class AudioCapture:
     def __init__(
@@ -14,47 +30,261 @@ class AudioCapture:
         sample_rate: int = 16_000,
         channels: int = 1,
         dtype: str = "float32",
+        max_duration: float = 0.0,
+        persistent: bool = False,
+        idle_timeout: float = 0.0,
+        preroll_ms: float = 0.0,
+        endpoint_silence: float = 0.0,
+        endpoint_threshold_db: float = -45.0,
+        on_endpoint: Optional[Callable[[], None]] = None,
         status_callback: Optional[Callable[[str], None]] = None,
+        logger: Optional[logging.Logger] = None,
+        scheduler: Optional[Scheduler] = None,
     ) -> None:
         self.sample_rate = sample_rate
         self.channels = channels
         self.dtype = dtype
         self._status_callback = status_callback
+        self._logger = logger or logging.getLogger("chirp")
+        # Persistent mode keeps the device open between recordings; start/stop
+        # only flip the gate below. idle_timeout <= 0 keeps it open forever.
+        # Pre-roll needs audio from before the hotkey, so it implies persistent.
+        self._persistent = persistent or preroll_ms > 0
+        self._idle_timeout = idle_timeout
+        self._scheduler = scheduler or get_scheduler()
+        self._idle_timer: Optional[TimerHandle] = None
         self._stream: Optional[sd.InputStream] = None
-        self._frames: list[np.ndarray] = []
+        self._recording = False
+        self._stopped = threading.Event()
+        self._stopped.set()
+        self.open_duration: Optional[float] = None
+        # Reserve room for a full-length recording (plus a second of slack for
+        # the stop timer) so the callback never reallocates, up to a cap;
+        # longer recordings grow the buffer ahead of time on another thread.
+        seconds = min(
+            max_duration + 1.0 if max_duration > 0 else DEFAULT_PREALLOCATED_SECONDS,
+            MAX_PREALLOCATED_SECONDS,
+        )
+        self._buffer = RecordingBuffer(
+            capacity=int(seconds * sample_rate), channels=channels, dtype=dtype
+        )
+        self._preroll: Optional[PrerollRing] = None
+        if preroll_ms > 0:
+            self._preroll = PrerollRing(
+                capacity=int(sample_rate * preroll_ms / 1000),
+                channels=channels,
+                dtype=dtype,
+            )
+            self._logger.debug(
+                "Pre-roll buffer: %.0f ms (%d frames, %d bytes)",
+                preroll_ms,
+                self._preroll.capacity,
+                self._preroll.nbytes,
+            )
+        # Endpointing: trailing silence is tracked in the callback and
+        # on_endpoint is invoked (on the audio thread; it must not block).
+        self._on_endpoint = on_endpoint
+        self._endpointer: Optional[SilenceEndpointer] = None
+        if endpoint_silence > 0 and on_endpoint is not None:
+            self._endpointer = SilenceEndpointer(
+                sample_rate=sample_rate,
+                threshold_db=endpoint_threshold_db,
+                silence_seconds=endpoint_silence,
+            )
+        # _lock guards the buffer and gate (taken by the audio callback);
+        # _control_lock serialises opening/closing the device.
         self._lock = threading.Lock()
+        self._control_lock = threading.Lock()
+        self._growing = False  # a background growth is under way (under _lock)
 
-    def start(self) -> None:
-        if self._stream is not None:
-            return
+    @property
+    def persistent(self) -> bool:
+        return self._persistent
+
+    @property
+    def is_open(self) -> bool:
+        return self._stream is not None
+
+    def open(self) -> float:
+        """Open and start the input stream; returns how long that took in seconds.
+
+        Outside a recording the idle timeout starts now, so a stream opened
+        ahead of time closes even if nobody ever dictates.
+        """
+        with self._control_lock:
+            elapsed = self._open_locked()
+            if not self._recording:
+                self._cancel_idle_timer()
+                self._arm_idle_timer()
+            return elapsed
 
-        def _callback(indata: np.ndarray, _frames: int, _time, status) -> None:  # type: ignore[name-defined]
-            if status and self._status_callback:
-                self._status_callback(str(status))
+    def close(self) -> None:
+        with self._control_lock:
+            self._cancel_idle_timer()
+            self._close_locked()
+
+    def start(self) -> None:
+        with self._control_lock:
+            if self._recording:
+                return
+            self._cancel_idle_timer()
+            if self._stream is None:
+                if self._persistent:
+                    self._logger.debug("Audio input was closed; reopening")
+                self._open_locked()
             with self._lock:
-                self._frames.append(indata.copy())
+                self._buffer.reset()
+                self._growing = False
+                if self._endpointer is not None:
+                    self._endpointer.reset()
+                if self._preroll is not None:
+                    self._preroll.drain_into(self._buffer)
+                self._recording = True
+            self._stopped.clear()
+
+    def stop(self) -> np.ndarray:
+        with self._control_lock:
+            if not self._recording:
+                return np.empty(0, dtype=self.dtype)
+            self._stopped.set()
+            if self._persistent:
+                with self._lock:
+                    self._recording = False
+                    audio = self._buffer.view()
+                self._arm_idle_timer()
+            else:
+                self._close_locked()
+                with self._lock:
+                    self._recording = False
+                    # Contiguous slice of the preallocated buffer; no copy.
+                    audio = self._buffer.view()
+        if self.channels == 1:
+            audio = audio.reshape(-1)
+        return audio.astype(np.float32, copy=False)
+
+    def iter_segments(
+        self,
+        *,
+        min_seconds: float,
+        max_seconds: float,
+        silence_db: float = SILENCE_DB,
+        poll_interval: float = 0.1,
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yield ``(start_sample, segment)`` for finished parts of the current recording.
+
+        Segments close at a pause (see ``find_segment_end``) while recording
+        is still running; the iterator ends once ``stop()`` is called. Whatever
+        follows the last yielded segment is the tail of the waveform returned
+        by ``stop()``. Segments are views into the recording buffer.
+        """
+        offset = 0
+        while not self._stopped.wait(poll_interval):
+            while True:
+                with self._lock:
+                    if not self._recording:
+                        return
+                    pending = self._buffer.peek(offset)
+                end = find_segment_end(
+                    pending[:, 0] if self.channels == 1 else pending.mean(axis=1),
+                    self.sample_rate,
+                    min_seconds=min_seconds,
+                    max_seconds=max_seconds,
+                    silence_db=silence_db,
+                )
+                if end is None:
+                    break
+                segment = pending[:end]
+                if self.channels == 1:
+                    segment = segment.reshape(-1)
+                yield offset, segment
+                offset += end
+
+    def _callback(self, indata: np.ndarray, _frames: int, _time, status) -> None:  # type: ignore[no-untyped-def]
+        if status and self._status_callback:
+            self._status_callback(str(status))
+        endpoint = False
+        growth = None
+        with self._lock:
+            if self._recording:
+                self._buffer.write(indata)
+                if self._endpointer is not None:
+                    endpoint = self._endpointer.update(indata)
+                if not self._growing and self._buffer.needs_room(GROW_AHEAD_FRACTION):
+                    self._growing = True
+                    growth = self._buffer.begin_growth()
+            elif self._preroll is not None:
+                self._preroll.write(indata)
+        if growth is not None:
+            self._scheduler.call_later(0, self._start_growth, growth, name="audio-buffer-grow")
+        if endpoint and self._on_endpoint is not None:
+            self._on_endpoint()
+
+    def _start_growth(self, growth: PendingGrowth) -> None:
+        # The copy can take a while for long recordings; keep it off the
+        # shared scheduler thread as well as the audio callback.
+        threading.Thread(
+            target=self._grow_buffer, args=(growth,), name="AudioBufferGrow", daemon=True
+        ).start()
 
-        self._frames.clear()
-        self._stream = sd.InputStream(
+    def _grow_buffer(self, growth: PendingGrowth) -> None:
+        started = time.perf_counter()
+        growth.fill()
+        with self._lock:
+            grown = self._buffer.finish_growth(growth)
+            self._growing = False
+        if grown:
+            self._logger.debug(
+                "Recording buffer grown to %.0fs in %.0f ms",
+                self._buffer.capacity / self.sample_rate,
+                (time.perf_counter() - started) * 1000,
+            )
+
+    def _open_locked(self) -> float:
+        if self._stream is not None:
+            return 0.0
+        started = time.perf_counter()
+        stream = sd.InputStream(
             samplerate=self.sample_rate,
             channels=self.channels,
             dtype=self.dtype,
-            callback=_callback,
+            callback=self._callback,
         )
-        self._stream.start()
+        stream.start()
+        self._stream = stream
+        self.open_duration = time.perf_counter() - started
+        return self.open_duration
 
-    def stop(self) -> np.ndarray:
+    def _close_locked(self) -> None:
         if self._stream is None:
-            return np.empty(0, dtype=self.dtype)
+            return
         self._stream.stop()
         self._stream.close()
         self._stream = None
-        with self._lock:
-            if not self._frames:
-                return np.empty(0, dtype=self.dtype)
-            audio = np.concatenate(self._frames, axis=0)
-            self._frames.clear()
-        if self.channels == 1:
-            audio = audio.reshape(-1)
-        return audio.astype(np.float32, copy=False)
+        if self._preroll is not None:
+            with self._lock:
+                self._preroll.clear()  # stale once the device has been closed
+
+    def _arm_idle_timer(self) -> None:
+        if self._idle_timeout <= 0:
+            return
+        self._idle_timer = self._scheduler.call_later(
+            self._idle_timeout, self._close_idle, name="audio-idle-close"
+        )
+
+    def _cancel_idle_timer(self) -> None:
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
 
+    def _close_idle(self) -> None:
+        with self._control_lock:
+            # A pending handle is a newer timer armed after this one fired.
+            if self._idle_timer is None or self._idle_timer.pending:
+                return  # cancelled by a new recording, or superseded
+            self._idle_timer = None
+            if self._recording or self._stream is None:
+                return
+            self._logger.info(
+                "Closing idle audio input after %.0fs without use", self._idle_timeout
+            )
+            self._close_locked()
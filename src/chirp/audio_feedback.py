@@ -75,6 +75,27 @@ class AudioFeedback:
     def play_stop(self, override_path: Optional[str] = None) -> None:
         self._play_sound("ping-down.wav", override_path)
 
+    def preload(
+        self,
+        start_path: Optional[str] = None,
+        stop_path: Optional[str] = None,
+    ) -> None:
+        """Load the start/stop sounds into the cache ahead of the first recording."""
+        if not self._enabled:
+            return
+        for asset_name, override_path in (
+            ("ping-up.wav", start_path),
+            ("ping-down.wav", stop_path),
+        ):
+            cache_key = override_path or asset_name
+            if cache_key in self._cache:
+                continue
+            try:
+                with self._get_sound_path(asset_name, override_path) as path:
+                    self._load_and_cache(path, cache_key)
+            except Exception as exc:  # playback reports problems again later
+                self._logger.debug("Could not preload %s: %s", cache_key, exc)
+
     def play_error(self, override_path: Optional[str] = None) -> None:
         """Play error sound. Uses custom path, or falls back to system beep."""
         if not self._enabled:
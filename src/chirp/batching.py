@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Limits for one batched inference: the encoder runs on the padded
+# (batch, longest) input, so memory grows with both.
+MAX_BATCH_SIZE = 8
+MAX_BATCH_SECONDS = 120.0
+# How long the micro-batcher holds the first request for others to join.
+BATCH_WINDOW_SECONDS = 0.02
+
+
+def plan_batches(
+    lengths: Sequence[int], *, max_batch_size: int, max_batch_samples: int
+) -> List[List[int]]:
+    """Group indices of ``lengths`` into batches of similar length.
+
+    Indices are sorted by length so each batch pads little. A batch holds at
+    most ``max_batch_size`` entries and at most ``max_batch_samples`` padded
+    samples (entries x longest); a single longer entry still gets a batch.
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    for index in sorted(range(len(lengths)), key=lengths.__getitem__):
+        # Sorted ascending, so the new entry is the batch's longest.
+        padded = (len(current) + 1) * lengths[index]
+        if current and (len(current) >= max_batch_size or padded > max_batch_samples):
+            batches.append(current)
+            current = []
+        current.append(index)
+    if current:
+        batches.append(current)
+    return batches
+
+
+@dataclass(slots=True)
+class BatcherStats:
+    requests: int = 0
+    batches: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.requests / self.batches if self.batches else 0.0
+
+
+class MicroBatcher:
+    """Runs transcription requests that arrive close together as one batch.
+
+    The first request waits up to ``window`` seconds (or until
+    ``max_batch_size`` requests are queued) for others to join, then the
+    whole group goes to ``handler`` (typically a bound
+    ``ParakeetManager.transcribe_batch``) on the batcher's thread. Each
+    ``submit()`` returns a future for its own transcript; if the batch
+    fails, every future in it gets the exception.
+
+    Not used by the app's dictation pipeline, which decodes each recording
+    as its own job; it is for callers with many short utterances, such as
+    ``benchmarks/bench_batch_throughput.py``.
+    """
+
+    def __init__(
+        self,
+        *,
+        handler: Callable[[Sequence[np.ndarray]], List[str]],
+        window: float = BATCH_WINDOW_SECONDS,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self._handler = handler
+        self._window = window
+        self._max_batch_size = max(1, max_batch_size)
+        self._logger = logger or logging.getLogger("chirp")
+        self._queue: "queue.SimpleQueue[Optional[Tuple[np.ndarray, concurrent.futures.Future]]]" = (
+            queue.SimpleQueue()
+        )
+        self._stats = BatcherStats()
+        self._stats_lock = threading.Lock()
+        # Guards _closed, so no request is queued after the stop sentinel.
+        self._submit_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="MicroBatcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, waveform: np.ndarray) -> "concurrent.futures.Future[str]":
+        future: "concurrent.futures.Future[str]" = concurrent.futures.Future()
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed")
+            self._queue.put((waveform, future))
+        return future
+
+    def transcribe(self, waveform: np.ndarray) -> str:
+        return self.submit(waveform).result()
+
+    def stats(self) -> BatcherStats:
+        with self._stats_lock:
+            return BatcherStats(self._stats.requests, self._stats.batches)
+
+    def close(self) -> None:
+        """Finish the requests already submitted, then stop the thread."""
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            stop = False
+            deadline = time.monotonic() + self._window
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        item = self._queue.get(timeout=remaining)
+                    else:
+                        item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._process(batch)
+            if stop:
+                return
+
+    def _process(self, batch: List[Tuple[np.ndarray, concurrent.futures.Future]]) -> None:
+        with self._stats_lock:
+            self._stats.requests += len(batch)
+            self._stats.batches += 1
+        self._logger.debug("Micro-batch of %d requests", len(batch))
+        try:
+            texts = self._handler([waveform for waveform, _ in batch])
+        except Exception as exc:  # surfaced to every caller in the batch
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        for (_, future), text in zip(batch, texts):
+            future.set_result(text)
+        if len(texts) != len(batch):
+            error = RuntimeError(
+                f"batch handler returned {len(texts)} transcripts for {len(batch)} requests"
+            )
+            self._logger.error("%s", error)
+            for _, future in batch[len(texts) :]:
+                future.set_exception(error)
@@ -4,15 +4,109 @@ import re
 import tomllib
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
+from .tuning_profile import TuningProfile, cpu_key
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 ASSETS_ROOT = PROJECT_ROOT / "src" / "chirp" / "assets"
 MODELS_ROOT = ASSETS_ROOT / "models"
 CONFIG_PATH = PROJECT_ROOT / "config.toml"
+TUNING_ROOT = PROJECT_ROOT / "tuning"  # profiles written by `chirp-setup --tune`
 
 MAX_ALLOWED_DURATION = 7200.0  # 2 hours
+MAX_PREROLL_MS = 2000.0
+MIN_CHUNK_SECONDS = 10.0
+
+GRAPH_OPTIMIZATION_LEVELS = ("disable", "basic", "extended", "all")
+EXECUTION_MODES = ("sequential", "parallel")
+# ORT affinity syntax: one group per extra intra-op thread, ";"-separated, each
+# a ","-separated list of 1-based logical processors or "a-b" ranges.
+_AFFINITY_GROUP = r"\d+(?:-\d+)?(?:,\d+(?:-\d+)?)*"
+_AFFINITY_PATTERN = re.compile(rf"{_AFFINITY_GROUP}(?:;{_AFFINITY_GROUP})*")
+
+
+@dataclass(kw_only=True, slots=True)
+class OnnxSettings:
+    """The ``[onnx]`` table: ONNX Runtime session options."""
+
+    graph_optimization: str = "all"
+    execution_mode: str = "sequential"
+    inter_op_threads: int = 1
+    enable_mem_pattern: bool = True
+    enable_cpu_mem_arena: bool = True
+    allow_spinning: bool = True
+    flush_denormals: bool = False
+    intra_op_thread_affinities: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OnnxSettings":
+        merged: Dict[str, Any] = dict(data)
+        for key in ("graph_optimization", "execution_mode"):
+            if key in merged:
+                merged[key] = str(merged[key]).lower()
+        if "intra_op_thread_affinities" in merged:
+            merged["intra_op_thread_affinities"] = str(
+                merged["intra_op_thread_affinities"] or ""
+            ).replace(" ", "")
+        return cls(**merged)
+
+    def validate(self, threads: Optional[int]) -> None:
+        if self.graph_optimization not in GRAPH_OPTIMIZATION_LEVELS:
+            raise ValueError(
+                f"onnx.graph_optimization must be one of {', '.join(GRAPH_OPTIMIZATION_LEVELS)}, "
+                f"got {self.graph_optimization!r}"
+            )
+
+        if self.execution_mode not in EXECUTION_MODES:
+            raise ValueError(
+                f"onnx.execution_mode must be one of {', '.join(EXECUTION_MODES)}, "
+                f"got {self.execution_mode!r}"
+            )
+
+        if self.inter_op_threads < 0:
+            raise ValueError(
+                f"onnx.inter_op_threads must be non-negative, got {self.inter_op_threads}"
+            )
+
+        affinities = self.intra_op_thread_affinities
+        if affinities:
+            if not _AFFINITY_PATTERN.fullmatch(affinities):
+                raise ValueError(
+                    "onnx.intra_op_thread_affinities must look like \"1,2;3-4\", "
+                    f"got {affinities!r}"
+                )
+            groups = affinities.count(";") + 1
+            # The calling thread is intra-op thread 0 and is not pinned.
+            if not threads or groups != threads - 1:
+                raise ValueError(
+                    "onnx.intra_op_thread_affinities needs threads set and one group per "
+                    f"thread after the first ({(threads or 1) - 1}), got {groups}"
+                )
+
+
+@dataclass(kw_only=True, slots=True)
+class ModelSpec:
+    """One ``[models.<name>]`` table: an extra model selectable per recording."""
+
+    model: Optional[str] = None  # defaults to parakeet_model
+    quantization: Optional[str] = None
+    language: Optional[str] = None  # defaults to language
+    shortcut: str = ""  # hotkey that records with this model
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ModelSpec":
+        merged: Dict[str, Any] = dict(data)
+        quant = merged.get("quantization")
+        merged["quantization"] = str(quant).lower() if quant else None
+        if merged.get("shortcut"):
+            merged["shortcut"] = str(merged["shortcut"]).lower()
+        if not merged.get("language"):
+            merged["language"] = None
+        return cls(**merged)
+
+
+DEFAULT_MODEL = "default"  # registry name of parakeet_model/parakeet_quantization
 
 
 @dataclass(kw_only=True, slots=True)
@@ -30,12 +124,39 @@ class ChirpConfig:
     clipboard_behavior: bool = True
     clipboard_clear_delay: float = 0.75
     model_timeout: float = 0
+    model_warmup_seconds: float = 1.0
+    optimized_model_cache: bool = True
+    mmap_weights: bool = False
+    inference_process: bool = False
+    use_tuning_profile: bool = True
     audio_feedback: bool = True
     audio_feedback_volume: float = 1.0
     start_sound_path: Optional[str] = None
     stop_sound_path: Optional[str] = None
     error_sound_path: Optional[str] = None
     max_recording_duration: float = 45.0
+    persistent_stream: bool = False
+    stream_idle_timeout: float = 600.0
+    preroll_ms: float = 0.0
+    vad_trim: bool = False
+    vad_threshold_db: float = -45.0
+    vad_padding_ms: float = 200.0
+    endpoint_silence: float = 0.0
+    transcription_deadline: float = 0.0
+    latest_wins: bool = False
+    cancel_shortcut: str = ""
+    pipeline_queue_size: int = 4
+    inference_workers: int = 1
+    async_core: bool = False
+    long_form_chunk_seconds: float = 60.0
+    long_form_overlap_seconds: float = 1.5
+    session_pool_size: int = 1
+    incremental_transcription: bool = False
+    incremental_min_seconds: float = 4.0
+    incremental_max_seconds: float = 20.0
+    onnx: OnnxSettings = field(default_factory=OnnxSettings)
+    models: Dict[str, ModelSpec] = field(default_factory=dict)
+    model_memory_budget_mb: float = 0.0
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ChirpConfig":
@@ -47,6 +168,8 @@ class ChirpConfig:
 
         if "primary_shortcut" in merged:
             merged["primary_shortcut"] = str(merged["primary_shortcut"]).lower()
+        if merged.get("cancel_shortcut"):
+            merged["cancel_shortcut"] = str(merged["cancel_shortcut"]).lower()
         if "paste_mode" in merged:
             merged["paste_mode"] = str(merged["paste_mode"]).lower()
         if "onnx_providers" in merged:
@@ -60,6 +183,16 @@ class ChirpConfig:
         if lang is not None:
             merged["language"] = str(lang)
 
+        onnx = merged.get("onnx")
+        if isinstance(onnx, dict):
+            merged["onnx"] = OnnxSettings.from_dict(onnx)
+
+        models = merged.get("models") or {}
+        merged["models"] = {
+            str(name): spec if isinstance(spec, ModelSpec) else ModelSpec.from_dict(spec)
+            for name, spec in models.items()
+        }
+
         return cls(**merged)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -67,6 +200,23 @@ class ChirpConfig:
         payload["word_overrides"] = dict(self.word_overrides)
         return payload
 
+    def model_spec(self, name: str) -> ModelSpec:
+        """Spec for a registry model name, with defaults filled in from the top level."""
+        if name == DEFAULT_MODEL:
+            return ModelSpec(
+                model=self.parakeet_model,
+                quantization=self.parakeet_quantization,
+                language=self.language,
+                shortcut=self.primary_shortcut,
+            )
+        spec = self.models[name]
+        return ModelSpec(
+            model=spec.model or self.parakeet_model,
+            quantization=spec.quantization,
+            language=spec.language or self.language,
+            shortcut=spec.shortcut,
+        )
+
     def validate(self) -> None:
         if self.threads is not None and self.threads < 0:
             raise ValueError(f"threads must be non-negative, got {self.threads}")
@@ -81,11 +231,24 @@ class ChirpConfig:
                 f"paste_mode must be 'ctrl' or 'ctrl+shift', got {self.paste_mode!r}"
             )
 
+        self.onnx.validate(self.threads)
+
         if self.model_timeout < 0:
             raise ValueError(
                 f"model_timeout must be non-negative, got {self.model_timeout}"
             )
 
+        if self.model_warmup_seconds < 0:
+            raise ValueError(
+                f"model_warmup_seconds must be non-negative, got {self.model_warmup_seconds}"
+            )
+
+        if self.mmap_weights and not self.optimized_model_cache:
+            raise ValueError(
+                "mmap_weights requires optimized_model_cache = true "
+                "(weights are mapped from the cached external-data files)"
+            )
+
         if self.max_recording_duration < 0:
             raise ValueError(
                 f"max_recording_duration must be non-negative, got {self.max_recording_duration}"
@@ -96,6 +259,98 @@ class ChirpConfig:
                 f"max_recording_duration must be <= {MAX_ALLOWED_DURATION}, got {self.max_recording_duration}"
             )
 
+        if self.stream_idle_timeout < 0:
+            raise ValueError(
+                f"stream_idle_timeout must be non-negative, got {self.stream_idle_timeout}"
+            )
+
+        if not (0 <= self.preroll_ms <= MAX_PREROLL_MS):
+            raise ValueError(
+                f"preroll_ms must be between 0 and {MAX_PREROLL_MS:.0f}, got {self.preroll_ms}"
+            )
+
+        if self.vad_threshold_db >= 0:
+            raise ValueError(
+                f"vad_threshold_db must be negative (dBFS), got {self.vad_threshold_db}"
+            )
+
+        if self.vad_padding_ms < 0:
+            raise ValueError(
+                f"vad_padding_ms must be non-negative, got {self.vad_padding_ms}"
+            )
+
+        if self.endpoint_silence < 0:
+            raise ValueError(
+                f"endpoint_silence must be non-negative, got {self.endpoint_silence}"
+            )
+
+        if self.pipeline_queue_size < 1:
+            raise ValueError(
+                f"pipeline_queue_size must be at least 1, got {self.pipeline_queue_size}"
+            )
+
+        if self.inference_workers < 1:
+            raise ValueError(
+                f"inference_workers must be at least 1, got {self.inference_workers}"
+            )
+
+        if self.transcription_deadline < 0:
+            raise ValueError(
+                f"transcription_deadline must be non-negative, got {self.transcription_deadline}"
+            )
+
+        if self.long_form_chunk_seconds < 0 or (
+            0 < self.long_form_chunk_seconds < MIN_CHUNK_SECONDS
+        ):
+            raise ValueError(
+                f"long_form_chunk_seconds must be 0 or >= {MIN_CHUNK_SECONDS:.0f}, got {self.long_form_chunk_seconds}"
+            )
+
+        if self.long_form_overlap_seconds < 0 or (
+            self.long_form_chunk_seconds > 0
+            and self.long_form_overlap_seconds >= self.long_form_chunk_seconds / 2
+        ):
+            raise ValueError(
+                "long_form_overlap_seconds must be non-negative and less than half of "
+                f"long_form_chunk_seconds, got {self.long_form_overlap_seconds}"
+            )
+
+        if self.session_pool_size < 0:
+            raise ValueError(
+                f"session_pool_size must be non-negative, got {self.session_pool_size}"
+            )
+
+        if self.incremental_min_seconds <= 0:
+            raise ValueError(
+                f"incremental_min_seconds must be positive, got {self.incremental_min_seconds}"
+            )
+
+        if self.incremental_max_seconds <= self.incremental_min_seconds:
+            raise ValueError(
+                "incremental_max_seconds must be greater than incremental_min_seconds, "
+                f"got {self.incremental_max_seconds}"
+            )
+
+        if self.model_memory_budget_mb < 0:
+            raise ValueError(
+                f"model_memory_budget_mb must be non-negative, got {self.model_memory_budget_mb}"
+            )
+
+        if self.cancel_shortcut and self.cancel_shortcut == self.primary_shortcut:
+            raise ValueError("cancel_shortcut must differ from primary_shortcut")
+        shortcuts = {self.primary_shortcut, self.cancel_shortcut}
+        for name, spec in self.models.items():
+            if not name or name == DEFAULT_MODEL:
+                raise ValueError(f"models.{name!r}: name must be non-empty and not {DEFAULT_MODEL!r}")
+            if spec.quantization not in (None, "int8"):
+                raise ValueError(
+                    f"models.{name}.quantization must be 'int8' or empty, got {spec.quantization!r}"
+                )
+            if spec.shortcut:
+                if spec.shortcut in shortcuts:
+                    raise ValueError(f"models.{name}.shortcut {spec.shortcut!r} is already in use")
+                shortcuts.add(spec.shortcut)
+
         if self.start_sound_path:
             path = Path(self.start_sound_path)
             if not path.is_file():
@@ -122,6 +377,10 @@ class ConfigManager:
         self._config_path = CONFIG_PATH
         self._models_root = MODELS_ROOT
         self._models_root.mkdir(parents=True, exist_ok=True)
+        self._tuning_root = TUNING_ROOT
+        self._tuning_profile: Optional[TuningProfile] = None
+        self._tuning_overrides: Dict[str, Tuple[Any, Any]] = {}
+        self._tuning_enabled = True
 
     @property
     def config_path(self) -> Path:
@@ -131,6 +390,25 @@ class ConfigManager:
     def models_root(self) -> Path:
         return self._models_root
 
+    @property
+    def tuning_profile_path(self) -> Path:
+        """Profile for this machine's CPU; other CPUs' profiles are never read."""
+        return self._tuning_root / f"{cpu_key()}.json"
+
+    @property
+    def tuning_profile(self) -> Optional[TuningProfile]:
+        """The profile applied by the last ``load()``, if any."""
+        return self._tuning_profile
+
+    @property
+    def tuning_overrides(self) -> Dict[str, Tuple[Any, Any]]:
+        """config.toml values the profile replaced: key -> (file, tuned)."""
+        return dict(self._tuning_overrides)
+
+    def disable_tuning_profile(self) -> None:
+        """Ignore the tuning profile on later ``load()`` calls."""
+        self._tuning_enabled = False
+
     def ensure_exists(self) -> None:
         if not self._config_path.exists():
             raise FileNotFoundError(f"Config file not found at {self._config_path}")
@@ -139,6 +417,14 @@ class ConfigManager:
         self.ensure_exists()
         with self._config_path.open("rb") as handle:
             data = tomllib.load(handle)
+        self._tuning_profile = None
+        self._tuning_overrides = {}
+        if self._tuning_enabled and data.get("use_tuning_profile", True):
+            profile = TuningProfile.load(self.tuning_profile_path)
+            if profile is not None:
+                self._tuning_overrides = profile.overrides(data)
+                data = profile.apply(data)
+                self._tuning_profile = profile
         config = ChirpConfig.from_dict(data)
         config.validate()
         return config
@@ -162,3 +448,7 @@ class ConfigManager:
                 f"Invalid model name: {model_name!r} escapes models directory"
             )
         return result
+
+    def model_cache_dir(self, model_dir: Path) -> Path:
+        """Where ONNX Runtime's optimized graphs for ``model_dir`` are kept."""
+        return model_dir.with_name(f"{model_dir.name}.ort-cache")
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Deque, Optional
+
+# Hook timings waiting to be folded into the stats; older ones are dropped
+# if the controller falls this far behind.
+HOOK_SAMPLES = 1024
+
+
+@dataclass(slots=True)
+class ControllerStats:
+    commands: int = 0
+    failed: int = 0
+    hook_calls: int = 0
+    hook_seconds: float = 0.0  # cumulative time spent in the hook callback
+    max_hook_seconds: float = 0.0
+    queue_seconds: float = 0.0  # cumulative time commands waited for the controller
+    max_queue_seconds: float = 0.0
+
+    @property
+    def mean_hook(self) -> float:
+        return self.hook_seconds / self.hook_calls if self.hook_calls else 0.0
+
+    @property
+    def mean_queue(self) -> float:
+        return self.queue_seconds / self.commands if self.commands else 0.0
+
+
+class Controller:
+    """Runs app commands one at a time on a dedicated thread.
+
+    The global keyboard hook, timers and the audio callback only ``post()``
+    a command, which appends to a ``queue.SimpleQueue`` without taking a
+    lock that the controller could be holding. Recording, chimes and
+    everything else a command does happen on the controller thread, so a
+    slow command never delays keyboard input system-wide.
+    """
+
+    def __init__(self, *, logger: Optional[logging.Logger] = None) -> None:
+        self._logger = logger or logging.getLogger("chirp")
+        # Written by the hook thread, drained by the controller (deque appends
+        # are atomic).
+        self._hook_times: Deque[float] = collections.deque(maxlen=HOOK_SAMPLES)
+        self._stats = ControllerStats()
+        self._stats_lock = threading.Lock()
+        self._start()
+
+    def post(self, name: str, fn: Callable[..., Any], *args: Any) -> None:
+        """Queue ``fn(*args)`` for the controller thread; never blocks."""
+        self._enqueue(name, fn, args, time.perf_counter())
+
+    def hotkey(self, name: str, fn: Callable[..., Any], *args: Any) -> Callable[[], None]:
+        """A hook callback that posts ``fn(*args)`` and times itself."""
+
+        def _on_hotkey() -> None:
+            started = time.perf_counter()
+            self._enqueue(name, fn, args, started)
+            self._hook_times.append(time.perf_counter() - started)
+
+        return _on_hotkey
+
+    def inline_hotkey(self, fn: Callable[..., Any], *args: Any) -> Callable[[], None]:
+        """A hook callback that runs ``fn(*args)`` in the hook and times itself.
+
+        For work that must not wait behind a busy controller; ``fn`` must
+        only take locks that are never held for long, and post anything
+        slower (logging included).
+        """
+
+        def _on_hotkey() -> None:
+            started = time.perf_counter()
+            try:
+                fn(*args)
+            finally:
+                self._hook_times.append(time.perf_counter() - started)
+
+        return _on_hotkey
+
+    def run_blocking(
+        self, name: str, fn: Callable[..., Any], *args: Any
+    ) -> concurrent.futures.Future:
+        """Run blocking work for the current command and return its future.
+
+        The controller thread may block, so this calls ``fn(*args)`` at once;
+        ``AsyncCore`` hands it to a worker thread instead of its loop.
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        future.set_result(fn(*args))
+        return future
+
+    def stats(self) -> ControllerStats:
+        with self._stats_lock:
+            self._fold_hook_times_locked()
+            return replace(self._stats)
+
+    def close(self) -> None:
+        """Run the commands already queued, then stop the thread."""
+        self._commands.put(None)
+        self._thread.join()
+
+    def _start(self) -> None:
+        self._commands: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="Controller", daemon=True)
+        self._thread.start()
+
+    def _enqueue(
+        self, name: str, fn: Callable[..., Any], args: tuple, posted_at: float
+    ) -> None:
+        self._commands.put((name, fn, args, posted_at))
+
+    def _run(self) -> None:
+        while True:
+            command = self._commands.get()
+            if command is None:
+                return
+            self._execute(*command)
+
+    def _execute(
+        self, name: str, fn: Callable[..., Any], args: tuple, posted_at: float
+    ) -> None:
+        waited = time.perf_counter() - posted_at
+        failed = False
+        try:
+            fn(*args)
+        except Exception as exc:  # keep serving later commands
+            failed = True
+            self._logger.exception("Command %s failed: %s", name, exc)
+        with self._stats_lock:
+            self._fold_hook_times_locked()
+            stats = self._stats
+            stats.commands += 1
+            stats.failed += failed
+            stats.queue_seconds += waited
+            stats.max_queue_seconds = max(stats.max_queue_seconds, waited)
+            self._logger.debug(
+                "Command %s waited %.1f ms; hook callback %.0f us mean, %.0f us max",
+                name,
+                waited * 1000,
+                stats.mean_hook * 1e6,
+                stats.max_hook_seconds * 1e6,
+            )
+
+    def _fold_hook_times_locked(self) -> None:
+        stats = self._stats
+        while self._hook_times:
+            elapsed = self._hook_times.popleft()
+            stats.hook_calls += 1
+            stats.hook_seconds += elapsed
+            stats.max_hook_seconds = max(stats.max_hook_seconds, elapsed)
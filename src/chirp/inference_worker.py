@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import sys
+import threading
+import time
+from dataclasses import dataclass, replace
+from multiprocessing import shared_memory
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from .jobs import TranscriptionJob
+from .logger import get_logger
+from .parakeet_manager import ModelNotPreparedError, ParakeetManager
+from .scheduler import Scheduler, get_scheduler
+
+# The shared audio buffer grows in steps of this many samples (~16 s at 16 kHz)
+# so recordings of similar length reuse it.
+BUFFER_STEP_SAMPLES = 1 << 18
+# Seconds a worker gets to exit after being asked before it is killed.
+STOP_TIMEOUT = 5.0
+
+
+class WorkerCrashedError(RuntimeError):
+    pass
+
+
+@dataclass(slots=True)
+class WorkerMetrics:
+    """Lifecycle and IPC counters for the inference worker process."""
+
+    starts: int = 0
+    crashes: int = 0  # worker exits that were not requested
+    requests: int = 0
+    start_seconds: float = 0.0  # cumulative spawn + model load
+    last_start_seconds: float = 0.0
+    # Round trip minus time spent in the model: copy, pipe and wake-ups.
+    ipc_seconds: float = 0.0
+    last_ipc_seconds: float = 0.0
+
+    @property
+    def restarts(self) -> int:
+        return max(0, self.starts - 1)
+
+
+def _worker_main(conn, factory, manager_kwargs, log_level: int) -> None:
+    """Child process: load the model, then serve requests until told to stop."""
+    logger = get_logger(level=log_level)
+    try:
+        manager = factory(logger=logger, timeout=0, **manager_kwargs)
+    except ModelNotPreparedError as exc:
+        conn.send(("not_prepared", str(exc)))
+        return
+    except Exception as exc:
+        conn.send(("error", f"{type(exc).__name__}: {exc}"))
+        return
+    conn.send(("ready", manager.weights_bytes()))
+    buffer: Optional[shared_memory.SharedMemory] = None
+    try:
+        while True:
+            try:
+                message = conn.recv()
+            except EOFError:  # parent exited
+                return
+            if message[0] == "stop":
+                return
+            _, name, samples, sample_rate, language = message
+            if buffer is None or buffer.name != name:
+                if buffer is not None:
+                    buffer.close()
+                buffer = _attach(name)
+            audio = np.ndarray((samples,), dtype=np.float32, buffer=buffer.buf)
+            started = time.perf_counter()
+            try:
+                text = manager.transcribe(audio, sample_rate=sample_rate, language=language)
+            except Exception as exc:
+                conn.send(("error", f"{type(exc).__name__}: {exc}"))
+            else:
+                conn.send(("ok", text, time.perf_counter() - started))
+            finally:
+                del audio
+    finally:
+        if buffer is not None:
+            buffer.close()
+        manager.close()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Open the parent's buffer without claiming it in this process.
+
+    The parent owns and unlinks it. Spawned children report to the
+    parent's resource tracker, so unregistering here would drop the
+    parent's own registration; instead the child does not register at all
+    where Python allows it (3.13+). Older versions add a duplicate entry
+    to the shared tracker, which the parent's unlink clears.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+class InferenceWorker:
+    """A ``ParakeetManager`` hosted in a child process.
+
+    Inference then runs outside this interpreter, so it does not compete for
+    the GIL with the keyboard hook and the audio callback. Audio is copied
+    once into a shared memory buffer rather than pickled; only text comes
+    back over the pipe. Unloading stops the process, which hands all of the
+    model's memory back to the OS. A worker that dies is restarted and the
+    request retried once.
+
+    Offers the parts of the ``ParakeetManager`` interface the app and
+    ``ModelRegistry`` use. ``manager_kwargs`` are passed to
+    ``ParakeetManager`` in the child; like it, construction loads the model
+    and raises ``ModelNotPreparedError`` when it is missing.
+    """
+
+    def __init__(
+        self,
+        *,
+        logger: logging.Logger,
+        timeout: float = 300.0,
+        manager_factory: Callable[..., ParakeetManager] = ParakeetManager,
+        scheduler: Optional[Scheduler] = None,
+        **manager_kwargs: Any,
+    ) -> None:
+        self._logger = logger
+        self._timeout = timeout  # 0 or negative means never stop the worker
+        self._factory = manager_factory
+        self._manager_kwargs = manager_kwargs
+        self._context = multiprocessing.get_context("spawn")
+        self._process = None
+        self._conn = None
+        self._buffer: Optional[shared_memory.SharedMemory] = None
+        self._weights_bytes = 0
+        self._metrics = WorkerMetrics()
+        self._preload_thread: Optional[threading.Thread] = None
+        self._last_access = time.time()
+        # Held for a whole request, so the worker is never stopped mid-request.
+        self._lock = threading.Lock()
+        # Idle stop: a timer on the shared scheduler, re-armed after each
+        # start and request.
+        self._scheduler = scheduler or get_scheduler()
+        self._closed = False
+        with self._lock:
+            self._start_locked()
+
+    @property
+    def metrics(self) -> WorkerMetrics:
+        with self._lock:
+            return replace(self._metrics)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def weights_bytes(self) -> int:
+        """Model size reported by the worker at its last start."""
+        return self._weights_bytes
+
+    def ensure_loaded(self) -> None:
+        with self._lock:
+            self._ensure_started_locked()
+
+    def preload(self) -> bool:
+        """Start the worker in the background if it is stopped; True if started.
+
+        Never waits: a held lock means a request or a start is under way,
+        so the worker is running or about to be.
+        """
+        self._last_access = time.time()
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            if self.is_loaded:
+                return False
+            if self._preload_thread is not None and self._preload_thread.is_alive():
+                return False
+            self._preload_thread = threading.Thread(
+                target=self._background_start, name="WorkerPreload", daemon=True
+            )
+            self._preload_thread.start()
+            return True
+        finally:
+            self._lock.release()
+
+    def unload(self) -> bool:
+        """Stop the worker now unless a request is in flight."""
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            if not self.is_loaded:
+                return False
+            self._stop_locked()
+            return True
+        finally:
+            self._lock.release()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._scheduler.cancel((self, "idle"))
+            self._stop_locked()
+            self._release_buffer_locked()
+
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        *,
+        sample_rate: int = 16_000,
+        language: Optional[str] = None,
+        job: Optional[TranscriptionJob] = None,
+    ) -> str:
+        """Transcribe one recording in the worker.
+
+        ``job`` is checked once the worker is running; a request already
+        sent to the worker runs to completion.
+        """
+        waveform = np.asarray(audio, dtype=np.float32).reshape(-1)
+        if waveform.size == 0:
+            return ""
+        with self._lock:
+            try:
+                self._ensure_started_locked()
+                if job is not None:
+                    job.check()
+                try:
+                    return self._request_locked(waveform, sample_rate, language)
+                except WorkerCrashedError:
+                    self._discard_crashed_locked()
+                # Retry once on a fresh worker; a second crash is raised.
+                self._ensure_started_locked()
+                return self._request_locked(waveform, sample_rate, language)
+            finally:
+                self._last_access = time.time()
+                self._arm_idle_timer_locked()
+
+    def _request_locked(
+        self, waveform: np.ndarray, sample_rate: int, language: Optional[str]
+    ) -> str:
+        started = time.perf_counter()
+        buffer = self._buffer_locked(waveform.size)
+        np.ndarray(waveform.shape, dtype=np.float32, buffer=buffer.buf)[:] = waveform
+        try:
+            self._conn.send(("transcribe", buffer.name, waveform.size, sample_rate, language))
+            reply = self._conn.recv()
+        except (EOFError, OSError) as exc:
+            raise WorkerCrashedError("Inference worker exited during a request") from exc
+        if reply[0] == "error":
+            raise RuntimeError(f"Inference worker: {reply[1]}")
+        _, text, inference_seconds = reply
+        ipc = max(0.0, time.perf_counter() - started - inference_seconds)
+        self._metrics.requests += 1
+        self._metrics.ipc_seconds += ipc
+        self._metrics.last_ipc_seconds = ipc
+        self._logger.debug(
+            "Worker transcription: %.2fs inference, %.1f ms IPC overhead",
+            inference_seconds,
+            ipc * 1000,
+        )
+        return text
+
+    def _buffer_locked(self, samples: int) -> shared_memory.SharedMemory:
+        needed = samples * np.dtype(np.float32).itemsize
+        if self._buffer is None or self._buffer.size < needed:
+            self._release_buffer_locked()
+            steps = -(-samples // BUFFER_STEP_SAMPLES)
+            size = steps * BUFFER_STEP_SAMPLES * np.dtype(np.float32).itemsize
+            self._buffer = shared_memory.SharedMemory(create=True, size=size)
+        return self._buffer
+
+    def _release_buffer_locked(self) -> None:
+        buffer, self._buffer = self._buffer, None
+        if buffer is not None:
+            buffer.close()
+            buffer.unlink()
+
+    def _ensure_started_locked(self) -> None:
+        if self._process is not None and not self._process.is_alive():
+            self._discard_crashed_locked()
+        if self._process is None:
+            self._start_locked()
+
+    def _start_locked(self) -> None:
+        started = time.perf_counter()
+        conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(
+                child_conn,
+                self._factory,
+                self._manager_kwargs,
+                self._logger.getEffectiveLevel(),
+            ),
+            name="ChirpInference",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        try:
+            reply = conn.recv()
+        except EOFError:
+            process.join(STOP_TIMEOUT)
+            reply = ("error", f"exited with code {process.exitcode}")
+        if reply[0] != "ready":
+            conn.close()
+            process.join(STOP_TIMEOUT)
+            if reply[0] == "not_prepared":
+                raise ModelNotPreparedError(reply[1])
+            raise WorkerCrashedError(f"Inference worker failed to start: {reply[1]}")
+        self._process, self._conn = process, conn
+        self._weights_bytes = reply[1]
+        elapsed = time.perf_counter() - started
+        self._metrics.starts += 1
+        self._metrics.start_seconds += elapsed
+        self._metrics.last_start_seconds = elapsed
+        self._last_access = time.time()
+        self._logger.info("Inference worker (pid %s) ready in %.2fs", process.pid, elapsed)
+        self._arm_idle_timer_locked()
+
+    def _stop_locked(self) -> None:
+        process, conn = self._process, self._conn
+        self._process = self._conn = None
+        if process is None:
+            return
+        try:
+            conn.send(("stop",))
+        except OSError:
+            pass
+        process.join(STOP_TIMEOUT)
+        if process.is_alive():
+            self._logger.warning("Inference worker did not exit; killing it")
+            process.kill()
+            process.join()
+        conn.close()
+
+    def _discard_crashed_locked(self) -> None:
+        process, conn = self._process, self._conn
+        self._process = self._conn = None
+        if process is None:
+            return
+        process.join(STOP_TIMEOUT)
+        conn.close()
+        self._metrics.crashes += 1
+        self._logger.warning(
+            "Inference worker exited unexpectedly (exit code %s); restarting it",
+            process.exitcode,
+        )
+
+    def _background_start(self) -> None:
+        try:
+            self.ensure_loaded()
+        except Exception as exc:  # transcribe() retries and reports the error
+            self._logger.warning("Background start of the inference worker failed: %s", exc)
+
+    def _arm_idle_timer_locked(self) -> None:
+        if self._timeout <= 0 or self._closed or self._process is None:
+            return
+        self._schedule_idle_check(self._last_access + self._timeout - time.time())
+
+    def _schedule_idle_check(self, delay: float) -> None:
+        self._scheduler.call_later(
+            delay, self._start_idle_stop, name="worker-idle-stop", key=(self, "idle")
+        )
+
+    def _start_idle_stop(self) -> None:
+        # Stopping waits for the process to exit (up to STOP_TIMEOUT), and
+        # the lock for a request in flight; keep both off the shared
+        # scheduler thread.
+        threading.Thread(target=self._stop_if_idle, name="WorkerStop", daemon=True).start()
+
+    def _stop_if_idle(self) -> None:
+        with self._lock:
+            if self._process is None:
+                return
+            # A request finished meanwhile pushes the deadline back.
+            if self._last_access + self._timeout > time.time():
+                self._arm_idle_timer_locked()
+                return
+            self._logger.info("Stopping idle inference worker to free memory.")
+            self._stop_locked()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+_job_ids = itertools.count(1)
+
+
+class JobCancelledError(Exception):
+    pass
+
+
+class DeadlineExceededError(JobCancelledError):
+    pass
+
+
+@dataclass(slots=True)
+class JobStats:
+    submitted: int = 0
+    completed: int = 0
+    cancelled: int = 0  # cancelled by the user or superseded by a newer recording
+    deadline_missed: int = 0
+
+
+class TranscriptionJob:
+    """Handle for one queued or running transcription.
+
+    Decodes call ``check()`` at safe points (before starting, between
+    long-form chunks) and stop with ``JobCancelledError`` once the job is
+    cancelled, or ``DeadlineExceededError`` once ``deadline`` seconds have
+    passed since it was created. A single inference in progress is not
+    interrupted.
+    """
+
+    def __init__(self, *, deadline: Optional[float] = None) -> None:
+        self.id = next(_job_ids)
+        self.created = time.monotonic()
+        self.deadline = self.created + deadline if deadline and deadline > 0 else None
+        self._cancelled = threading.Event()
+        self._reason = ""
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        if not self._cancelled.is_set():
+            self._reason = reason
+            self._cancelled.set()
+
+    def check(self, *, deadline: bool = True) -> None:
+        """Raise if the job was cancelled or, with ``deadline``, has expired."""
+        if self._cancelled.is_set():
+            raise JobCancelledError(f"Transcription job {self.id} {self._reason}")
+        if deadline and self.expired:
+            raise DeadlineExceededError(
+                f"Transcription job {self.id} missed its deadline "
+                f"({time.monotonic() - self.created:.1f}s elapsed)"
+            )
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .vad import frame_features, frame_length
+
+# Boundaries are moved to the quietest frame within this many seconds before
+# the nominal window end; a frame below SILENCE_DB there needs no overlap.
+SEARCH_SECONDS = 5.0
+SILENCE_DB = -45.0
+# Pause that closes a segment while transcribing incrementally.
+SEGMENT_PAUSE_SECONDS = 0.35
+# Upper bound on the words compared when removing duplicated overlap text.
+MAX_OVERLAP_WORDS = 12
+
+_WORD_NORMALIZE = re.compile(r"[^\w']+")
+
+
+@dataclass(frozen=True, slots=True)
+class Chunk:
+    start: int
+    end: int
+    # True when this chunk re-reads audio from the end of the previous one.
+    overlaps_previous: bool = False
+
+    @property
+    def samples(self) -> int:
+        return self.end - self.start
+
+
+def plan_chunks(
+    waveform: np.ndarray,
+    sample_rate: int,
+    *,
+    chunk_seconds: float,
+    overlap_seconds: float,
+    search_seconds: float = SEARCH_SECONDS,
+    silence_db: float = SILENCE_DB,
+) -> List[Chunk]:
+    """Split ``waveform`` into windows of at most ``chunk_seconds``.
+
+    Each boundary prefers a low-energy point near the window end. When no
+    silence is found the window is cut at its nominal end and the next chunk
+    starts ``overlap_seconds`` earlier so words straddling the cut are decoded
+    whole at least once.
+    """
+    total = waveform.size
+    window = int(chunk_seconds * sample_rate)
+    if window <= 0 or total <= window:
+        return [Chunk(0, total)]
+
+    frame_len = frame_length(sample_rate)
+    energy_db, _ = frame_features(waveform, frame_len)
+    search = min(int(search_seconds * sample_rate), window // 2)
+    overlap = min(int(overlap_seconds * sample_rate), window // 2)
+
+    chunks: List[Chunk] = []
+    start = 0
+    overlaps = False
+    while total - start > window:
+        nominal = start + window
+        lo = (nominal - search) // frame_len
+        hi = nominal // frame_len
+        quietest = lo + int(np.argmin(energy_db[lo:hi])) if hi > lo else hi
+        if hi > lo and energy_db[quietest] < silence_db:
+            cut = (quietest + 1) * frame_len
+            chunks.append(Chunk(start, cut, overlaps))
+            start, overlaps = cut, False
+        else:
+            chunks.append(Chunk(start, nominal, overlaps))
+            start, overlaps = nominal - overlap, overlap > 0
+    chunks.append(Chunk(start, total, overlaps))
+    return chunks
+
+
+def _normalize(word: str) -> str:
+    return _WORD_NORMALIZE.sub("", word.lower())
+
+
+def _splice(previous: List[str], current: List[str]) -> List[str]:
+    """Join two word lists whose edges were decoded from the same audio.
+
+    Words at the very edge of a window are often cut mid-word and garbled, so
+    rather than requiring an exact suffix/prefix match this looks for the
+    longest run of identical words between the tail of ``previous`` and the
+    head of ``current`` and splices there. A single shared word only counts
+    next to the boundary (allowing one garbled edge word on either side).
+    """
+    tail = [_normalize(w) for w in previous[-MAX_OVERLAP_WORDS:]]
+    head = [_normalize(w) for w in current[:MAX_OVERLAP_WORDS]]
+    # Longest run wins; among equal runs, the one closest to the boundary.
+    best_key = (0, 0)
+    best_len, best_tail_end, best_head_end = 0, 0, 0
+    runs = [0] * (len(head) + 1)
+    for i in range(1, len(tail) + 1):
+        prev_diag = 0
+        for j in range(1, len(head) + 1):
+            saved = runs[j]
+            runs[j] = prev_diag + 1 if tail[i - 1] and tail[i - 1] == head[j - 1] else 0
+            key = (runs[j], -((len(tail) - i) + j))
+            if runs[j] and key > best_key:
+                best_key = key
+                best_len, best_tail_end, best_head_end = runs[j], i, j
+            prev_diag = saved
+    if best_len == 1 and (len(tail) - best_tail_end > 1 or best_head_end > 2):
+        best_len = 0
+    if best_len == 0:
+        return previous + current
+    keep = len(previous) - len(tail) + best_tail_end
+    return previous[:keep] + current[best_head_end:]
+
+
+def merge_transcripts(texts: Sequence[str], chunks: Sequence[Chunk]) -> str:
+    """Join per-chunk texts, dropping words duplicated by overlapping windows."""
+    words: List[str] = []
+    for text, chunk in zip(texts, chunks):
+        current = text.split()
+        if chunk.overlaps_previous and words:
+            words = _splice(words, current)
+        else:
+            words.extend(current)
+    return " ".join(words)
+
+
+def find_segment_end(
+    waveform: np.ndarray,
+    sample_rate: int,
+    *,
+    min_seconds: float,
+    max_seconds: float,
+    pause_seconds: float = SEGMENT_PAUSE_SECONDS,
+    silence_db: float = SILENCE_DB,
+) -> Optional[int]:
+    """Where to close a streaming segment of ``waveform``, or None to keep waiting.
+
+    The first pause of at least ``pause_seconds`` after ``min_seconds`` of
+    audio ends the segment (in the middle of the pause). Without a pause the
+    segment is forced closed at the quietest frame near ``max_seconds``.
+    """
+    if waveform.size < int(min_seconds * sample_rate):
+        return None
+    frame_len = frame_length(sample_rate)
+    energy_db, _ = frame_features(waveform, frame_len)
+    pause_frames = max(1, int(pause_seconds * sample_rate) // frame_len)
+    silent = (energy_db < silence_db).astype(np.int32)
+    if silent.size >= pause_frames:
+        # full_runs[i] is True when frames i .. i+pause_frames-1 are all silent.
+        full_runs = np.convolve(silent, np.ones(pause_frames, dtype=np.int32), "valid")
+        candidates = np.flatnonzero(full_runs == pause_frames)
+        min_frame = int(min_seconds * sample_rate) // frame_len
+        candidates = candidates[candidates >= min_frame]
+        if candidates.size:
+            return (int(candidates[0]) + pause_frames // 2) * frame_len
+    max_samples = int(max_seconds * sample_rate)
+    if waveform.size < max_samples:
+        return None
+    hi = max_samples // frame_len
+    lo = max(0, hi - int(SEARCH_SECONDS * sample_rate) // frame_len)
+    return (lo + int(np.argmin(energy_db[lo:hi])) + 1) * frame_len
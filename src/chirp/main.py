@@ -6,20 +6,55 @@ import logging
 import platform
 import threading
 import time
-from typing import Optional, Sequence
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Sequence
 
 import numpy as np
 
-from rich.console import Console
-from rich.logging import RichHandler
-
+from .async_core import AsyncCore, AsyncPipeline
 from .audio_capture import AudioCapture
 from .audio_feedback import AudioFeedback
-from .config_manager import ConfigManager
+from .config_manager import DEFAULT_MODEL, ConfigManager
+from .controller import Controller
+from .inference_worker import InferenceWorker
+from .jobs import DeadlineExceededError, JobCancelledError, JobStats, TranscriptionJob
 from .keyboard_shortcuts import KeyboardShortcutManager
 from .logger import get_logger
+from .model_registry import ModelRegistry
 from .parakeet_manager import ModelNotPreparedError, ParakeetManager
+from .pipeline import Pipeline, Stage
+from .scheduler import TimerHandle, get_scheduler
 from .text_injector import TextInjector
+from .vad import trim_silence
+
+SAMPLE_RATE = 16_000
+
+
+@dataclass(slots=True)
+class _IncrementalSession:
+    """Segments of one recording transcribed while it is still running."""
+
+    thread: Optional[threading.Thread] = None
+    model: str = DEFAULT_MODEL
+    texts: List[str] = field(default_factory=list)
+    consumed: int = 0
+    segments: int = 0
+    failed: bool = False
+
+
+@dataclass(slots=True)
+class _Dictation:
+    """One recording (or, while recording, one phrase) moving through the pipeline."""
+
+    waveform: np.ndarray
+    model: str = DEFAULT_MODEL
+    stopped_at: Optional[float] = None
+    job: Optional[TranscriptionJob] = None
+    # Incremental transcription: phrases (segment=True) add to session.texts;
+    # the final item decodes what is left and joins everything.
+    session: Optional[_IncrementalSession] = None
+    segment: bool = False
+    text: str = ""
 
 
 class ChirpApp:
@@ -38,6 +73,21 @@ class ChirpApp:
             self.config_manager.config_path,
             self.config_manager.models_root,
         )
+        profile = self.config_manager.tuning_profile
+        if profile is not None:
+            self.logger.info(
+                "Applied tuning profile %s: %s",
+                self.config_manager.tuning_profile_path.name,
+                ", ".join(f"{key}={value}" for key, value in profile.settings.items()),
+            )
+            for key, (configured, tuned) in self.config_manager.tuning_overrides.items():
+                self.logger.warning(
+                    "Tuning profile replaced %s = %r from config.toml with %r "
+                    "(set use_tuning_profile = false to keep it)",
+                    key,
+                    configured,
+                    tuned,
+                )
         self.logger.debug(
             "Config summary: model=%s quantization=%s provider=%s threads=%s paste_mode=%s",
             self.config.parakeet_model,
@@ -47,41 +97,70 @@ class ChirpApp:
             self.config.paste_mode,
         )
 
+        # Startup runs in parallel: the model loads on a background thread while
+        # audio, feedback sounds and the hotkey come up. Recordings made before
+        # the model is ready wait in the pipeline's inference stage.
+        self._started_at = time.perf_counter()
+        self._phase_times: Dict[str, float] = {}
+        # One timer thread for the whole app: recording limit, idle unload of
+        # the model and audio device, clipboard clears.
+        self.scheduler = get_scheduler()
+        startup = concurrent.futures.ThreadPoolExecutor(
+            max_workers=3, thread_name_prefix="Startup"
+        )
+        self._model_future = startup.submit(
+            self._timed_phase, "model", self._create_parakeet, model_dir
+        )
+        self._model_future.add_done_callback(self._on_model_ready)
+        self.logger.info("Loading Parakeet model in the background...")
+        # The default model plus any [models.<name>] tables, loaded on first
+        # use and evicted least-recently-used beyond model_memory_budget_mb.
+        self.models = ModelRegistry(
+            factory=self._model_factory,
+            budget_bytes=int(self.config.model_memory_budget_mb * 2**20),
+            logger=self.logger,
+        )
+
+        # Hotkeys, timers and the endpoint detector post commands here; they
+        # run one at a time on the controller thread, off the keyboard hook.
+        # With async_core that thread is an asyncio loop that also runs the
+        # dictation pipeline; inference, hand-offs and preloads still run on
+        # worker threads.
+        self.controller = (
+            AsyncCore(logger=self.logger)
+            if self.config.async_core
+            else Controller(logger=self.logger)
+        )
         self.keyboard = KeyboardShortcutManager(logger=self.logger)
-        self.audio_capture = AudioCapture(status_callback=self._log_capture_status)
+        self.audio_capture = AudioCapture(
+            max_duration=self.config.max_recording_duration,
+            persistent=self.config.persistent_stream,
+            idle_timeout=self.config.stream_idle_timeout,
+            preroll_ms=self.config.preroll_ms,
+            endpoint_silence=self.config.endpoint_silence,
+            endpoint_threshold_db=self.config.vad_threshold_db,
+            on_endpoint=self._handle_endpoint,
+            status_callback=self._log_capture_status,
+            logger=self.logger,
+            scheduler=self.scheduler,
+        )
         self.audio_feedback = AudioFeedback(
             logger=self.logger,
             enabled=self.config.audio_feedback,
             volume=self.config.audio_feedback_volume,
         )
-
-        console = None
-        for handler in self.logger.handlers:
-            if isinstance(handler, RichHandler):
-                console = handler.console
-                break
-        if not console:
-            console = Console(stderr=True)
-
-        try:
-            spinner = "dots" if console.encoding == "utf-8" else "line"
-            with console.status(
-                "[bold green]Initializing Parakeet model...[/bold green]",
-                spinner=spinner,
-            ):
-                self.parakeet = ParakeetManager(
-                    model_name=self.config.parakeet_model,
-                    quantization=self.config.parakeet_quantization,
-                    provider_key=self.config.onnx_providers,
-                    threads=self.config.threads,
-                    logger=self.logger,
-                    model_dir=model_dir,
-                    timeout=self.config.model_timeout,
-                )
-        except ModelNotPreparedError as exc:
-            self.logger.error(str(exc))
-            raise SystemExit(1) from exc
-        self.text_injector = TextInjector(
+        startup.submit(self._timed_phase, "audio", self._open_audio_input)
+        startup.submit(
+            self._timed_phase,
+            "feedback",
+            self.audio_feedback.preload,
+            self.config.start_sound_path,
+            self.config.stop_sound_path,
+        )
+        startup.shutdown(wait=False)
+        self.text_injector = self._timed_phase(
+            "injector",
+            TextInjector,
             keyboard_manager=self.keyboard,
             logger=self.logger,
             paste_mode=self.config.paste_mode,
@@ -89,98 +168,545 @@ class ChirpApp:
             post_processing=self.config.post_processing,
             clipboard_behavior=self.config.clipboard_behavior,
             clipboard_clear_delay=self.config.clipboard_clear_delay,
+            scheduler=self.scheduler,
         )
 
         self._recording = False
+        self._recording_id = 0
+        self._recording_model = DEFAULT_MODEL
+        self._incremental: Optional[_IncrementalSession] = None
+        # _lock covers starting and stopping capture only. A stopped
+        # recording is handed to the pipeline under _handoff_lock. Commands
+        # run one at a time and their blocking work runs in call order, so
+        # recordings are queued in stop order.
         self._lock = threading.Lock()
-        self._stop_timer: Optional[threading.Timer] = None
-        self._executor = concurrent.futures.ThreadPoolExecutor(
-            max_workers=1, thread_name_prefix="Transcriber"
+        self._handoff_lock = threading.Lock()
+        self._stop_timer: Optional[TimerHandle] = None
+        # Seconds of inference per second of audio, from the last transcription.
+        self._last_rtf: Optional[float] = None
+        # handoff -> preprocess (VAD) -> inference -> process -> inject, with
+        # bounded queues between the stages. Transcripts reach process and
+        # inject in recording order even with several inference workers.
+        self._pipeline = self._build_pipeline()
+        # Queued and running transcription jobs, oldest first.
+        self._jobs: List[TranscriptionJob] = []
+        self._jobs_lock = threading.Lock()
+        self._job_stats = JobStats()
+
+    @property
+    def parakeet(self) -> ParakeetManager:
+        """The loaded model manager; blocks while the background load is running."""
+        if not self._model_future.done():
+            self.logger.info("Model still loading; transcription queued until it is ready")
+        return self._model_future.result()
+
+    def _model_factory(self, name: str) -> ParakeetManager:
+        if name == DEFAULT_MODEL:
+            return self.parakeet
+        spec = self.config.model_spec(name)
+        self.logger.info("Loading model %r (%s)", name, spec.quantization or "fp32")
+        model_dir = self.config_manager.model_dir(spec.model, spec.quantization)
+        return self._create_parakeet(model_dir, name)
+
+    def _create_parakeet(self, model_dir, name: str = DEFAULT_MODEL) -> ParakeetManager:
+        spec = self.config.model_spec(name)
+        # InferenceWorker hosts the same manager in a child process.
+        manager_type = InferenceWorker if self.config.inference_process else ParakeetManager
+        return manager_type(
+            model_name=spec.model,
+            quantization=spec.quantization,
+            provider_key=self.config.onnx_providers,
+            threads=self.config.threads,
+            logger=self.logger,
+            model_dir=model_dir,
+            timeout=self.config.model_timeout,
+            chunk_seconds=self.config.long_form_chunk_seconds,
+            chunk_overlap=self.config.long_form_overlap_seconds,
+            pool_size=self.config.session_pool_size,
+            warmup_seconds=self.config.model_warmup_seconds,
+            cache_dir=self.config_manager.model_cache_dir(model_dir)
+            if self.config.optimized_model_cache
+            else None,
+            onnx_settings=self.config.onnx,
+            mmap_weights=self.config.mmap_weights,
+            scheduler=self.scheduler,
+        )
+
+    def _timed_phase(self, name: str, fn, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._phase_times[name] = time.perf_counter() - started
+            self.logger.debug(
+                "Startup phase %s took %.0f ms", name, self._phase_times[name] * 1000
+            )
+
+    def _on_model_ready(self, future: concurrent.futures.Future) -> None:
+        if future.exception() is not None:
+            return  # reported by run()
+        self.logger.info(
+            "Model ready %.2fs after startup", time.perf_counter() - self._started_at
         )
 
     def run(self) -> None:
         try:
             self._register_hotkey()
             self.logger.info(
-                "Chirp ready. Toggle recording with %s", self.config.primary_shortcut
+                "Chirp ready. Toggle recording with %s (hotkey ready %.0f ms after startup)",
+                self.config.primary_shortcut,
+                (time.perf_counter() - self._started_at) * 1000,
             )
+            try:
+                self._model_future.result()
+            except ModelNotPreparedError as exc:
+                self.logger.error(str(exc))
+                raise SystemExit(1) from exc
             self.keyboard.wait()
         except KeyboardInterrupt:
             self.logger.info("Interrupted, exiting.")
 
+    def _open_audio_input(self) -> None:
+        if not self.audio_capture.persistent:
+            return
+        try:
+            elapsed = self.audio_capture.open()
+        except Exception as exc:
+            # Not fatal: start() retries opening the device on the first hotkey.
+            self.logger.warning("Could not open audio input at startup: %s", exc)
+            return
+        self.logger.info("Audio input opened in %.0f ms (persistent)", elapsed * 1000)
+
     def _register_hotkey(self) -> None:
         self.logger.debug("Registering hotkey: %s", self.config.primary_shortcut)
         try:
-            self.keyboard.register(self.config.primary_shortcut, self.toggle_recording)
+            self.keyboard.register(
+                self.config.primary_shortcut,
+                self.controller.hotkey("toggle", self.toggle_recording),
+            )
+            for name, spec in self.config.models.items():
+                if spec.shortcut:
+                    self.logger.debug("Registering hotkey %s for model %r", spec.shortcut, name)
+                    self.keyboard.register(
+                        spec.shortcut,
+                        self.controller.hotkey(f"toggle {name}", self.toggle_recording, name),
+                    )
+            if self.config.cancel_shortcut:
+                self.logger.debug("Registering cancel hotkey: %s", self.config.cancel_shortcut)
+                # Runs in the hook itself: it only flags jobs under _jobs_lock,
+                # and must work while the controller is stuck behind a full
+                # pipeline or a slow start.
+                self.keyboard.register(
+                    self.config.cancel_shortcut,
+                    self.controller.inline_hotkey(self.cancel_transcriptions),
+                )
         except Exception:
             self.logger.error(
                 "Unable to register primary shortcut. Run as Administrator on Windows."
             )
             raise
 
-    def toggle_recording(self) -> None:
+    def toggle_recording(self, model: str = DEFAULT_MODEL) -> None:
+        """Start recording for ``model``, or stop whichever recording is running.
+
+        Stopping only takes the audio; transcription runs in the pipeline,
+        so the next recording can start while earlier ones are decoded.
+        """
+        dictation = None
+        started = False
         with self._lock:
             if not self._recording:
-                self._start_recording()
+                started = self._start_recording(model)
             else:
-                self._stop_recording()
+                dictation = self._stop_recording()
+        if dictation is not None:
+            self.controller.run_blocking("hand-off", self._hand_off, dictation)
+        elif started:
+            self.controller.run_blocking("announce", self._announce_start, model)
 
-    def _start_recording(self) -> None:
+    def _start_recording(self, model: str = DEFAULT_MODEL) -> bool:
         self.logger.debug("Starting audio capture")
+        self._recording_id += 1
+        self._recording_model = model
         try:
             self.audio_capture.start()
         except Exception as exc:
             self.logger.error("Audio capture start failed: %s", exc)
             self.audio_feedback.play_error(self.config.error_sound_path)
-            return
+            return False
         self._recording = True
-        self.audio_feedback.play_start(self.config.start_sound_path)
-        self.logger.info("Recording started")
-
+        self.controller.run_blocking("preload", self._preload_model, model)
+        if self.config.incremental_transcription:
+            self._incremental = self._start_incremental()
         if self.config.max_recording_duration > 0:
-            self._stop_timer = threading.Timer(
-                self.config.max_recording_duration, self._handle_timeout
+            self._stop_timer = self.scheduler.call_later(
+                self.config.max_recording_duration,
+                self._handle_timeout,
+                self._recording_id,
+                name="recording-limit",
             )
-            self._stop_timer.start()
+        return True
+
+    def _announce_start(self, model: str) -> None:
+        self.audio_feedback.play_start(self.config.start_sound_path)
+        if model == DEFAULT_MODEL:
+            self.logger.info("Recording started")
+        else:
+            self.logger.info("Recording started (model %r)", model)
+
+    def _preload_model(self, model: str) -> None:
+        # If the model was unloaded (idle timeout or evicted for another
+        # model), reload it while the user talks.
+        future = self._model_future
+        if future.done() and future.exception() is None:
+            self.models.prepare(model)
+
+    def _handle_timeout(self, recording_id: int) -> None:
+        self.controller.post(
+            "timeout",
+            self._stop_if_current,
+            recording_id,
+            "Maximum recording duration reached.",
+        )
+
+    def _handle_endpoint(self) -> None:
+        # Called on the PortAudio thread, which cannot stop its own stream.
+        self.controller.post(
+            "endpoint",
+            self._stop_if_current,
+            self._recording_id,
+            f"Silence detected for {self.config.endpoint_silence:.1f}s; stopping recording",
+        )
 
-    def _handle_timeout(self) -> None:
-        self.logger.info("Maximum recording duration reached.")
-        self.toggle_recording()
+    def _stop_if_current(self, recording_id: int, reason: str) -> None:
+        with self._lock:
+            # Ignore timers and endpoints of a recording the user already stopped.
+            if not self._recording or recording_id != self._recording_id:
+                return
+            self.logger.info(reason)
+            dictation = self._stop_recording()
+        self.controller.run_blocking("hand-off", self._hand_off, dictation)
 
-    def _stop_recording(self) -> None:
+    def _stop_recording(self) -> _Dictation:
+        """Stop capture and take the recording; called with ``_lock`` held."""
         if self._stop_timer:
             self._stop_timer.cancel()
             self._stop_timer = None
 
         self.logger.debug("Stopping audio capture")
-        waveform = self.audio_capture.stop()
+        waveform = self.audio_capture.stop()  # the recording buffer is ours from here
         self._recording = False
-        self.audio_feedback.play_stop(self.config.stop_sound_path)
-        self.logger.info("Recording stopped (%s samples)", waveform.size)
-        self._executor.submit(self._transcribe_and_inject, waveform)
+        session, self._incremental = self._incremental, None
+        return _Dictation(
+            waveform=waveform,
+            model=self._recording_model,
+            stopped_at=time.perf_counter(),
+            session=session,
+        )
 
-    def _transcribe_and_inject(self, waveform) -> None:
-        start_time = time.perf_counter()
-        if waveform.size == 0:
-            self.logger.warning("No audio samples captured")
+    def _hand_off(self, dictation: _Dictation) -> None:
+        """Queue a stopped recording behind its incremental segments."""
+        with self._handoff_lock:
+            self.audio_feedback.play_stop(self.config.stop_sound_path)
+            self.logger.info("Recording stopped (%s samples)", dictation.waveform.size)
+            if dictation.session is not None:
+                # iter_segments() returns as soon as capture stops, so every
+                # phrase is queued ahead of the tail.
+                dictation.session.thread.join()
+            self._submit_job(dictation)
+        self.logger.debug(
+            "Pending timers: %s",
+            ", ".join(f"{t.name} in {t.remaining:.1f}s" for t in self.scheduler.pending())
+            or "none",
+        )
+
+    def _submit_job(self, dictation: _Dictation) -> TranscriptionJob:
+        """Queue ``dictation`` on the pipeline as a cancellable job."""
+        job = TranscriptionJob(deadline=self.config.transcription_deadline)
+        dictation.job = job
+        with self._jobs_lock:
+            if self.config.latest_wins:
+                for older in self._jobs:
+                    older.cancel("superseded by a newer recording")
+            self._jobs.append(job)
+            self._job_stats.submitted += 1
+        self._pipeline.submit(dictation)
+        return job
+
+    def _on_dictation_done(
+        self, dictation: _Dictation, error: Optional[BaseException]
+    ) -> None:
+        if isinstance(error, DeadlineExceededError):
+            self.logger.warning("%s; transcription abandoned", error)
+        elif isinstance(error, JobCancelledError):
+            self.logger.info("%s", error)
+        elif error is not None:
+            self.logger.error("Dictation failed: %s", error, exc_info=error)
+        if dictation.job is None:
             return
+        if isinstance(error, DeadlineExceededError):
+            outcome = "deadline_missed"
+        elif isinstance(error, JobCancelledError):
+            outcome = "cancelled"
+        else:
+            outcome = "completed" if error is None else None
+        self._record_job(dictation.job, outcome)
+        self.logger.debug("Pipeline wait/service: %s", self._pipeline.summary())
+
+    def _record_job(self, job: TranscriptionJob, outcome: Optional[str]) -> None:
+        with self._jobs_lock:
+            if job in self._jobs:
+                self._jobs.remove(job)
+            if outcome is not None:
+                setattr(self._job_stats, outcome, getattr(self._job_stats, outcome) + 1)
+            stats = replace(self._job_stats)
+        # Logged after releasing _jobs_lock, which the cancel hotkey takes
+        # in the keyboard hook.
+        self.logger.debug(
+            "Jobs: %d submitted, %d completed, %d cancelled, %d missed deadline",
+            stats.submitted,
+            stats.completed,
+            stats.cancelled,
+            stats.deadline_missed,
+        )
+
+    def cancel_transcriptions(self) -> int:
+        """Cancel every queued or running transcription; returns how many."""
+        with self._jobs_lock:
+            jobs = [job for job in self._jobs if not job.cancelled]
+            for job in jobs:
+                job.cancel("cancelled by the user")
+        if jobs:
+            # Called from the keyboard hook: leave the logging to the controller.
+            self.controller.post(
+                "log cancel", self.logger.info, "Cancelling %d transcription(s)", len(jobs)
+            )
+        return len(jobs)
+
+    def _start_incremental(self) -> _IncrementalSession:
+        session = _IncrementalSession(model=self._recording_model)
+        session.thread = threading.Thread(
+            target=self._segment_loop, args=(session,), name="Segmenter", daemon=True
+        )
+        session.thread.start()
+        return session
+
+    def _segment_loop(self, session: _IncrementalSession) -> None:
+        for start, segment in self.audio_capture.iter_segments(
+            min_seconds=self.config.incremental_min_seconds,
+            max_seconds=self.config.incremental_max_seconds,
+            silence_db=self.config.vad_threshold_db,
+        ):
+            session.consumed = start + segment.size
+            # Same pipeline as the final tail, so phrases stay in order.
+            self._pipeline.submit(
+                _Dictation(
+                    waveform=segment, model=session.model, session=session, segment=True
+                )
+            )
+
+    def _transcribe_and_inject(
+        self,
+        waveform: np.ndarray,
+        stopped_at: Optional[float] = None,
+        model: str = DEFAULT_MODEL,
+        job: Optional[TranscriptionJob] = None,
+    ) -> None:
+        """Run one recording through every pipeline stage on the calling thread."""
+        self._pipeline.run(
+            _Dictation(waveform=waveform, model=model, stopped_at=stopped_at, job=job)
+        )
+
+    def _build_pipeline(self) -> Pipeline | AsyncPipeline:
+        stages = [
+            Stage("handoff", self._stage_handoff),
+            Stage("preprocess", self._stage_preprocess),
+            Stage(
+                "inference",
+                self._stage_inference,
+                workers=self.config.inference_workers,
+                blocking=True,
+            ),
+            Stage("process", self._stage_process),
+            Stage("inject", self._stage_inject, coro=self._stage_inject_async),
+        ]
+        if isinstance(self.controller, AsyncCore):
+            return AsyncPipeline(
+                self.controller, stages, on_done=self._on_dictation_done, logger=self.logger
+            )
+        return Pipeline(
+            stages,
+            queue_size=self.config.pipeline_queue_size,
+            on_done=self._on_dictation_done,
+            logger=self.logger,
+        )
+
+    def _stage_handoff(self, dictation: _Dictation) -> Optional[_Dictation]:
+        """Check the job and take the audio left to transcribe from the capture."""
+        if dictation.job is not None:
+            dictation.job.check()  # may have been cancelled or expired while queued
+        session = dictation.session
+        if session is not None:
+            if session.failed:
+                return None
+            if dictation.segment:
+                session.segments += 1
+            else:
+                dictation.waveform = dictation.waveform[session.consumed :]
+                self.logger.debug(
+                    "Incremental: %d segments decoded while recording, %.2fs tail left at stop",
+                    session.segments,
+                    dictation.waveform.size / SAMPLE_RATE,
+                )
+        elif dictation.waveform.size == 0:
+            self.logger.warning("No audio samples captured")
+            return None
+        dictation.waveform = np.ascontiguousarray(
+            dictation.waveform.reshape(-1), dtype=np.float32
+        )
+        return dictation
+
+    def _stage_preprocess(self, dictation: _Dictation) -> Optional[_Dictation]:
+        if not self.config.vad_trim or dictation.waveform.size == 0:
+            return dictation
+        trimmed = self._trim_silence(dictation.waveform)
+        if trimmed is not None:
+            dictation.waveform = trimmed
+            return dictation
+        if dictation.session is None or dictation.segment:
+            return None
+        # The final tail was silent; the phrases decoded earlier still count.
+        dictation.waveform = dictation.waveform[:0]
+        return dictation
+
+    def _stage_inference(self, dictation: _Dictation) -> Optional[_Dictation]:
+        # May run on several workers at once; everything order-dependent
+        # happens in the stages after it.
+        if dictation.waveform.size:
+            text = self._transcribe(dictation.waveform, dictation.model, dictation.job)
+            if text is None:
+                if dictation.session is not None:
+                    dictation.session.failed = True
+                return None
+            dictation.text = text
+        return dictation
+
+    def _stage_process(self, dictation: _Dictation) -> Optional[_Dictation]:
+        session = dictation.session
+        if session is not None:
+            # Phrases arrive here in recording order, each before its tail.
+            if dictation.segment:
+                if dictation.text.strip():
+                    session.texts.append(dictation.text)
+                return None
+            if session.failed:
+                return None
+            dictation.text = " ".join(
+                t.strip() for t in [*session.texts, dictation.text] if t.strip()
+            )
+        if not dictation.text.strip():
+            self.logger.info("Transcription empty; skipping paste")
+            return None
+        self.logger.debug("Transcription: %s", dictation.text)
+        dictation.text = self.text_injector.process(dictation.text)
+        return dictation if dictation.text else None
+
+    def _stage_inject(self, dictation: _Dictation) -> _Dictation:
+        self._before_inject(dictation)
+        self.text_injector.paste(dictation.text)
+        return dictation
+
+    async def _stage_inject_async(self, dictation: _Dictation) -> _Dictation:
+        self._before_inject(dictation)
+        await self.text_injector.paste_async(dictation.text)
+        return dictation
+
+    def _before_inject(self, dictation: _Dictation) -> None:
+        if dictation.job is not None:
+            dictation.job.check(deadline=False)  # a finished transcript is still pasted late
+        if dictation.stopped_at is not None:
+            self.logger.debug(
+                "Stop-to-text latency: %.2fs", time.perf_counter() - dictation.stopped_at
+            )
+
+    def _transcribe(
+        self,
+        waveform: np.ndarray,
+        model: str = DEFAULT_MODEL,
+        job: Optional[TranscriptionJob] = None,
+    ) -> Optional[str]:
+        """Returns the transcript, or None on failure.
+
+        Raises ``JobCancelledError`` when ``job`` is cancelled or expires.
+        """
+        start_time = time.perf_counter()
         try:
-            text = self.parakeet.transcribe(
-                waveform, sample_rate=16_000, language=self.config.language
+            text = self.models.transcribe(
+                waveform,
+                model=model,
+                sample_rate=SAMPLE_RATE,
+                language=self.config.model_spec(model).language,
+                job=job,
             )
+        except JobCancelledError:
+            raise
         except Exception as exc:
             self.logger.exception("Transcription failed: %s", exc)
             self.audio_feedback.play_error(self.config.error_sound_path)
-            return
+            return None
         duration = time.perf_counter() - start_time
+        self._last_rtf = duration / (waveform.size / SAMPLE_RATE)
         self.logger.debug(
-            "Transcription finished in %.2fs (chars=%s)", duration, len(text)
+            "Transcription finished in %.2fs (chars=%s, rtf=%.3f)",
+            duration,
+            len(text),
+            self._last_rtf,
         )
-        if not text.strip():
-            self.logger.info("Transcription empty; skipping paste")
-            return
-        self.logger.debug("Transcription: %s", text)
-        self.text_injector.inject(text)
+        if self.config.models:
+            stats = self.models.stats()[model]
+            self.logger.debug(
+                "Model %r: %d hits, %d misses, %d evictions",
+                model,
+                stats.hits,
+                stats.misses,
+                stats.evictions,
+            )
+        return text
+
+    def _trim_silence(self, waveform: np.ndarray) -> Optional[np.ndarray]:
+        started = time.perf_counter()
+        result = trim_silence(
+            waveform,
+            SAMPLE_RATE,
+            threshold_db=self.config.vad_threshold_db,
+            padding_ms=self.config.vad_padding_ms,
+        )
+        vad_ms = (time.perf_counter() - started) * 1000
+        original = waveform.size / SAMPLE_RATE
+        if result is None:
+            self.logger.info(
+                "No speech detected in %.2fs of audio; skipping transcription", original
+            )
+            return None
+        trimmed = result.trimmed_samples / SAMPLE_RATE
+        if self._last_rtf is not None:
+            self.logger.debug(
+                "VAD trimmed %.2fs of silence (%.2fs -> %.2fs) in %.1f ms; ~%.2fs inference saved",
+                trimmed,
+                original,
+                original - trimmed,
+                vad_ms,
+                trimmed * self._last_rtf,
+            )
+        else:
+            self.logger.debug(
+                "VAD trimmed %.2fs of silence (%.2fs -> %.2fs) in %.1f ms",
+                trimmed,
+                original,
+                original - trimmed,
+                vad_ms,
+            )
+        return result.waveform
 
     def _log_capture_status(self, message: str) -> None:
         self.logger.debug("Audio status: %s", message)
@@ -238,6 +764,15 @@ def _run_smoke_check(*, verbose: bool = False) -> None:
             logger=logger,
             model_dir=model_dir,
             timeout=config.model_timeout,
+            chunk_seconds=config.long_form_chunk_seconds,
+            chunk_overlap=config.long_form_overlap_seconds,
+            pool_size=config.session_pool_size,
+            warmup_seconds=config.model_warmup_seconds,
+            cache_dir=config_manager.model_cache_dir(model_dir)
+            if config.optimized_model_cache
+            else None,
+            onnx_settings=config.onnx,
+            mmap_weights=config.mmap_weights,
         )
     except ModelNotPreparedError as exc:
         logger.error(str(exc))
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import platform
+import shutil
+import time
+from pathlib import Path
+from typing import Optional, Sequence
+
+from .tuning_profile import cpu_key
+
+try:
+    import onnxruntime as ort
+except ImportError:  # pragma: no cover - optional dependency
+    ort = None  # type: ignore[assignment]
+
+MANIFEST_NAME = "manifest.json"
+# Initializers above this size go to a side file, so models over the 2 GB
+# protobuf limit (the fp32 encoder) can be serialized too. Weights in that
+# file can be memory-mapped at load time instead of copied to the heap.
+_EXTERNAL_MIN_BYTES = 1024
+# Entries used (loaded) more recently than this are never removed as stale:
+# another Chirp process with other settings may still be loading from them.
+STALE_ENTRY_SECONDS = 7 * 24 * 3600.0
+
+
+class OptimizedModelCache:
+    """On-disk cache of ONNX graphs that ONNX Runtime has already optimized.
+
+    Every session creation otherwise re-runs graph optimization (constant
+    folding, node fusion, layout transforms) on the raw model files. Here the
+    optimized graphs are serialized once into ``root/<key>/`` under the same
+    file names the loader looks for, so later loads point the loader at that
+    directory and skip optimization.
+
+    The key covers the model name and quantization, the source files' sizes
+    and mtimes, the ONNX Runtime version, the architecture and CPU model
+    (optimized graphs may contain kernels and layouts for the CPU's
+    features) and the graph-affecting session options. When any of them
+    change a new entry is built; old entries are removed once no load has
+    used them for ``STALE_ENTRY_SECONDS``.
+    """
+
+    def __init__(self, *, root: Path, logger: Optional[logging.Logger] = None) -> None:
+        self._root = root
+        self._logger = logger or logging.getLogger("chirp")
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def key(
+        self,
+        *,
+        model_name: str,
+        quantization: Optional[str],
+        source_files: Sequence[Path],
+        session_options,
+        providers: Sequence[str],
+    ) -> str:
+        files = []
+        for path in source_files:
+            stat = path.stat()
+            files.append([path.name, stat.st_size, stat.st_mtime_ns])
+        payload = {
+            "model": model_name,
+            "quantization": quantization or "",
+            "files": files,
+            "onnxruntime": ort.__version__ if ort is not None else None,
+            "machine": [platform.machine(), cpu_key()],
+            "providers": list(providers),
+            # Thread counts do not change the graph, so sessions with
+            # different pool sizes share one entry.
+            "graph_optimization_level": str(session_options.graph_optimization_level)
+            if session_options is not None
+            else None,
+        }
+        blob = json.dumps(payload, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(blob).hexdigest()[:16]
+
+    def lookup(
+        self,
+        *,
+        model_name: str,
+        quantization: Optional[str],
+        source_files: Sequence[Path],
+        session_options,
+        providers: Sequence[str],
+    ) -> Optional[Path]:
+        """The complete entry for these inputs (see ``key``) if one exists; never builds."""
+        entry = self._entry(
+            model_name=model_name,
+            quantization=quantization,
+            source_files=source_files,
+            session_options=session_options,
+            providers=providers,
+        )
+        return entry if entry is not None and (entry / MANIFEST_NAME).is_file() else None
+
+    def prepare(
+        self,
+        *,
+        model_name: str,
+        quantization: Optional[str],
+        source_files: Sequence[Path],
+        session_options,
+        providers: Sequence[str],
+    ) -> Optional[Path]:
+        """Directory holding the optimized model, building it on a miss.
+
+        Returns None when the cache cannot be used (onnxruntime missing, no
+        model files, or the build failed); callers then load the originals.
+        """
+        entry = self._entry(
+            model_name=model_name,
+            quantization=quantization,
+            source_files=source_files,
+            session_options=session_options,
+            providers=providers,
+        )
+        if entry is None:
+            return None
+        if (entry / MANIFEST_NAME).is_file():
+            self._logger.debug("Using optimized model cache %s", entry)
+            self._touch(entry)
+            return entry
+        try:
+            self._build(entry, source_files, session_options, providers)
+        except Exception as exc:
+            self._logger.warning("Could not build optimized model cache: %s", exc)
+            return None
+        self._remove_stale(keep=entry.name)
+        return entry
+
+    def _entry(
+        self,
+        *,
+        model_name: str,
+        quantization: Optional[str],
+        source_files: Sequence[Path],
+        session_options,
+        providers: Sequence[str],
+    ) -> Optional[Path]:
+        if ort is None or not any(path.suffix == ".onnx" for path in source_files):
+            return None
+        return self._root / self.key(
+            model_name=model_name,
+            quantization=quantization,
+            source_files=source_files,
+            session_options=session_options,
+            providers=providers,
+        )
+
+    def _build(
+        self,
+        entry: Path,
+        source_files: Sequence[Path],
+        session_options,
+        providers: Sequence[str],
+    ) -> None:
+        started = time.perf_counter()
+        staging = entry.with_name(f"{entry.name}.tmp-{os.getpid()}")
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+        try:
+            for path in source_files:
+                if path.suffix == ".onnx":
+                    self._optimize(path, staging / path.name, session_options, providers)
+                elif not path.name.endswith(".onnx.data"):
+                    shutil.copy2(path, staging / path.name)  # config.json, vocab.txt
+            # The manifest is written last; its presence marks a complete entry.
+            (staging / MANIFEST_NAME).write_text(
+                json.dumps({"sources": [str(path) for path in source_files]}, indent=2),
+                encoding="utf-8",
+            )
+            if (entry / MANIFEST_NAME).is_file():
+                # Another process finished the same entry meanwhile; keep it.
+                shutil.rmtree(staging, ignore_errors=True)
+                return
+            shutil.rmtree(entry, ignore_errors=True)  # an incomplete leftover
+            staging.rename(entry)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        self._logger.info(
+            "Saved optimized model graphs to %s in %.2fs",
+            entry,
+            time.perf_counter() - started,
+        )
+
+    @staticmethod
+    def _optimize(source: Path, target: Path, session_options, providers) -> None:
+        options = ort.SessionOptions()
+        if session_options is not None:
+            options.graph_optimization_level = session_options.graph_optimization_level
+        options.optimized_model_filepath = str(target)
+        options.add_session_config_entry(
+            "session.optimized_model_external_initializers_file_name",
+            f"{target.name}.data",
+        )
+        options.add_session_config_entry(
+            "session.optimized_model_external_initializers_min_size_in_bytes",
+            str(_EXTERNAL_MIN_BYTES),
+        )
+        # ORT warns that the result is hardware specific; the key covers that.
+        options.log_severity_level = 3
+        # Creating the session performs the optimization and writes the file.
+        ort.InferenceSession(str(source), sess_options=options, providers=list(providers))
+
+    @staticmethod
+    def _touch(entry: Path) -> None:
+        """Mark ``entry`` as used; its manifest's mtime is the last load."""
+        try:
+            os.utime(entry / MANIFEST_NAME)
+        except OSError:
+            pass
+
+    def _remove_stale(self, *, keep: str) -> None:
+        cutoff = time.time() - STALE_ENTRY_SECONDS
+        for path in self._root.iterdir():
+            if path.name == keep or ".tmp-" in path.name or not path.is_dir():
+                continue
+            try:
+                # Entries without a manifest are incomplete and never loaded.
+                used = (path / MANIFEST_NAME).stat().st_mtime
+            except OSError:
+                used = path.stat().st_mtime
+            if used > cutoff:
+                continue  # possibly in use by another process
+            self._logger.debug("Removing stale optimized model cache %s", path)
+            shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .parakeet_manager import ParakeetManager
+
+
+@dataclass(slots=True)
+class ModelStats:
+    hits: int = 0  # requests served by an already loaded model
+    misses: int = 0  # requests that had to (re)load it first
+    evictions: int = 0  # unloads forced by the memory budget
+
+
+class ModelRegistry:
+    """Named ``ParakeetManager`` instances kept within a memory budget.
+
+    Managers are created by ``factory(name)`` on first use. When a model is
+    loaded, least recently used models are unloaded until the estimated
+    footprints (``weights_bytes()``) fit in ``budget_bytes``. A model in use
+    by a transcription is never evicted; if nothing can be evicted the budget
+    is exceeded with a warning rather than failing the request.
+    ``budget_bytes <= 0`` means unlimited.
+
+    The footprint is the on-disk size of the files a model loads from, not
+    its resident memory: with ``mmap_weights`` the mapped pages are shared
+    and reclaimable, and ONNX Runtime adds arenas on top, so treat the
+    budget as a rough cap on how many models stay loaded.
+
+    Evicted managers are kept and reload on demand, or in the background via
+    ``prepare()`` when a recording for them starts.
+    """
+
+    def __init__(
+        self,
+        *,
+        factory: Callable[[str], ParakeetManager],
+        budget_bytes: int = 0,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self._factory = factory
+        self._budget = budget_bytes
+        self._logger = logger or logging.getLogger("chirp")
+        # Least recently used first.
+        self._managers: "OrderedDict[str, ParakeetManager]" = OrderedDict()
+        self._stats: Dict[str, ModelStats] = {}
+        # Managers being built, so one model is never built twice. The build
+        # (a full model load) runs outside _lock.
+        self._creating: Dict[str, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> ParakeetManager:
+        """The manager for ``name``, loaded and counted as a hit or miss."""
+        with self._lock:
+            stats = self._stats.setdefault(name, ModelStats())
+            manager = self._managers.get(name)
+            if manager is not None and manager.is_loaded:
+                stats.hits += 1
+                self._managers.move_to_end(name)
+                return manager
+            stats.misses += 1
+            if manager is not None:
+                room = self._plan_room_locked(name, manager.weights_bytes())
+                self._managers.move_to_end(name)
+        if manager is None:
+            return self._create(name)
+        self._make_room(name, *room)
+        return manager
+
+    def transcribe(self, audio: np.ndarray, *, model: str, **kwargs) -> str:
+        # The manager's own lease keeps it from being evicted mid-transcription;
+        # an evicted manager reloads itself inside transcribe().
+        return self.get(model).transcribe(audio, **kwargs)
+
+    def prepare(self, name: str) -> None:
+        """Make sure ``name`` is (re)loading in the background, making room for it."""
+        with self._lock:
+            manager = self._managers.get(name)
+            if manager is not None and manager.is_loaded:
+                self._managers.move_to_end(name)
+                return
+            if name in self._creating:
+                return
+        if manager is None:
+            threading.Thread(
+                target=self._create_in_background, args=(name,), name="ModelCreate", daemon=True
+            ).start()
+            return
+        with self._lock:
+            room = self._plan_room_locked(name, manager.weights_bytes())
+            self._managers.move_to_end(name)
+        self._make_room(name, *room)
+        if manager.preload():
+            self._logger.debug("Reloading model %r in the background", name)
+
+    def stats(self) -> Dict[str, ModelStats]:
+        with self._lock:
+            return {name: replace(stats) for name, stats in self._stats.items()}
+
+    def loaded(self) -> Dict[str, int]:
+        """Estimated bytes of each currently loaded model, least recently used first."""
+        with self._lock:
+            return self._loaded_bytes_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            managers = list(self._managers.values())
+        for manager in managers:
+            manager.close()
+
+    def _create_in_background(self, name: str) -> None:
+        try:
+            self._create(name)
+        except Exception as exc:  # reported again by the transcription that needs it
+            self._logger.warning("Background load of model %r failed: %s", name, exc)
+
+    def _create(self, name: str) -> ParakeetManager:
+        """Build the manager for ``name``, or wait for the build in progress."""
+        with self._lock:
+            manager = self._managers.get(name)
+            if manager is not None:
+                self._managers.move_to_end(name)
+                return manager
+            future = self._creating.get(name)
+            building = future is None
+            if building:
+                future = self._creating[name] = concurrent.futures.Future()
+        if not building:
+            return future.result()
+        try:
+            manager = self._factory(name)
+        except BaseException as exc:
+            with self._lock:
+                del self._creating[name]
+            future.set_exception(exc)
+            raise
+        with self._lock:
+            del self._creating[name]
+            self._managers[name] = manager
+            # A manager loads on construction, so a model's first load can
+            # only make room afterwards; later reloads make room before loading.
+            room = self._plan_room_locked(name, 0)
+        self._make_room(name, *room)
+        future.set_result(manager)
+        return manager
+
+    def _loaded_bytes_locked(self) -> Dict[str, int]:
+        return {
+            other: manager.weights_bytes()
+            for other, manager in self._managers.items()
+            if manager.is_loaded
+        }
+
+    def _plan_room_locked(
+        self, name: str, needed: int
+    ) -> Tuple[int, List[Tuple[str, ParakeetManager, int]]]:
+        """Bytes needed on top of the loaded models, and the eviction candidates.
+
+        Candidates are the other loaded models, least recently used first.
+        They are unloaded by ``_make_room()`` after ``_lock`` is released: an
+        unload collects garbage or waits for a worker to stop, and must not
+        hold up ``stats()`` or transcriptions of other models meanwhile.
+        """
+        if self._budget <= 0:
+            return 0, []
+        loaded = self._loaded_bytes_locked()
+        needed += sum(loaded.values())
+        candidates = [
+            (other, self._managers[other], size)
+            for other, size in loaded.items()
+            if other != name
+        ]
+        return needed, candidates
+
+    def _make_room(
+        self, name: str, needed: int, candidates: List[Tuple[str, ParakeetManager, int]]
+    ) -> None:
+        for other, manager, size in candidates:
+            if needed <= self._budget:
+                return
+            if manager.unload():
+                needed -= size
+                with self._lock:
+                    self._stats.setdefault(other, ModelStats()).evictions += 1
+                self._logger.info(
+                    "Evicted model %r (%.0f MiB) to stay within the memory budget",
+                    other,
+                    size / 2**20,
+                )
+            elif not manager.is_loaded:
+                # Evicted by a concurrent caller in the meantime.
+                needed -= size
+        if needed > self._budget:
+            self._logger.warning(
+                "Models in use need %.0f MiB, over the %.0f MiB budget",
+                needed / 2**20,
+                self._budget / 2**20,
+            )
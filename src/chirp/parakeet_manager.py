@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
 import gc
 import logging
+import os
+import queue
 import threading
 import time
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import List, Optional, Sequence, Tuple
 
 import numpy as np
 import onnx_asr
 from onnx_asr.loader import ModelFileNotFoundError, ModelPathNotDirectoryError
 
+from .batching import MAX_BATCH_SECONDS, MAX_BATCH_SIZE, plan_batches
+from .config_manager import OnnxSettings
+from .jobs import TranscriptionJob
+from .long_form import Chunk, merge_transcripts, plan_chunks
+from .model_cache import OptimizedModelCache
+from .scheduler import Scheduler, get_scheduler
+
 try:
     import onnxruntime as ort
 except ImportError:  # pragma: no cover - optional dependency
@@ -19,11 +31,38 @@ except ImportError:  # pragma: no cover - optional dependency
 
 CPU_PROVIDERS: Sequence[str] = ("CPUExecutionProvider",)
 
+_GRAPH_OPTIMIZATION_LEVELS = {
+    "disable": "ORT_DISABLE_ALL",
+    "basic": "ORT_ENABLE_BASIC",
+    "extended": "ORT_ENABLE_EXTENDED",
+    "all": "ORT_ENABLE_ALL",
+}
+_EXECUTION_MODES = {
+    "sequential": "ORT_SEQUENTIAL",
+    "parallel": "ORT_PARALLEL",
+}
+
 
 class ModelNotPreparedError(RuntimeError):
     pass
 
 
+@dataclass(slots=True)
+class ModelMetrics:
+    """Load/unload counters for the primary model session."""
+
+    loads: int = 0
+    unloads: int = 0
+    load_seconds: float = 0.0  # cumulative, including warmup
+    last_load_seconds: float = 0.0
+    unload_seconds: float = 0.0  # cumulative time spent releasing memory
+    last_unload_seconds: float = 0.0
+
+    @property
+    def reloads(self) -> int:
+        return max(0, self.loads - 1)
+
+
 class ParakeetManager:
     def __init__(
         self,
@@ -35,52 +74,277 @@ class ParakeetManager:
         logger: logging.Logger,
         model_dir: Path,
         timeout: float = 300.0,
+        chunk_seconds: float = 0.0,
+        chunk_overlap: float = 1.5,
+        pool_size: int = 1,
+        warmup_seconds: float = 0.0,
+        cache_dir: Optional[Path] = None,
+        onnx_settings: Optional[OnnxSettings] = None,
+        mmap_weights: bool = False,
+        scheduler: Optional[Scheduler] = None,
     ) -> None:
         self._logger = logger
         self._model_name = model_name
         self._quantization = quantization
         self._providers = self._resolve_providers(provider_key)
+        self._threads = threads
+        self._onnx_settings = onnx_settings or OnnxSettings()
         self._session_options = self._build_session_options(threads)
+        self._log_session_options()
         self._model_dir = model_dir
+        # Optimized graphs saved by a previous load; None disables the cache.
+        self._model_cache = (
+            OptimizedModelCache(root=cache_dir, logger=logger) if cache_dir else None
+        )
+        # Load cached weights as read-only file mappings: reloads come from
+        # the page cache and processes loading the same files share pages.
+        self._mmap_weights = mmap_weights
+        if mmap_weights and self._model_cache is None:
+            logger.warning("mmap_weights needs the optimized model cache; ignoring it")
         self._timeout = timeout  # 0 or negative means never unload
+        # Recordings longer than chunk_seconds are decoded window by window.
+        self._chunk_seconds = chunk_seconds
+        self._chunk_overlap = chunk_overlap
+        # Extra sessions that decode chunks of one long recording in parallel.
+        # They are created on first use and dropped together with the model.
+        self._pool_size = pool_size if pool_size > 0 else self.auto_pool_size()
+        self._pool: Optional[queue.SimpleQueue] = None
+        self._pool_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        # A dummy inference right after each load lets ONNX Runtime size its
+        # arenas and pick kernels before the user's first dictation.
+        self._warmup_seconds = warmup_seconds
+        self._first_after_load = False
+        # Background reload started by preload() and its (start, end) times,
+        # used to report how much of it overlapped the recording.
+        self._preload_thread: Optional[threading.Thread] = None
+        self._preload_window: Optional[Tuple[float, float]] = None
         self._last_access = time.time()
+        # _lock is only held briefly: loads run outside it with _loading set,
+        # so preload(), leases and metrics never wait for one to finish.
         self._lock = threading.Lock()
-        self._model = self._load_model()
-        self._stop_monitor = threading.Event()
-        self._monitor_thread: Optional[threading.Thread] = None
-        if self._timeout > 0:
-            self._monitor_thread = threading.Thread(
-                target=self._monitor_loop, daemon=True
-            )
-            self._monitor_thread.start()
+        self._load_done = threading.Condition(self._lock)
+        self._loading = False
+        self._pool_lock = threading.Lock()  # one pool build at a time
+        # A timer on the shared scheduler fires at the unload deadline (last
+        # access + timeout); loads and released leases re-arm it. While any
+        # transcription holds a lease the model is never unloaded.
+        self._scheduler = scheduler or get_scheduler()
+        self._closed = False
+        self._leases = 0
+        self._metrics = ModelMetrics()
+        self._model = None
+        self.ensure_loaded()
 
-    def _monitor_loop(self) -> None:
-        while not self._stop_monitor.is_set():
-            time.sleep(5)
-            with self._lock:
-                should_unload = (
-                    self._model is not None
-                    and self._timeout > 0
-                    and (time.time() - self._last_access > self._timeout)
-                )
-            if should_unload:
-                self._unload_model()
+    @property
+    def metrics(self) -> ModelMetrics:
+        with self._lock:
+            return replace(self._metrics)
+
+    def close(self) -> None:
+        """Cancel the idle-unload timer."""
+        with self._lock:
+            self._closed = True
+            self._scheduler.cancel((self, "unload"))
+
+    def _arm_unload_locked(self) -> None:
+        delay = self._unload_delay_locked()
+        if delay is None or self._closed:
+            # Nothing loaded or a lease is held; the next release re-arms.
+            return
+        self._scheduler.call_later(
+            delay, self._start_idle_unload, name="model-unload", key=(self, "unload")
+        )
+
+    def _start_idle_unload(self) -> None:
+        # Releasing the sessions and collecting can take a while; keep them
+        # off the shared scheduler thread.
+        threading.Thread(target=self._unload_model, name="ModelUnload", daemon=True).start()
+
+    def _unload_delay_locked(self) -> Optional[float]:
+        """Seconds until the model may be unloaded, or None while it cannot be."""
+        if self._model is None or self._leases or self._timeout <= 0:
+            return None
+        return self._last_access + self._timeout - time.time()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._model is not None
+
+    def unload(self) -> bool:
+        """Release the model now unless a transcription is using it."""
+        return self._unload_model(force=True)
+
+    def weights_bytes(self) -> int:
+        """Size of the files the model loads from; an estimate of its memory use.
+
+        On-disk bytes, not resident memory: mapped weights (``mmap_weights``)
+        are shared page cache, and session arenas are not counted.
+        """
+        total = 0
+        for path in self._load_files():
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _unload_model(self, *, force: bool = False) -> bool:
+        with self._lock:
+            if force:
+                if self._model is None or self._leases:
+                    return False
+            else:
+                delay = self._unload_delay_locked()
+                if delay is None or delay > 0:
+                    if delay is not None:
+                        self._arm_unload_locked()  # used again since the timer was set
+                    return False
+            self._logger.info("Unloading Parakeet model to free memory.")
+            model, pool = self._model, self._pool
+            self._model = None
+            self._pool = None
+            # A forced unload leaves the idle timer behind; it must not fire
+            # during a later reload.
+            self._scheduler.cancel((self, "unload"))
+        # Releasing the sessions and collecting happen outside the lock so a
+        # transcription arriving now can start its reload straight away.
+        started = time.perf_counter()
+        del model, pool
+        gc.collect()
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._metrics.unloads += 1
+            self._metrics.unload_seconds += elapsed
+            self._metrics.last_unload_seconds = elapsed
+            unloads = self._metrics.unloads
+        self._logger.debug("Released model memory in %.2fs (unload #%d)", elapsed, unloads)
+        return True
 
-    def _unload_model(self) -> None:
+    def _publish_locked(self, model, elapsed: float) -> None:
+        self._model = model
+        self._first_after_load = True
+        self._metrics.loads += 1
+        self._metrics.load_seconds += elapsed
+        self._metrics.last_load_seconds = elapsed
+        self._arm_unload_locked()
+
+    @contextlib.contextmanager
+    def _lease(self):
         with self._lock:
-            if self._model is not None and (
-                time.time() - self._last_access > self._timeout
-            ):
-                self._logger.info("Unloading Parakeet model to free memory.")
-                self._model = None
-                gc.collect()
+            self._leases += 1
+            self._last_access = time.time()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._leases -= 1
+                # The idle deadline counts from the end of the last use.
+                self._last_access = time.time()
+                self._arm_unload_locked()
 
     def ensure_loaded(self):
+        """The loaded model; loads it, or waits for the load in progress."""
         with self._lock:
-            if self._model is None:
+            while self._model is None and self._loading:
+                self._load_done.wait()
+            if self._model is not None:
+                return self._model
+            self._loading = True
+            if self._metrics.loads:
                 self._logger.info("Reloading Parakeet model...")
-                self._model = self._load_model()
-            return self._model
+        model = None
+        started = time.perf_counter()
+        try:
+            model = self._load_model()
+        finally:
+            with self._lock:
+                self._loading = False
+                if model is not None:
+                    self._publish_locked(model, time.perf_counter() - started)
+                self._load_done.notify_all()
+        return model
+
+    def preload(self) -> bool:
+        """Start reloading an unloaded model in the background.
+
+        Called when a recording starts so the load overlaps with the user
+        speaking instead of following it. Returns True if a reload was started.
+        """
+        with self._lock:
+            self._last_access = time.time()
+            if self._model is not None or self._loading:
+                return False
+            if self._preload_thread is not None and self._preload_thread.is_alive():
+                return False
+            self._preload_thread = threading.Thread(
+                target=self._background_reload, name="ModelPreload", daemon=True
+            )
+            self._preload_thread.start()
+            return True
+
+    def _background_reload(self) -> None:
+        started = time.perf_counter()
+        try:
+            self._prefetch_model_files()
+            self.ensure_loaded()
+        except Exception as exc:  # transcribe() retries and reports the error
+            self._logger.warning("Background model reload failed: %s", exc)
+        self._preload_window = (started, time.perf_counter())
+
+    def _model_files(self) -> List[Path]:
+        """Files in the model directory that belong to the configured variant."""
+        if not self._model_dir.is_dir():
+            return []
+        files = [path for path in sorted(self._model_dir.iterdir()) if path.is_file()]
+        names = {path.name for path in files}
+        selected = []
+        for path in files:
+            stem, onnx, _ = path.name.partition(".onnx")
+            if not onnx:
+                selected.append(path)  # config.json, vocab.txt, ...
+                continue
+            base, _, variant = stem.rpartition(".")
+            if not base:
+                base, variant = stem, ""
+            if variant == (self._quantization or ""):
+                selected.append(path)
+            elif not variant and f"{base}.{self._quantization}.onnx" not in names:
+                selected.append(path)  # shared, unquantised component
+        return selected
+
+    def _load_files(self) -> List[Path]:
+        """Files the next load will read: the cache entry if built, else the originals."""
+        files = self._model_files()
+        if self._model_cache is not None and self._session_options is not None:
+            entry = self._model_cache.lookup(
+                model_name=self._model_name,
+                quantization=self._quantization,
+                source_files=files,
+                session_options=self._session_options,
+                providers=self._providers,
+            )
+            if entry is not None:
+                return sorted(path for path in entry.iterdir() if path.is_file())
+        return files
+
+    def _prefetch_model_files(self) -> int:
+        """Read the model files once so the load itself hits the page cache."""
+        started = time.perf_counter()
+        total = 0
+        buffer = bytearray(8 * 2**20)
+        for path in self._load_files():
+            try:
+                with path.open("rb", buffering=0) as handle:
+                    while read := handle.readinto(buffer):
+                        total += read
+            except OSError as exc:
+                self._logger.debug("Prefetch skipped %s: %s", path.name, exc)
+        self._logger.debug(
+            "Prefetched %.0f MiB of model files in %.2fs",
+            total / 2**20,
+            time.perf_counter() - started,
+        )
+        return total
 
     def _resolve_providers(self, key: str) -> Sequence[str]:
         normalized = key.lower()
@@ -91,7 +355,7 @@ class ParakeetManager:
             )
         return CPU_PROVIDERS
 
-    def _build_session_options(self, threads: Optional[int]):
+    def _build_session_options(self, threads: Optional[int], *, optimize: bool = True):
         if ort is None:
             if threads and threads > 0:
                 self._logger.warning(
@@ -99,16 +363,97 @@ class ParakeetManager:
                 )
             return None
 
+        settings = self._onnx_settings
         options = ort.SessionOptions()
-        # Optimization: Force inter_op_num_threads to 1.
-        # This minimizes overhead for sequential models like Parakeet.
-        options.inter_op_num_threads = 1
+        options.graph_optimization_level = getattr(
+            ort.GraphOptimizationLevel,
+            _GRAPH_OPTIMIZATION_LEVELS[settings.graph_optimization],
+        )
+        options.execution_mode = getattr(
+            ort.ExecutionMode, _EXECUTION_MODES[settings.execution_mode]
+        )
+        # Parakeet's graphs are mostly sequential, so one inter-op thread by
+        # default; only parallel execution mode makes use of more.
+        options.inter_op_num_threads = settings.inter_op_threads
+        options.enable_mem_pattern = settings.enable_mem_pattern
+        options.enable_cpu_mem_arena = settings.enable_cpu_mem_arena
+        # Spinning intra-op threads cut latency between kernels but keep
+        # cores busy while idle; disable on shared machines.
+        options.add_session_config_entry(
+            "session.intra_op.allow_spinning", "1" if settings.allow_spinning else "0"
+        )
+        if settings.flush_denormals:
+            options.add_session_config_entry("session.set_denormal_as_zero", "1")
 
         if threads and threads > 0:
             options.intra_op_num_threads = threads
+            # Affinities name one group per thread after the first, so they
+            # only apply to sessions with the configured thread count.
+            if settings.intra_op_thread_affinities and threads == self._threads:
+                options.add_session_config_entry(
+                    "session.intra_op_thread_affinities",
+                    settings.intra_op_thread_affinities,
+                )
+        if not optimize:
+            # Graphs from the optimized model cache were optimized when saved.
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
         return options
 
-    def _load_model(self):
+    def _log_session_options(self) -> None:
+        if self._session_options is None:
+            return
+        settings = self._onnx_settings
+        self._logger.debug(
+            "ONNX Runtime session: optimization=%s, execution=%s, intra_op_threads=%s, "
+            "inter_op_threads=%d, mem_pattern=%s, cpu_arena=%s, spinning=%s, "
+            "flush_denormals=%s, affinities=%s",
+            settings.graph_optimization,
+            settings.execution_mode,
+            self._threads or "auto",
+            settings.inter_op_threads,
+            settings.enable_mem_pattern,
+            settings.enable_cpu_mem_arena,
+            settings.allow_spinning,
+            settings.flush_denormals,
+            settings.intra_op_thread_affinities or "none",
+        )
+
+    @staticmethod
+    def auto_pool_size() -> int:
+        # One extra session per 8 cores keeps each session's intra-op pool
+        # large enough to stay efficient; capped since every session holds
+        # its own copy of the weights.
+        return max(1, min(4, (os.cpu_count() or 1) // 8))
+
+    def _pool_threads(self) -> int:
+        total = self._threads if self._threads and self._threads > 0 else os.cpu_count()
+        return max(1, (total or 1) // self._pool_size)
+
+    def _ensure_pool(self) -> queue.SimpleQueue:
+        # Called under a lease, so the model (and pool) cannot be unloaded here.
+        with self._pool_lock:
+            with self._lock:
+                if self._pool is not None:
+                    return self._pool
+            per_session = self._pool_threads()
+            self._logger.info(
+                "Creating %d inference sessions (%d threads each) for long-form decoding",
+                self._pool_size,
+                per_session,
+            )
+            options = self._build_session_options(per_session)
+            pool: queue.SimpleQueue = queue.SimpleQueue()
+            for _ in range(self._pool_size):
+                pool.put(self._load_model(options))
+            with self._lock:
+                self._pool = pool
+                if self._pool_executor is None:
+                    self._pool_executor = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self._pool_size, thread_name_prefix="ParakeetPool"
+                    )
+            return pool
+
+    def _load_model(self, session_options=None):
         self._logger.info(
             "Loading Parakeet model %s (quantization=%s, providers=%s)",
             self._model_name,
@@ -116,18 +461,59 @@ class ParakeetManager:
             ",".join(self._providers),
         )
         self._model_dir.mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+        path, options = self._model_source(session_options or self._session_options)
         try:
-            return onnx_asr.load_model(
+            model = onnx_asr.load_model(
                 self._model_name,
-                path=str(self._model_dir),
+                path=str(path),
                 quantization=self._quantization,
                 providers=self._providers,
-                sess_options=self._session_options,
+                sess_options=options,
             )
         except (ModelPathNotDirectoryError, ModelFileNotFoundError) as exc:
             raise ModelNotPreparedError(
                 f"Model not found at {self._model_dir} — run: uv run chirp-setup"
             ) from exc
+        loaded = time.perf_counter()
+        self._warmup(model)
+        self._logger.debug(
+            "Model loaded in %.2fs (warmup %.2fs)",
+            loaded - started,
+            time.perf_counter() - loaded,
+        )
+        return model
+
+    def _model_source(self, session_options) -> Tuple[Path, object]:
+        """Directory and session options to load from, preferring the optimized cache."""
+        if self._model_cache is None or session_options is None:
+            return self._model_dir, session_options
+        cached = self._model_cache.prepare(
+            model_name=self._model_name,
+            quantization=self._quantization,
+            source_files=self._model_files(),
+            session_options=session_options,
+            providers=self._providers,
+        )
+        if cached is None:
+            return self._model_dir, session_options
+        threads = session_options.intra_op_num_threads
+        options = self._build_session_options(threads, optimize=False)
+        if self._mmap_weights:
+            # Pre-packing copies weights into kernel-specific heap buffers,
+            # which would defeat the mapping; it trades some speed for sharing.
+            options.add_session_config_entry("session.disable_prepacking", "1")
+        return cached, options
+
+    def _warmup(self, model) -> None:
+        if self._warmup_seconds <= 0:
+            return
+        # Same zero buffer the --check smoke test uses.
+        dummy = np.zeros(int(16_000 * self._warmup_seconds), dtype=np.float32)
+        try:
+            model.recognize(dummy, sample_rate=16_000)
+        except Exception as exc:  # pragma: no cover - warmup is best effort
+            self._logger.warning("Model warmup failed: %s", exc)
 
     def transcribe(
         self,
@@ -135,14 +521,211 @@ class ParakeetManager:
         *,
         sample_rate: int = 16_000,
         language: Optional[str] = None,
+        job: Optional[TranscriptionJob] = None,
     ) -> str:
-        with self._lock:
-            self._last_access = time.time()
+        """Transcribe one recording.
+
+        With ``job``, the decode stops with ``JobCancelledError`` when the job
+        is cancelled or expires, checked after any reload and between
+        long-form chunks.
+        """
+        with self._lease():
+            return self._transcribe_leased(audio, sample_rate, language, job)
+
+    def transcribe_batch(
+        self,
+        waveforms: Sequence[np.ndarray],
+        *,
+        sample_rate: int = 16_000,
+        language: Optional[str] = None,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_batch_seconds: float = MAX_BATCH_SECONDS,
+    ) -> List[str]:
+        """Transcribe several utterances, decoding similar lengths in one inference.
+
+        Utterances are length-sorted and padded into batches of at most
+        ``max_batch_size`` entries and ``max_batch_seconds`` of padded audio.
+        Ones long enough to be chunked are transcribed on their own.
+        Transcripts are returned in input order.
+        """
+        with self._lease():
+            model = self._acquire_model()
+            flat = [
+                np.asarray(audio).reshape(-1).astype(np.float32, copy=False)
+                for audio in waveforms
+            ]
+            texts = [""] * len(flat)
+            longest = int(self._chunk_seconds * sample_rate) if self._chunk_seconds > 0 else 0
+            batchable: List[int] = []
+            for index, waveform in enumerate(flat):
+                if waveform.size == 0:
+                    continue
+                if longest and waveform.size > longest:
+                    texts[index] = self._transcribe_waveform(
+                        model, waveform, sample_rate, language
+                    )
+                else:
+                    batchable.append(index)
+            self._first_after_load = False
+            batches = plan_batches(
+                [flat[index].size for index in batchable],
+                max_batch_size=max(1, max_batch_size),
+                max_batch_samples=int(max_batch_seconds * sample_rate),
+            )
+            started = time.perf_counter()
+            for batch in batches:
+                indices = [batchable[position] for position in batch]
+                results = model.recognize(
+                    [flat[index] for index in indices],
+                    sample_rate=sample_rate,
+                    language=language,
+                )
+                for index, result in zip(indices, results):
+                    texts[index] = result if isinstance(result, str) else str(result)
+            if batches:
+                self._logger.debug(
+                    "Batched %d utterances into %d inferences in %.2fs",
+                    len(batchable),
+                    len(batches),
+                    time.perf_counter() - started,
+                )
+            return texts
+
+    def _acquire_model(self):
+        """The loaded model, after any background reload from preload() finishes."""
+        wait_started = time.perf_counter()
+        preload = self._preload_thread
+        if preload is not None:
+            preload.join()
+            self._preload_thread = None
         model = self.ensure_loaded()
+        self._report_preload(time.perf_counter() - wait_started)
+        return model
+
+    def _transcribe_leased(
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        language: Optional[str],
+        job: Optional[TranscriptionJob] = None,
+    ) -> str:
+        model = self._acquire_model()
+        if job is not None:
+            job.check()
         if audio.ndim > 1:
             audio = audio.reshape(-1)
         waveform = audio.astype(np.float32, copy=False)
         if waveform.size == 0:
             return ""
+        first_after_load, self._first_after_load = self._first_after_load, False
+        started = time.perf_counter()
+        text = self._transcribe_waveform(model, waveform, sample_rate, language, job)
+        if first_after_load:
+            self._logger.info(
+                "First transcription after model load took %.2fs for %.1fs of audio",
+                time.perf_counter() - started,
+                waveform.size / sample_rate,
+            )
+        return text
+
+    def _report_preload(self, waited: float) -> None:
+        window, self._preload_window = self._preload_window, None
+        if window is None:
+            return
+        total = window[1] - window[0]
+        hidden = max(0.0, total - waited)
+        self._logger.info(
+            "Model reload took %.2fs; %.2fs (%.0f%%) was hidden behind recording",
+            total,
+            hidden,
+            100 * hidden / total if total > 0 else 100,
+        )
+
+    def _transcribe_waveform(
+        self,
+        model,
+        waveform: np.ndarray,
+        sample_rate: int,
+        language: Optional[str],
+        job: Optional[TranscriptionJob] = None,
+    ) -> str:
+        if self._chunk_seconds > 0:
+            chunks = plan_chunks(
+                waveform,
+                sample_rate,
+                chunk_seconds=self._chunk_seconds,
+                overlap_seconds=self._chunk_overlap,
+            )
+            if len(chunks) > 1:
+                return self._transcribe_chunks(
+                    model, waveform, chunks, sample_rate, language, job
+                )
+        return self._recognize(model, waveform, sample_rate, language)
+
+    def _transcribe_chunks(
+        self,
+        model,
+        waveform: np.ndarray,
+        chunks: Sequence[Chunk],
+        sample_rate: int,
+        language: Optional[str],
+        job: Optional[TranscriptionJob] = None,
+    ) -> str:
+        started = time.perf_counter()
+        if self._pool_size > 1:
+            texts = self._recognize_parallel(waveform, chunks, sample_rate, language, job)
+        else:
+            texts = []
+            for chunk in chunks:
+                if job is not None:
+                    job.check()
+                # Slices are views; only one window's activations are alive at a time.
+                texts.append(
+                    self._recognize(
+                        model, waveform[chunk.start : chunk.end], sample_rate, language
+                    )
+                )
+        elapsed = time.perf_counter() - started
+        self._logger.debug(
+            "Long-form: %d chunks (%d overlapped, %d sessions) for %.1fs of audio in %.2fs",
+            len(chunks),
+            sum(chunk.overlaps_previous for chunk in chunks),
+            self._pool_size,
+            waveform.size / sample_rate,
+            elapsed,
+        )
+        return merge_transcripts(texts, chunks)
+
+    def _recognize_parallel(
+        self,
+        waveform: np.ndarray,
+        chunks: Sequence[Chunk],
+        sample_rate: int,
+        language: Optional[str],
+        job: Optional[TranscriptionJob] = None,
+    ) -> list[str]:
+        pool = self._ensure_pool()
+        assert self._pool_executor is not None
+
+        def _run(chunk: Chunk) -> str:
+            if job is not None:
+                job.check()
+            session = pool.get()
+            try:
+                return self._recognize(
+                    session, waveform[chunk.start : chunk.end], sample_rate, language
+                )
+            finally:
+                pool.put(session)
+
+        # ORT releases the GIL during Run, so sessions decode concurrently;
+        # map() yields results in chunk order regardless of completion order
+        # and cancels the chunks not yet started if one raises.
+        return list(self._pool_executor.map(_run, chunks))
+
+    @staticmethod
+    def _recognize(
+        model, waveform: np.ndarray, sample_rate: int, language: Optional[str]
+    ) -> str:
         result = model.recognize(waveform, sample_rate=sample_rate, language=language)
         return result if isinstance(result, str) else str(result)
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+# Default capacity of each stage's input queue.
+QUEUE_SIZE = 4
+# Queue entry that ends a stage thread.
+_STOP = object()
+# Stands in for an item an earlier stage finished early, so later stages
+# still see every sequence number.
+_GONE = object()
+
+
+@dataclass(slots=True)
+class StageStats:
+    processed: int = 0  # items the stage finished, including dropped ones
+    dropped: int = 0  # items the stage ended early by returning None
+    failed: int = 0
+    service_seconds: float = 0.0  # cumulative time in the stage function
+    wait_seconds: float = 0.0  # cumulative time items waited in the input queue
+    depth: int = 0  # items in the input queue when the snapshot was taken
+    max_depth: int = 0
+    reordered: int = 0  # items held back until an earlier one finished
+
+    @property
+    def mean_service(self) -> float:
+        return self.service_seconds / self.processed if self.processed else 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.wait_seconds / self.processed if self.processed else 0.0
+
+
+@dataclass(slots=True)
+class Stage:
+    """One pipeline step.
+
+    ``fn(item)`` returns the item for the next stage, or None to finish it
+    early (e.g. no speech). With ``workers`` > 1 that many threads call
+    ``fn`` concurrently, so it must be thread-safe.
+
+    Under the asyncio core (``AsyncPipeline``) stages run on the event loop:
+    ``blocking`` ones are sent to an executor instead, and ``coro``, when
+    given, is awaited in place of ``fn``.
+    """
+
+    name: str
+    fn: Callable[[Any], Any]
+    workers: int = 1
+    blocking: bool = False
+    coro: Optional[Callable[[Any], Awaitable[Any]]] = None
+
+
+def format_stats(stats: Dict[str, StageStats]) -> str:
+    return ", ".join(
+        f"{name} {stage.mean_wait * 1000:.1f}/{stage.mean_service * 1000:.1f} ms "
+        f"(depth {stage.depth}, max {stage.max_depth})"
+        for name, stage in stats.items()
+    )
+
+
+class _Sequencer:
+    """Reorder buffer: releases items in sequence order."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self._next = 0
+        self._held: Dict[int, Any] = {}
+
+    def release(self, seq: int, item: Any) -> List[Any]:
+        """Hold ``item`` until every earlier one is released; call with ``lock`` held.
+
+        Returns the items that are now in order, possibly none.
+        """
+        self._held[seq] = item
+        ready = []
+        while self._next in self._held:
+            ready.append(self._held.pop(self._next))
+            self._next += 1
+        return ready
+
+
+class Pipeline:
+    """Stages connected by bounded queues, each served by its own thread.
+
+    Items leave every stage in submission order. A stage with several
+    workers decodes items concurrently, and a reorder buffer holds the ones
+    that finish early until those ahead of them are done. When a stage's
+    queue is full the stage before it blocks, so a slow stage pushes back
+    to ``submit()`` instead of letting work pile up. Each stage records its
+    queue depth, wait time and service time.
+
+    ``on_done(item, error)`` is called once per item when it leaves the
+    pipeline: after the last stage, when a stage returns None, or with the
+    exception a stage raised. ``run()`` pushes one item through the same
+    stages on the calling thread.
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[Stage],
+        *,
+        queue_size: int = QUEUE_SIZE,
+        on_done: Optional[Callable[[Any, Optional[BaseException]], None]] = None,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        if not stages:
+            raise ValueError("a pipeline needs at least one stage")
+        self._stages = list(stages)
+        self._on_done = on_done
+        self._logger = logger or logging.getLogger("chirp")
+        self._queues: List[queue.Queue] = [
+            queue.Queue(maxsize=max(1, queue_size)) for _ in self._stages
+        ]
+        self._sequencers = [_Sequencer() for _ in self._stages]
+        self._stats = {stage.name: StageStats() for stage in self._stages}
+        self._stats_lock = threading.Lock()
+        self._submit_lock = threading.Lock()
+        self._next_seq = 0
+        # One list of worker threads per stage.
+        self._threads: List[List[threading.Thread]] = []
+        for index, stage in enumerate(self._stages):
+            workers = max(1, stage.workers)
+            self._threads.append(
+                [
+                    threading.Thread(
+                        target=self._serve,
+                        args=(index,),
+                        name=f"Stage-{stage.name}" if workers == 1 else f"Stage-{stage.name}-{n}",
+                        daemon=True,
+                    )
+                    for n in range(workers)
+                ]
+            )
+        for threads in self._threads:
+            for thread in threads:
+                thread.start()
+
+    @property
+    def stage_names(self) -> List[str]:
+        return [stage.name for stage in self._stages]
+
+    def submit(self, item: Any) -> None:
+        """Queue ``item`` for the first stage, waiting while its queue is full."""
+        with self._submit_lock:
+            entry = (time.perf_counter(), self._next_seq, item)
+            try:
+                self._queues[0].put_nowait(entry)
+            except queue.Full:
+                self._logger.warning(
+                    "Pipeline stage %r is backed up; waiting to queue", self._stages[0].name
+                )
+                self._queues[0].put(entry)
+            self._next_seq += 1
+        self._note_depth(0)
+
+    def run(self, item: Any) -> Any:
+        """Run ``item`` through every stage on this thread; returns the final item.
+
+        Returns None if a stage dropped it; exceptions are raised after
+        ``on_done`` has seen them.
+        """
+        for index in range(len(self._stages)):
+            try:
+                result = self._call(index, item, queued_at=None)
+            except Exception as exc:
+                self._finish(item, exc)
+                raise
+            if result is None:
+                self._finish(item, None)
+                return None
+            item = result
+        self._finish(item, None)
+        return item
+
+    def join(self) -> None:
+        """Wait until every submitted item has left the pipeline."""
+        # An item is put on the next queue before it is marked done on this one.
+        for stage_queue in self._queues:
+            stage_queue.join()
+
+    def stats(self) -> Dict[str, StageStats]:
+        with self._stats_lock:
+            snapshot = {name: replace(stats) for name, stats in self._stats.items()}
+        for stage, stage_queue in zip(self._stages, self._queues):
+            snapshot[stage.name].depth = stage_queue.qsize()
+        return snapshot
+
+    def summary(self) -> str:
+        """One line of mean wait/service times per stage, for logs."""
+        return format_stats(self.stats())
+
+    def close(self) -> None:
+        """Finish queued items, then stop the stage threads."""
+        for stage_queue, threads in zip(self._queues, self._threads):
+            for _ in threads:
+                stage_queue.put((time.perf_counter(), -1, _STOP))
+            for thread in threads:
+                thread.join()
+
+    def _serve(self, index: int) -> None:
+        stage_queue = self._queues[index]
+        while True:
+            queued_at, seq, item = stage_queue.get()
+            try:
+                if item is _STOP:
+                    return
+                if item is _GONE:
+                    self._forward(index, seq, _GONE)
+                    continue
+                try:
+                    result = self._call(index, item, queued_at=queued_at)
+                except Exception as exc:
+                    self._finish(item, exc)
+                    result = _GONE
+                else:
+                    if result is None:
+                        self._finish(item, None)
+                        result = _GONE
+                self._forward(index, seq, result)
+            finally:
+                stage_queue.task_done()
+
+    def _forward(self, index: int, seq: int, result: Any) -> None:
+        """Pass ``result`` to the next stage, or finish it, in sequence order."""
+        sequencer = self._sequencers[index]
+        last = index == len(self._stages) - 1
+        with sequencer.lock:
+            ready = sequencer.release(seq, (seq, result))
+            if not ready:
+                with self._stats_lock:
+                    self._stats[self._stages[index].name].reordered += 1
+            for ready_seq, item in ready:
+                if last:
+                    if item is not _GONE:
+                        self._finish(item, None)
+                    continue
+                self._queues[index + 1].put((time.perf_counter(), ready_seq, item))
+                self._note_depth(index + 1)
+
+    def _call(self, index: int, item: Any, *, queued_at: Optional[float]) -> Any:
+        stage = self._stages[index]
+        started = time.perf_counter()
+        failed = False
+        result = None
+        try:
+            result = stage.fn(item)
+            return result
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._stats_lock:
+                stats = self._stats[stage.name]
+                stats.processed += 1
+                stats.service_seconds += elapsed
+                if queued_at is not None:
+                    stats.wait_seconds += started - queued_at
+                if failed:
+                    stats.failed += 1
+                elif result is None:
+                    stats.dropped += 1
+
+    def _note_depth(self, index: int) -> None:
+        depth = self._queues[index].qsize()
+        with self._stats_lock:
+            stats = self._stats[self._stages[index].name]
+            stats.max_depth = max(stats.max_depth, depth)
+
+    def _finish(self, item: Any, error: Optional[BaseException]) -> None:
+        if self._on_done is not None:
+            try:
+                self._on_done(item, error)
+            except Exception:  # a broken callback must not stop the stage thread
+                self._logger.exception("Pipeline completion callback failed")
+        elif error is not None:
+            self._logger.error("Pipeline item failed: %s", error, exc_info=error)
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+@dataclass(slots=True)
+class SchedulerStats:
+    scheduled: int = 0
+    fired: int = 0
+    cancelled: int = 0
+    coalesced: int = 0  # timers replaced by a newer one with the same key
+    failed: int = 0
+    max_lateness_seconds: float = 0.0  # worst delay between deadline and firing
+
+
+@dataclass(frozen=True, slots=True)
+class PendingTimer:
+    name: str
+    remaining: float  # seconds until it fires
+
+
+class TimerHandle:
+    """A scheduled call; ``cancel()`` stops it if it has not fired yet."""
+
+    __slots__ = ("name", "deadline", "key", "_fn", "_args", "_scheduler", "_done")
+
+    def __init__(
+        self,
+        scheduler: "Scheduler",
+        deadline: float,
+        fn: Callable[..., Any],
+        args: Tuple[Any, ...],
+        name: str,
+        key: Optional[Hashable],
+    ) -> None:
+        self.name = name
+        self.deadline = deadline  # time.monotonic() value
+        self.key = key
+        self._fn = fn
+        self._args = args
+        self._scheduler = scheduler
+        self._done = False
+
+    @property
+    def pending(self) -> bool:
+        return not self._done
+
+    def cancel(self) -> bool:
+        """Cancel the call; False if it already fired or was cancelled."""
+        return self._scheduler._cancel(self)
+
+
+class Scheduler:
+    """One thread that runs timed calls at their deadlines.
+
+    Timers live in a heap ordered by deadline; the thread sleeps until the
+    earliest one is due, so there is no polling and no thread per timer.
+    Scheduling with a ``key`` replaces the pending timer with the same key,
+    which coalesces re-arming (idle deadlines, clipboard clears) into one
+    entry. Callbacks run on the scheduler thread and should be short.
+    """
+
+    def __init__(self, *, logger: Optional[logging.Logger] = None) -> None:
+        self._logger = logger or logging.getLogger("chirp")
+        self._heap: List[Tuple[float, int, TimerHandle]] = []
+        self._keys: Dict[Hashable, TimerHandle] = {}
+        self._dead = 0  # cancelled or replaced entries still in the heap
+        self._counter = itertools.count()
+        self._stats = SchedulerStats()
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def call_later(
+        self,
+        delay: float,
+        fn: Callable[..., Any],
+        *args: Any,
+        name: str = "",
+        key: Optional[Hashable] = None,
+    ) -> TimerHandle:
+        """Run ``fn(*args)`` once ``delay`` seconds have passed."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("scheduler is closed")
+            handle = TimerHandle(
+                self, time.monotonic() + max(0.0, delay), fn, args, name or fn.__name__, key
+            )
+            if key is not None:
+                previous = self._keys.get(key)
+                if previous is not None and not previous._done:
+                    previous._done = True
+                    self._dead += 1
+                    self._stats.coalesced += 1
+                self._keys[key] = handle
+            if self._dead > 32 and self._dead * 2 > len(self._heap):
+                self._heap = [entry for entry in self._heap if not entry[2]._done]
+                heapq.heapify(self._heap)
+                self._dead = 0
+            heapq.heappush(self._heap, (handle.deadline, next(self._counter), handle))
+            self._stats.scheduled += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="Scheduler", daemon=True
+                )
+                self._thread.start()
+            elif self._heap[0][2] is handle:
+                self._wake.notify()  # new earliest deadline
+            return handle
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancel the pending timer scheduled with ``key``, if any."""
+        with self._lock:
+            handle = self._keys.get(key)
+        return handle is not None and handle.cancel()
+
+    def pending(self) -> List[PendingTimer]:
+        """Timers still to fire, earliest first."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                PendingTimer(handle.name, max(0.0, deadline - now))
+                for deadline, _, handle in sorted(self._heap)
+                if not handle._done
+            ]
+
+    def stats(self) -> SchedulerStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def close(self) -> None:
+        """Drop pending timers and stop the thread."""
+        with self._lock:
+            self._closed = True
+            for _, _, handle in self._heap:
+                handle._done = True
+            self._heap.clear()
+            self._keys.clear()
+            self._dead = 0
+            self._wake.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _cancel(self, handle: TimerHandle) -> bool:
+        with self._lock:
+            if handle._done:
+                return False
+            # Left in the heap and skipped when it comes up.
+            handle._done = True
+            self._dead += 1
+            if handle.key is not None and self._keys.get(handle.key) is handle:
+                del self._keys[handle.key]
+            self._stats.cancelled += 1
+            return True
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                handle = self._next_due_locked()
+                if handle is None:
+                    return
+                lateness = time.monotonic() - handle.deadline
+                self._stats.fired += 1
+                self._stats.max_lateness_seconds = max(
+                    self._stats.max_lateness_seconds, lateness
+                )
+            try:
+                handle._fn(*handle._args)
+            except Exception as exc:  # keep the other timers running
+                with self._lock:
+                    self._stats.failed += 1
+                self._logger.exception("Timer %s failed: %s", handle.name, exc)
+
+    def _next_due_locked(self) -> Optional[TimerHandle]:
+        """Wait for the earliest timer and claim it; None once closed."""
+        while not self._closed:
+            while self._heap and self._heap[0][2]._done:
+                heapq.heappop(self._heap)
+                self._dead -= 1
+            if not self._heap:
+                self._wake.wait()
+                continue
+            delay = self._heap[0][0] - time.monotonic()
+            if delay > 0:
+                self._wake.wait(delay)
+                continue
+            _, _, handle = heapq.heappop(self._heap)
+            handle._done = True
+            if handle.key is not None and self._keys.get(handle.key) is handle:
+                del self._keys[handle.key]
+            return handle
+        return None
+
+
+_shared: Optional[Scheduler] = None
+_shared_lock = threading.Lock()
+
+
+def get_scheduler() -> Scheduler:
+    """The process-wide scheduler, created on first use."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = Scheduler()
+        return _shared
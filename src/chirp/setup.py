@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import argparse
+import logging
 from pathlib import Path
+from typing import Optional, Sequence
 
 from huggingface_hub import snapshot_download
 
 from .config_manager import ConfigManager
+from .logger import get_logger
 
 
 REPO_MAP = {
@@ -23,11 +27,49 @@ def _resolve_repo(model_name: str) -> str:
     return repo
 
 
-def main() -> None:
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Download the Chirp model or tune it for this CPU")
+    parser.add_argument(
+        "--tune",
+        action="store_true",
+        help="Benchmark thread counts, quantization and session options and save the fastest as this CPU's tuning profile",
+    )
+    parser.add_argument(
+        "--corpus",
+        type=Path,
+        help="Directory of 16 kHz WAV files (with optional .txt transcripts) to tune on; defaults to a synthetic speed-only corpus",
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Timed passes over the corpus per setting")
+    parser.add_argument(
+        "--max-wer-delta",
+        type=float,
+        default=0.02,
+        help="Largest word error rate increase over the most accurate setting that may still be chosen",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = _build_parser().parse_args(argv)
     config_manager = ConfigManager()
+    if args.tune:
+        # Tune from the file's own settings, not from a previous profile.
+        config_manager.disable_tuning_profile()
+        _tune(config_manager, args)
+        return
     config = config_manager.load()
-    model_dir = config_manager.model_dir(config.parakeet_model, config.parakeet_quantization)
-    repo_id = _resolve_repo(config.parakeet_model)
+    # The default model plus any [models.<name>] variants, each downloaded once.
+    variants = {(config.parakeet_model, config.parakeet_quantization)}
+    for name in config.models:
+        spec = config.model_spec(name)
+        variants.add((spec.model, spec.quantization))
+    for model_name, quantization in sorted(variants, key=str):
+        _download(config_manager, model_name, quantization)
+
+
+def _download(config_manager: ConfigManager, model_name: str, quantization: Optional[str]) -> None:
+    model_dir = config_manager.model_dir(model_name, quantization)
+    repo_id = _resolve_repo(model_name)
 
     if _model_ready(model_dir):
         print(f"Model already present at {model_dir}")
@@ -38,5 +80,37 @@ def main() -> None:
     print(f"Downloaded model snapshot to {model_dir}")
 
 
+def _tune(config_manager: ConfigManager, args: argparse.Namespace) -> None:
+    from .parakeet_manager import ModelNotPreparedError
+    from .tuning import Tuner, load_corpus
+
+    config = config_manager.load()
+    waveforms, references = load_corpus(args.corpus)
+    print(
+        f"Tuning on {len(waveforms)} recordings "
+        f"({'with' if references else 'without'} reference transcripts)"
+    )
+    tuner = Tuner(
+        config=config,
+        config_manager=config_manager,
+        waveforms=waveforms,
+        references=references,
+        repeats=args.repeats,
+        max_wer_delta=args.max_wer_delta,
+        logger=get_logger(level=logging.WARNING),
+    )
+    try:
+        profile = tuner.run()
+    except ModelNotPreparedError as exc:
+        raise SystemExit(str(exc)) from exc
+    if profile is None:
+        raise SystemExit("No setting stayed within the accuracy limit; profile not written.")
+    path = config_manager.tuning_profile_path
+    profile.save(path)
+    settings = ", ".join(f"{key}={value}" for key, value in profile.settings.items())
+    print(f"Best: {settings}")
+    print(f"Wrote tuning profile {path} (disable with use_tuning_profile = false)")
+
+
 if __name__ == "__main__":  # pragma: no cover
     main()
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 import sys
-import threading
 import time
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 
 import pyperclip
 
 from .keyboard_shortcuts import KeyboardShortcutManager
+from .scheduler import Scheduler, get_scheduler
 
 
 @dataclass(slots=True)
@@ -71,6 +72,7 @@ class TextInjector:
         post_processing: str,
         clipboard_behavior: bool,
         clipboard_clear_delay: float,
+        scheduler: Optional[Scheduler] = None,
     ) -> None:
         self._keyboard = keyboard_manager
         self._logger = logger
@@ -80,6 +82,7 @@ class TextInjector:
         self._style = StyleGuide.from_prompt(post_processing)
         self._clipboard_behavior = clipboard_behavior
         self._clipboard_clear_delay = max(0.1, clipboard_clear_delay)
+        self._scheduler = scheduler or get_scheduler()
 
     def process(self, text: str) -> str:
         # Sanitize input: remove non-printable characters (e.g. control codes) to prevent injection
@@ -103,10 +106,22 @@ class TextInjector:
         return result.strip() if strip_text else result
 
     def inject(self, text: str) -> None:
-        processed = self.process(text)
+        self.paste(self.process(text))
 
+    def paste(self, processed: str) -> None:
+        """Paste text that already went through ``process()`` into the focused window."""
+        for delay in self._paste_steps(processed):
+            time.sleep(delay)
+
+    async def paste_async(self, processed: str) -> None:
+        """``paste()`` for an event loop: the waits yield instead of blocking it."""
+        for delay in self._paste_steps(processed):
+            await asyncio.sleep(delay)
+
+    def _paste_steps(self, processed: str) -> Iterator[float]:
+        """Perform the paste, yielding each delay the caller must wait out."""
         if sys.platform.startswith("win"):
-            time.sleep(0.12)  # Brief delay for focus settling
+            yield 0.12  # Brief delay for focus settling
             from .win_clipboard import (
                 _save_all_formats,
                 _set_clipboard_text,
@@ -130,7 +145,7 @@ class TextInjector:
                 return
 
             # Give the target app time to process the paste
-            time.sleep(0.5)
+            yield 0.5
 
             # Restore previous clipboard contents
             if saved:
@@ -149,7 +164,7 @@ class TextInjector:
         ) as exc:  # pragma: no cover - clipboard edge cases
             self._logger.error("Clipboard copy failed: %s", exc)
             return
-        time.sleep(0.12)
+        yield 0.12
         try:
             combo = "ctrl+v" if self._paste_mode == "ctrl" else "ctrl+shift+v"
             self._keyboard.send(combo)
@@ -165,9 +180,10 @@ class TextInjector:
             except pyperclip.PyperclipException:
                 pass
 
-        timer = threading.Timer(self._clipboard_clear_delay, _clear)
-        timer.daemon = True
-        timer.start()
+        # Pastes in quick succession share one clear, after the last of them.
+        self._scheduler.call_later(
+            self._clipboard_clear_delay, _clear, name="clipboard-clear", key=(self, "clear")
+        )
 
     def _apply_word_overrides(self, text: str) -> str:
         if not self._override_pattern:
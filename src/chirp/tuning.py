@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import gc
+import logging
+import os
+import re
+import time
+import wave
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .config_manager import ChirpConfig, ConfigManager, OnnxSettings
+from .parakeet_manager import ModelNotPreparedError, ParakeetManager
+from .tuning_profile import TuningProfile, cpu_key
+
+SAMPLE_RATE = 16_000
+# Session-option variants tried on top of the best thread count. Keys are
+# OnnxSettings fields; the empty dict is the configured baseline.
+SESSION_VARIANTS: Sequence[Dict[str, Any]] = (
+    {},
+    {"allow_spinning": True},
+    {"allow_spinning": False},
+    {"flush_denormals": True},
+    {"graph_optimization": "extended"},
+    {"enable_cpu_mem_arena": False},
+)
+# Fixed synthetic corpus used when no recordings are supplied (seconds, seed).
+SYNTHETIC_CORPUS: Sequence[Tuple[float, int]] = ((3.0, 1), (8.0, 2), (20.0, 3))
+
+
+@dataclass(frozen=True, slots=True)
+class Candidate:
+    threads: int
+    quantization: Optional[str]
+    onnx: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def label(self) -> str:
+        extras = ",".join(f"{key}={value}" for key, value in sorted(self.onnx.items()))
+        return f"{self.quantization or 'fp32'} threads={self.threads}" + (
+            f" {extras}" if extras else ""
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Measurement:
+    candidate: Candidate
+    rtf: float
+    p95_latency: float
+    wer: float  # against the reference transcripts; 0 when there are none
+    texts: Tuple[str, ...] = ()
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Word-level Levenshtein distance divided by the reference length."""
+    ref = re.findall(r"[\w']+", reference.lower())
+    hyp = re.findall(r"[\w']+", hypothesis.lower())
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    row = list(range(len(hyp) + 1))
+    for i, word in enumerate(ref, 1):
+        diagonal, row[0] = row[0], i
+        for j, other in enumerate(hyp, 1):
+            diagonal, row[j] = row[j], min(
+                row[j] + 1, row[j - 1] + 1, diagonal + (word != other)
+            )
+    return row[-1] / len(ref)
+
+
+def corpus_wer(references: Sequence[str], hypotheses: Sequence[str]) -> float:
+    """Word error rate over a corpus, weighted by reference length."""
+    words = sum(len(re.findall(r"[\w']+", ref)) for ref in references)
+    errors = sum(
+        word_error_rate(ref, hyp) * len(re.findall(r"[\w']+", ref))
+        for ref, hyp in zip(references, hypotheses)
+    )
+    return errors / words if words else 0.0
+
+
+def thread_grid(cpu_count: Optional[int] = None) -> List[int]:
+    """Powers of two up to the logical core count, plus the core count itself."""
+    count = cpu_count or os.cpu_count() or 1
+    grid = {count}
+    threads = 1
+    while threads < count:
+        grid.add(threads)
+        threads *= 2
+    return sorted(grid)
+
+
+def choose(
+    measurements: Sequence[Measurement], *, baseline_wer: float, max_wer_delta: float
+) -> Optional[Measurement]:
+    """Fastest measurement (lowest RTF, then p95) within the accuracy limit."""
+    eligible = [m for m in measurements if m.wer <= baseline_wer + max_wer_delta]
+    if not eligible:
+        return None
+    return min(eligible, key=lambda m: (m.rtf, m.p95_latency))
+
+
+def load_corpus(directory: Optional[Path]) -> Tuple[List[np.ndarray], List[str]]:
+    """Recordings (and ``.txt`` reference transcripts, if any) for tuning.
+
+    ``directory`` holds 16 kHz mono 16-bit WAV files. Without it a fixed
+    synthetic corpus is used, which measures speed only.
+    """
+    if directory is None:
+        from_seed = [_synthetic_speech(seconds, seed) for seconds, seed in SYNTHETIC_CORPUS]
+        return from_seed, []
+    waveforms: List[np.ndarray] = []
+    references: List[str] = []
+    paths = sorted(directory.glob("*.wav"))
+    if not paths:
+        raise SystemExit(f"No .wav files found in {directory}")
+    for path in paths:
+        waveforms.append(_read_wav(path))
+        text = path.with_suffix(".txt")
+        references.append(text.read_text(encoding="utf-8").strip() if text.exists() else "")
+    if not all(references):
+        references = []  # partial labels would skew the WER; compare outputs instead
+    return waveforms, references
+
+
+def _read_wav(path: Path) -> np.ndarray:
+    with wave.open(str(path), "rb") as handle:
+        if handle.getframerate() != SAMPLE_RATE or handle.getsampwidth() != 2:
+            raise SystemExit(f"{path.name}: expected 16 kHz 16-bit PCM audio")
+        frames = handle.readframes(handle.getnframes())
+        channels = handle.getnchannels()
+    audio = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+    return audio.reshape(-1, channels).mean(axis=1) if channels > 1 else audio
+
+
+def _synthetic_speech(seconds: float, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    samples = int(seconds * SAMPLE_RATE)
+    t = np.arange(samples, dtype=np.float32) / SAMPLE_RATE
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 4.0 * t))
+    envelope[(t % 3.0) > 2.6] = 0.0
+    return (0.1 * envelope * rng.standard_normal(samples)).astype(np.float32)
+
+
+class Tuner:
+    """Grid search over threads, quantization and session options.
+
+    The search is staged to keep the number of model loads small: for each
+    downloaded quantization it finds the best thread count with the
+    configured session options, then tries ``SESSION_VARIANTS`` at the
+    overall best thread count and quantization.
+    """
+
+    def __init__(
+        self,
+        *,
+        config: ChirpConfig,
+        config_manager: ConfigManager,
+        waveforms: Sequence[np.ndarray],
+        references: Sequence[str],
+        repeats: int = 3,
+        max_wer_delta: float = 0.02,
+        logger: logging.Logger,
+        report: Callable[[str], None] = print,
+    ) -> None:
+        self._config = config
+        self._config_manager = config_manager
+        self._waveforms = list(waveforms)
+        self._references = list(references)
+        self._repeats = max(1, repeats)
+        self._max_wer_delta = max_wer_delta
+        self._logger = logger
+        self._report = report
+
+    def quantizations(self) -> List[Optional[str]]:
+        """Model variants that are downloaded and can be compared."""
+        found = []
+        for quantization in ("int8", None):
+            model_dir = self._config_manager.model_dir(self._config.parakeet_model, quantization)
+            if (model_dir / "config.json").exists() and any(model_dir.glob("*.onnx")):
+                found.append(quantization)
+        return found
+
+    def run(self) -> Optional[TuningProfile]:
+        quantizations = self.quantizations()
+        if not quantizations:
+            raise ModelNotPreparedError("No downloaded model found — run: uv run chirp-setup")
+        if len(quantizations) == 1:
+            self._report(
+                f"Only the {quantizations[0] or 'fp32'} model is downloaded; set "
+                "parakeet_quantization and run chirp-setup to compare the other variant."
+            )
+
+        measurements: List[Measurement] = []
+        for quantization in quantizations:
+            for threads in thread_grid():
+                measurements.append(self.measure(Candidate(threads, quantization)))
+
+        # Outputs of the most precise variant stand in for missing labels.
+        if not self._references:
+            reference = next(
+                m for m in measurements if m.candidate.quantization == quantizations[-1]
+            )
+            self._references = list(reference.texts)
+            measurements = [self._rescore(m) for m in measurements]
+        if not self._has_speech():
+            self._report(
+                "Reference transcripts are empty (synthetic corpus?); accuracy can't be "
+                "compared, so the configured quantization is kept."
+            )
+            measurements = [
+                m
+                for m in measurements
+                if m.candidate.quantization == self._config.parakeet_quantization
+            ] or measurements
+
+        baseline_wer = min(m.wer for m in measurements)
+        best = choose(measurements, baseline_wer=baseline_wer, max_wer_delta=self._max_wer_delta)
+        if best is None:
+            return None
+        for variant in SESSION_VARIANTS[1:]:
+            measurements.append(
+                self.measure(Candidate(best.candidate.threads, best.candidate.quantization, variant))
+            )
+        best = choose(measurements, baseline_wer=baseline_wer, max_wer_delta=self._max_wer_delta)
+        if best is None:  # pragma: no cover - the earlier best stays eligible
+            return None
+        return self._profile(best, measurements)
+
+    def measure(self, candidate: Candidate) -> Measurement:
+        onnx = OnnxSettings(**{**asdict(self._config.onnx), **candidate.onnx})
+        # Affinities are tied to the configured thread count.
+        onnx.intra_op_thread_affinities = ""
+        manager = ParakeetManager(
+            model_name=self._config.parakeet_model,
+            quantization=candidate.quantization,
+            provider_key=self._config.onnx_providers,
+            threads=candidate.threads,
+            logger=self._logger,
+            model_dir=self._config_manager.model_dir(
+                self._config.parakeet_model, candidate.quantization
+            ),
+            timeout=0,
+            chunk_seconds=self._config.long_form_chunk_seconds,
+            chunk_overlap=self._config.long_form_overlap_seconds,
+            warmup_seconds=self._config.model_warmup_seconds,
+            onnx_settings=onnx,
+        )
+        try:
+            texts = [self._transcribe(manager, audio) for audio in self._waveforms]
+            latencies = []
+            for _ in range(self._repeats):
+                for audio in self._waveforms:
+                    started = time.perf_counter()
+                    self._transcribe(manager, audio)
+                    latencies.append(time.perf_counter() - started)
+        finally:
+            manager.close()
+            del manager
+            gc.collect()
+        audio_seconds = sum(audio.size for audio in self._waveforms) / SAMPLE_RATE
+        measurement = Measurement(
+            candidate=candidate,
+            rtf=sum(latencies) / (audio_seconds * self._repeats),
+            p95_latency=float(np.percentile(latencies, 95)),
+            wer=corpus_wer(self._references, texts) if self._references else 0.0,
+            texts=tuple(texts),
+        )
+        self._report(
+            f"  {candidate.label:<48} RTF {measurement.rtf:.3f}  "
+            f"p95 {measurement.p95_latency * 1000:6.0f} ms  WER {measurement.wer:.3f}"
+        )
+        return measurement
+
+    def _transcribe(self, manager: ParakeetManager, audio: np.ndarray) -> str:
+        return manager.transcribe(audio, sample_rate=SAMPLE_RATE, language=self._config.language)
+
+    def _rescore(self, measurement: Measurement) -> Measurement:
+        return Measurement(
+            candidate=measurement.candidate,
+            rtf=measurement.rtf,
+            p95_latency=measurement.p95_latency,
+            wer=corpus_wer(self._references, measurement.texts),
+            texts=measurement.texts,
+        )
+
+    def _has_speech(self) -> bool:
+        return any(reference.strip() for reference in self._references)
+
+    def _profile(self, best: Measurement, measurements: Sequence[Measurement]) -> TuningProfile:
+        settings: Dict[str, Any] = {
+            "threads": best.candidate.threads,
+            "parakeet_quantization": best.candidate.quantization,
+        }
+        if best.candidate.onnx:
+            settings["onnx"] = dict(best.candidate.onnx)
+        return TuningProfile(
+            cpu=cpu_key(),
+            settings=settings,
+            results=[
+                {
+                    "candidate": m.candidate.label,
+                    "rtf": round(m.rtf, 4),
+                    "p95_latency": round(m.p95_latency, 4),
+                    "wer": round(m.wer, 4),
+                }
+                for m in measurements
+            ],
+        )
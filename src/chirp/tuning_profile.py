@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import os
+import platform
+import re
+import subprocess
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+PROFILE_VERSION = 1
+
+
+def cpu_model() -> str:
+    """Human-readable CPU name, best effort per platform."""
+    system = platform.system()
+    try:
+        if system == "Windows":
+            import winreg
+
+            with winreg.OpenKey(
+                winreg.HKEY_LOCAL_MACHINE,
+                r"HARDWARE\DESCRIPTION\System\CentralProcessor\0",
+            ) as key:
+                return str(winreg.QueryValueEx(key, "ProcessorNameString")[0]).strip()
+        if system == "Darwin":
+            return subprocess.run(
+                ["sysctl", "-n", "machdep.cpu.brand_string"],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        with open("/proc/cpuinfo", encoding="utf-8") as handle:
+            for line in handle:
+                if line.lower().startswith(("model name", "hardware", "cpu model")):
+                    return line.split(":", 1)[1].strip()
+    except (OSError, subprocess.SubprocessError):
+        pass
+    return platform.processor() or platform.machine() or "unknown-cpu"
+
+
+def cpu_key() -> str:
+    """File-name-safe key for this CPU model and logical core count."""
+    slug = re.sub(r"[^a-z0-9]+", "-", cpu_model().lower()).strip("-") or "cpu"
+    return f"{slug[:80]}-{os.cpu_count() or 1}t"
+
+
+@dataclass(kw_only=True, slots=True)
+class TuningProfile:
+    """Settings chosen by ``chirp-setup --tune`` for one CPU model."""
+
+    cpu: str
+    settings: Dict[str, Any]
+    created: float = field(default_factory=time.time)
+    version: int = PROFILE_VERSION
+    results: List[Dict[str, Any]] = field(default_factory=list)
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(asdict(self), indent=2) + "\n", encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["TuningProfile"]:
+        """The profile at ``path`` if it exists, matches this CPU and parses."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            profile = cls(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+        if profile.version != PROFILE_VERSION or profile.cpu != cpu_key():
+            return None
+        return profile
+
+    def apply(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """``data`` (raw config.toml contents) with the tuned settings on top.
+
+        Pinned intra-op affinities need one group per thread after the
+        first, so they are dropped when the tuned ``threads`` no longer fit.
+        """
+        merged = dict(data)
+        for key, value in self.settings.items():
+            if key == "onnx":
+                merged["onnx"] = {**(merged.get("onnx") or {}), **value}
+            else:
+                merged[key] = value
+        onnx = merged.get("onnx") or {}
+        affinities = str(onnx.get("intra_op_thread_affinities") or "").replace(" ", "")
+        if "threads" in self.settings and affinities:
+            if affinities.count(";") + 1 != (merged["threads"] or 1) - 1:
+                merged["onnx"] = {
+                    key: value
+                    for key, value in onnx.items()
+                    if key != "intra_op_thread_affinities"
+                }
+        return merged
+
+    def overrides(self, data: Dict[str, Any]) -> Dict[str, Tuple[Any, Any]]:
+        """Values set in ``data`` that ``apply()`` changes: key -> (file, tuned)."""
+        merged = self.apply(data)
+        changes: Dict[str, Tuple[Any, Any]] = {}
+        for key, value in data.items():
+            if key == "onnx":
+                tuned = merged.get("onnx") or {}
+                for name, setting in (value or {}).items():
+                    if tuned.get(name) != setting:
+                        changes[f"onnx.{name}"] = (setting, tuned.get(name))
+            elif merged.get(key) != value:
+                changes[key] = (value, merged.get(key))
+        return changes
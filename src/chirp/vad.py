@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+FRAME_MS = 20.0
+# Frames this far below the energy threshold still count as speech when their
+# zero-crossing rate marks them as unvoiced (fricatives such as "s" or "f").
+ZCR_ENERGY_MARGIN_DB = 6.0
+ZCR_THRESHOLD = 0.25
+_EPS = 1e-10
+
+
+@dataclass(frozen=True, slots=True)
+class TrimResult:
+    waveform: np.ndarray
+    start: int
+    end: int
+    original_samples: int
+
+    @property
+    def trimmed_samples(self) -> int:
+        return self.original_samples - (self.end - self.start)
+
+
+def frame_length(sample_rate: int, frame_ms: float = FRAME_MS) -> int:
+    return max(1, int(sample_rate * frame_ms / 1000))
+
+
+def frame_features(waveform: np.ndarray, frame_len: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-frame RMS energy (dBFS) and zero-crossing rate; a partial tail frame is dropped."""
+    count = waveform.size // frame_len
+    if count == 0:
+        return np.empty(0, dtype=np.float32), np.empty(0, dtype=np.float32)
+    frames = waveform[: count * frame_len].reshape(count, frame_len)
+    energy = np.einsum("ij,ij->i", frames, frames, dtype=np.float64) / frame_len
+    energy_db = (10.0 * np.log10(energy + _EPS)).astype(np.float32)
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (frame_len - 1 or 1)
+    return energy_db, zcr.astype(np.float32)
+
+
+def speech_frames(
+    energy_db: np.ndarray, zcr: np.ndarray, threshold_db: float
+) -> np.ndarray:
+    voiced = energy_db > threshold_db
+    unvoiced = (energy_db > threshold_db - ZCR_ENERGY_MARGIN_DB) & (zcr > ZCR_THRESHOLD)
+    return voiced | unvoiced
+
+
+def speech_bounds(
+    waveform: np.ndarray,
+    sample_rate: int,
+    *,
+    threshold_db: float,
+    padding_ms: float = 0.0,
+) -> Optional[Tuple[int, int]]:
+    """Sample range ``[start, end)`` spanning all detected speech plus padding, or None."""
+    frame_len = frame_length(sample_rate)
+    energy_db, zcr = frame_features(waveform, frame_len)
+    active = np.flatnonzero(speech_frames(energy_db, zcr, threshold_db))
+    if active.size == 0:
+        return None
+    padding = int(sample_rate * padding_ms / 1000)
+    start = max(0, int(active[0]) * frame_len - padding)
+    end = min(waveform.size, (int(active[-1]) + 1) * frame_len + padding)
+    return start, end
+
+
+def trim_silence(
+    waveform: np.ndarray,
+    sample_rate: int,
+    *,
+    threshold_db: float,
+    padding_ms: float = 0.0,
+) -> Optional[TrimResult]:
+    """Drop leading/trailing silence; returns None when the recording has no speech.
+
+    The trimmed waveform is a view of the input, not a copy.
+    """
+    bounds = speech_bounds(
+        waveform, sample_rate, threshold_db=threshold_db, padding_ms=padding_ms
+    )
+    if bounds is None:
+        return None
+    start, end = bounds
+    return TrimResult(
+        waveform=waveform[start:end],
+        start=start,
+        end=end,
+        original_samples=waveform.size,
+    )
+
+
+class SilenceEndpointer:
+    """Incremental end-of-utterance detector fed block by block from the capture callback.
+
+    Fires once when at least ``min_speech`` seconds of speech have been heard
+    and the most recent ``silence_seconds`` were all below ``threshold_db``.
+    Leading silence never triggers it.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int,
+        threshold_db: float,
+        silence_seconds: float,
+        min_speech: float = 0.2,
+    ) -> None:
+        self._sample_rate = sample_rate
+        self._threshold_db = threshold_db
+        self._silence_samples = int(silence_seconds * sample_rate)
+        self._min_speech_samples = int(min_speech * sample_rate)
+        self.reset()
+
+    def reset(self) -> None:
+        self._speech = 0
+        self._silence_run = 0
+        self._fired = False
+
+    @property
+    def trailing_silence(self) -> float:
+        return self._silence_run / self._sample_rate
+
+    def update(self, block: np.ndarray) -> bool:
+        """Account for one block; returns True exactly once, when the endpoint is reached."""
+        if self._fired or block.size == 0:
+            return False
+        samples = block.shape[0]
+        flat = block.reshape(-1)
+        energy = float(np.dot(flat, flat)) / flat.size
+        if 10.0 * np.log10(energy + _EPS) > self._threshold_db:
+            self._speech += samples
+            self._silence_run = 0
+            return False
+        self._silence_run += samples
+        if (
+            self._speech >= self._min_speech_samples
+            and self._silence_run >= self._silence_samples
+        ):
+            self._fired = True
+            return True
+        return False
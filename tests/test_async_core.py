@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import threading
+import time
+import unittest
+
+from chirp.async_core import AsyncCore, AsyncPipeline
+from chirp.pipeline import Stage
+
+
+LOGGER = logging.getLogger("chirp.test_async_core")
+
+
+class TestAsyncCore(unittest.TestCase):
+    def _core(self):
+        core = AsyncCore(logger=LOGGER)
+        self.addCleanup(core.close)
+        return core
+
+    def test_commands_run_in_order_on_event_loop(self):
+        """Posted commands and hotkeys become loop callbacks, run in order."""
+        core = self._core()
+        ran = []
+        on_hotkey = core.hotkey("hotkey", lambda: ran.append(("hotkey", threading.current_thread().name)))
+        core.post("first", lambda: ran.append(("first", threading.current_thread().name)))
+        on_hotkey()
+
+        async def probe():
+            return core.in_loop
+
+        self.assertTrue(core.run(probe()))
+        self.assertFalse(core.in_loop)
+        self.assertEqual(ran, [("first", "EventLoop"), ("hotkey", "EventLoop")])
+        stats = core.stats()
+        self.assertEqual((stats.commands, stats.hook_calls), (2, 1))
+
+    def test_blocking_work_runs_off_the_loop_in_order(self):
+        """run_blocking() keeps call order on one worker; failures are logged."""
+        core = self._core()
+        ran = []
+        core.post("first", core.run_blocking, "slow", lambda: time.sleep(0.05) or ran.append(1))
+        core.post("second", core.run_blocking, "boom", lambda: 1 // 0)
+        core.post("third", core.run_blocking, "fast", lambda: ran.append(threading.current_thread().name))
+        with self.assertLogs(LOGGER, "ERROR"):
+            core.close()
+        self.assertEqual(ran[0], 1)
+        self.assertTrue(ran[1].startswith("Blocking"))
+
+
+class TestAsyncPipeline(unittest.TestCase):
+    def setUp(self):
+        self.core = AsyncCore(logger=LOGGER)
+        self.addCleanup(self.core.close)
+        self.threads = {}
+
+    def _stage(self, name, fn, **kwargs):
+        def wrapped(item):
+            self.threads.setdefault(name, set()).add(threading.current_thread().name)
+            return fn(item)
+
+        return Stage(name, wrapped, **kwargs)
+
+    def _pipeline(self, stages):
+        done = []
+        pipeline = AsyncPipeline(
+            self.core, stages, on_done=lambda item, error: done.append((item, error)), logger=LOGGER
+        )
+        self.addCleanup(pipeline.close)
+        return pipeline, done
+
+    def test_only_blocking_stages_leave_the_loop(self):
+        """Inference runs in the executor; other stages and coroutines on the loop."""
+        delays = [0.1, 0.0, 0.05, 0.0]
+        pasted = []
+
+        async def paste(item):
+            await asyncio.sleep(0)
+            pasted.append((item, threading.current_thread().name))
+            return item
+
+        def infer(item):
+            time.sleep(delays[item])
+            return None if item == 2 else item
+
+        pipeline, done = self._pipeline(
+            [
+                self._stage("prepare", lambda x: x),
+                self._stage("infer", infer, workers=2, blocking=True),
+                Stage("paste", lambda x: x, coro=paste),
+            ]
+        )
+        for value in range(len(delays)):
+            pipeline.submit(value)
+        pipeline.join()
+
+        self.assertEqual(pasted, [(0, "EventLoop"), (1, "EventLoop"), (3, "EventLoop")])
+        self.assertEqual(self.threads["prepare"], {"EventLoop"})
+        self.assertTrue(all(name.startswith("Inference") for name in self.threads["infer"]))
+        stats = pipeline.stats()
+        self.assertEqual((stats["infer"].processed, stats["infer"].dropped), (4, 1))
+        self.assertGreater(stats["infer"].reordered, 0)
+        self.assertIn((2, None), done)
+
+    def test_submit_order_holds_across_threads(self):
+        """An item submitted from another thread stays ahead of a later one from the loop."""
+        injected = []
+        pipeline, _ = self._pipeline([Stage("inject", lambda x: injected.append(x) or x)])
+
+        def stop():
+            segmenter = threading.Thread(target=pipeline.submit, args=("segment",))
+            segmenter.start()
+            segmenter.join()
+            pipeline.submit("tail")
+
+        self.core.post("stop", stop)
+        self.core.run(asyncio.sleep(0))
+        pipeline.join()
+        self.assertEqual(injected, ["segment", "tail"])
+
+    def test_failure_and_inline_run(self):
+        """Errors reach on_done; run() waits for the result from another thread."""
+        pipeline, done = self._pipeline([self._stage("div", lambda x: 10 // x, blocking=True)])
+        self.assertEqual(pipeline.run(5), 2)
+        with self.assertRaises(ZeroDivisionError):
+            pipeline.run(0)
+        pipeline.submit(0)
+        pipeline.submit(2)
+        pipeline.join()
+        self.assertIsInstance(done[2][1], ZeroDivisionError)
+        self.assertEqual(done[3], (5, None))
+        self.assertEqual(pipeline.stats()["div"].failed, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+
+import numpy as np
+
+from chirp.audio_buffer import PrerollRing, RecordingBuffer
+
+
+class TestRecordingBuffer(unittest.TestCase):
+    def test_view_is_contiguous_slice_of_written_blocks(self):
+        """Blocks are stored in order and view() does not copy."""
+        buffer = RecordingBuffer(capacity=16)
+        buffer.write(np.arange(4, dtype=np.float32).reshape(-1, 1))
+        buffer.write(np.arange(4, 8, dtype=np.float32).reshape(-1, 1))
+
+        view = buffer.view()
+        self.assertEqual(view.shape, (8, 1))
+        np.testing.assert_array_equal(view.reshape(-1), np.arange(8))
+        self.assertTrue(view.flags["C_CONTIGUOUS"])
+        self.assertTrue(np.shares_memory(view, buffer._data))
+
+    def test_grows_past_preallocation(self):
+        """Writing beyond capacity grows the buffer and keeps earlier samples."""
+        buffer = RecordingBuffer(capacity=4)
+        for i in range(5):
+            buffer.write(np.full((3, 1), i, dtype=np.float32))
+
+        self.assertGreaterEqual(buffer.capacity, 15)
+        np.testing.assert_array_equal(
+            buffer.view().reshape(-1), np.repeat(np.arange(5), 3)
+        )
+
+    def test_reset_does_not_clobber_handed_out_view(self):
+        """After view() the next recording gets a fresh backing array."""
+        buffer = RecordingBuffer(capacity=8)
+        buffer.write(np.ones((4, 1), dtype=np.float32))
+        first = buffer.view()
+
+        buffer.reset()
+        buffer.write(np.zeros((4, 1), dtype=np.float32))
+
+        np.testing.assert_array_equal(first.reshape(-1), np.ones(4))
+        self.assertEqual(len(buffer), 4)
+
+    def test_reset_reuses_array_when_not_handed_out(self):
+        """Without a view() the backing array is reused."""
+        buffer = RecordingBuffer(capacity=8)
+        data = buffer._data
+        buffer.write(np.ones((4, 1), dtype=np.float32))
+        buffer.reset()
+        self.assertIs(buffer._data, data)
+        self.assertEqual(len(buffer), 0)
+
+    def test_growth_built_aside_keeps_samples_written_meanwhile(self):
+        """begin/fill/finish doubles the capacity; writes during fill() survive."""
+        buffer = RecordingBuffer(capacity=8)
+        buffer.write(np.arange(5, dtype=np.float32).reshape(-1, 1))
+        self.assertTrue(buffer.needs_room(0.5))
+        growth = buffer.begin_growth()
+        growth.fill()
+        buffer.write(np.arange(5, 7, dtype=np.float32).reshape(-1, 1))
+        self.assertTrue(buffer.finish_growth(growth))
+        self.assertEqual(buffer.capacity, 16)
+        np.testing.assert_array_equal(buffer.view().reshape(-1), np.arange(7))
+
+    def test_stale_growth_is_dropped(self):
+        """A growth started before reset() or a write()-side grow is not adopted."""
+        buffer = RecordingBuffer(capacity=4)
+        buffer.write(np.ones((3, 1), dtype=np.float32))
+        growth = buffer.begin_growth()
+        growth.fill()
+        buffer.reset()
+        self.assertFalse(buffer.finish_growth(growth))
+        self.assertEqual(buffer.capacity, 4)
+
+        growth = buffer.begin_growth()
+        growth.fill()
+        buffer.write(np.ones((6, 1), dtype=np.float32))  # write() grew it itself
+        self.assertFalse(buffer.finish_growth(growth))
+        self.assertEqual(len(buffer), 6)
+
+
+class TestPrerollRing(unittest.TestCase):
+    def test_keeps_only_most_recent_samples(self):
+        """Older samples are overwritten once the ring wraps."""
+        ring = PrerollRing(capacity=5)
+        ring.write(np.arange(3, dtype=np.float32))
+        ring.write(np.arange(3, 7, dtype=np.float32))
+
+        target = RecordingBuffer(capacity=8)
+        self.assertEqual(ring.drain_into(target), 5)
+        np.testing.assert_array_equal(target.view().reshape(-1), np.arange(2, 7))
+        self.assertEqual(len(ring), 0)
+
+    def test_block_larger_than_capacity(self):
+        """A single oversized block keeps its tail."""
+        ring = PrerollRing(capacity=4)
+        ring.write(np.arange(10, dtype=np.float32))
+
+        target = RecordingBuffer(capacity=4)
+        ring.drain_into(target)
+        np.testing.assert_array_equal(target.view().reshape(-1), np.arange(6, 10))
+
+    def test_memory_is_fixed(self):
+        """Writing for a long time never grows the ring."""
+        ring = PrerollRing(capacity=4800)
+        nbytes = ring.nbytes
+        for _ in range(1_000):
+            ring.write(np.ones(160, dtype=np.float32))
+        self.assertEqual(ring.nbytes, nbytes)
+        self.assertEqual(nbytes, 4800 * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
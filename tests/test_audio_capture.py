@@ -0,0 +1,298 @@
+import sys
+import time
+import types
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+# sounddevice needs PortAudio, which the test environment lacks.
+if "sounddevice" not in sys.modules:
+    mock_sd = types.ModuleType("sounddevice")
+    mock_sd.InputStream = MagicMock()
+    sys.modules["sounddevice"] = mock_sd
+
+from chirp import audio_capture
+from chirp.audio_capture import AudioCapture
+
+
+class FakeInputStream:
+    """Stand-in for sd.InputStream that lets tests drive the callback."""
+
+    instances: list["FakeInputStream"] = []
+
+    def __init__(self, *, samplerate, channels, dtype, callback, **_kwargs):
+        self.samplerate = samplerate
+        self.channels = channels
+        self.callback = callback
+        self.active = False
+        self.closed = False
+        FakeInputStream.instances.append(self)
+
+    def start(self):
+        self.active = True
+
+    def stop(self):
+        self.active = False
+
+    def close(self):
+        self.closed = True
+
+    def feed(self, samples: np.ndarray, block: int = 160) -> None:
+        samples = samples.astype(np.float32).reshape(-1, self.channels)
+        for offset in range(0, samples.shape[0], block):
+            chunk = samples[offset : offset + block]
+            self.callback(chunk, chunk.shape[0], None, None)
+
+
+class AudioCaptureTestCase(unittest.TestCase):
+    def setUp(self):
+        FakeInputStream.instances.clear()
+        self._original = audio_capture.sd.InputStream
+        audio_capture.sd.InputStream = FakeInputStream
+
+    def tearDown(self):
+        audio_capture.sd.InputStream = self._original
+
+    @property
+    def stream(self) -> FakeInputStream:
+        return FakeInputStream.instances[-1]
+
+
+class TestAudioCapture(AudioCaptureTestCase):
+    def test_stop_returns_fed_samples(self):
+        """stop() returns every sample delivered to the callback, in order."""
+        capture = AudioCapture(max_duration=1.0)
+        capture.start()
+        samples = np.linspace(-1, 1, 3_000, dtype=np.float32)
+        self.stream.feed(samples)
+        audio = capture.stop()
+
+        self.assertEqual(audio.dtype, np.float32)
+        np.testing.assert_array_equal(audio, samples)
+        self.assertTrue(self.stream.closed)
+
+    def test_long_limits_reserve_a_capped_buffer(self):
+        """A two-hour limit does not reserve two hours of samples up front."""
+        capture = AudioCapture(max_duration=7200.0)
+        self.assertEqual(
+            capture._buffer.capacity, int(audio_capture.MAX_PREALLOCATED_SECONDS * 16_000)
+        )
+        self.assertEqual(AudioCapture(max_duration=9.0)._buffer.capacity, 10 * 16_000)
+
+    def test_buffer_grows_ahead_off_the_callback(self):
+        """Past half capacity the doubled array is built off the audio thread."""
+        capture = AudioCapture(max_duration=1.0)  # 2 s reserved
+        capture._buffer._grow = MagicMock(side_effect=AssertionError("grew in the callback"))
+        capture.start()
+        samples = np.linspace(-1, 1, 20_000, dtype=np.float32)
+        self.stream.feed(samples)
+        deadline = time.monotonic() + 5
+        while capture._buffer.capacity == 32_000 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(capture._buffer.capacity, 64_000)
+        more = np.linspace(1, -1, 30_000, dtype=np.float32)
+        self.stream.feed(more)
+        np.testing.assert_array_equal(capture.stop(), np.concatenate([samples, more]))
+
+    def test_recordings_do_not_share_storage(self):
+        """A new recording must not overwrite the previous waveform."""
+        capture = AudioCapture(max_duration=1.0)
+        capture.start()
+        self.stream.feed(np.ones(800))
+        first = capture.stop()
+
+        capture.start()
+        self.stream.feed(np.zeros(800))
+        second = capture.stop()
+
+        np.testing.assert_array_equal(first, np.ones(800))
+        np.testing.assert_array_equal(second, np.zeros(800))
+
+    def test_stop_without_start_returns_empty(self):
+        """stop() before start() yields an empty waveform."""
+        capture = AudioCapture()
+        self.assertEqual(capture.stop().size, 0)
+
+
+class TestPersistentStream(AudioCaptureTestCase):
+    def test_stream_stays_open_between_recordings(self):
+        """Persistent mode opens the device once; hotkeys only move the gate."""
+        capture = AudioCapture(persistent=True, max_duration=1.0)
+        capture.open()
+        self.assertIsNotNone(capture.open_duration)
+
+        capture.start()
+        self.stream.feed(np.ones(800))
+        first = capture.stop()
+        capture.start()
+        self.stream.feed(np.full(400, 0.5))
+        second = capture.stop()
+
+        self.assertEqual(len(FakeInputStream.instances), 1)
+        self.assertTrue(self.stream.active)
+        np.testing.assert_array_equal(first, np.ones(800))
+        np.testing.assert_array_equal(second, np.full(400, 0.5))
+
+    def test_audio_outside_recording_is_discarded(self):
+        """Samples delivered while the gate is closed are not recorded."""
+        capture = AudioCapture(persistent=True, max_duration=1.0)
+        capture.open()
+        self.stream.feed(np.full(800, 0.25))
+        capture.start()
+        self.stream.feed(np.ones(160))
+        audio = capture.stop()
+        self.stream.feed(np.full(800, 0.25))
+
+        np.testing.assert_array_equal(audio, np.ones(160))
+
+    def test_idle_timeout_closes_a_stream_never_recorded_on(self):
+        """A stream opened ahead of time closes after the idle timeout without any recording."""
+        capture = AudioCapture(persistent=True, idle_timeout=0.05, max_duration=1.0)
+        capture.open()
+        deadline = time.monotonic() + 5
+        while capture.is_open and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(capture.is_open)
+        self.assertTrue(FakeInputStream.instances[0].closed)
+
+    def test_idle_timeout_closes_and_start_reopens(self):
+        """The idle policy closes the device; the next start() reopens it."""
+        capture = AudioCapture(persistent=True, idle_timeout=0.05, max_duration=1.0)
+        capture.open()
+        capture.start()
+        capture.stop()
+        time.sleep(0.2)
+
+        self.assertFalse(capture.is_open)
+        self.assertTrue(FakeInputStream.instances[0].closed)
+
+        capture.start()
+        self.assertTrue(capture.is_open)
+        self.assertEqual(len(FakeInputStream.instances), 2)
+        capture.close()
+
+
+class TestPreroll(AudioCaptureTestCase):
+    def test_preroll_is_prepended(self):
+        """Audio heard just before start() leads the returned waveform."""
+        capture = AudioCapture(preroll_ms=50, max_duration=1.0)  # 800 frames
+        self.assertTrue(capture.persistent)
+        capture.open()
+        self.stream.feed(np.zeros(1_600))
+        self.stream.feed(np.full(800, 0.5))
+        capture.start()
+        self.stream.feed(np.ones(320))
+        audio = capture.stop()
+
+        np.testing.assert_array_equal(audio[:800], np.full(800, 0.5))
+        np.testing.assert_array_equal(audio[800:], np.ones(320))
+
+    def test_preroll_cleared_when_device_closes(self):
+        """Pre-roll from a closed stream is not replayed into the next recording."""
+        capture = AudioCapture(preroll_ms=50, max_duration=1.0)
+        capture.open()
+        self.stream.feed(np.full(800, 0.5))
+        capture.close()
+
+        capture.start()
+        self.stream.feed(np.ones(160))
+        np.testing.assert_array_equal(capture.stop(), np.ones(160))
+
+
+def _speech(seconds: float) -> np.ndarray:
+    t = np.arange(int(16_000 * seconds)) / 16_000
+    return (0.3 * np.sin(2 * np.pi * 200 * t)).astype(np.float32)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(16_000 * seconds), dtype=np.float32)
+
+
+class TestEndpointing(AudioCaptureTestCase):
+    def _capture(self, on_endpoint):
+        capture = AudioCapture(
+            max_duration=10.0,
+            endpoint_silence=0.5,
+            endpoint_threshold_db=-45.0,
+            on_endpoint=on_endpoint,
+        )
+        capture.start()
+        return capture
+
+    def test_trailing_silence_triggers_endpoint_once(self):
+        """Speech followed by sustained silence fires on_endpoint exactly once."""
+        calls = []
+        capture = self._capture(lambda: calls.append(len(calls)))
+        self.stream.feed(_speech(1.0))
+        self.stream.feed(_silence(0.4))
+        self.assertEqual(calls, [])
+
+        self.stream.feed(_silence(0.2))
+        self.assertEqual(calls, [0])
+        self.stream.feed(_silence(1.0))
+        self.assertEqual(len(calls), 1)
+        # The audio keeps flowing into the buffer until the app stops it.
+        self.assertEqual(capture.stop().size, int(16_000 * 2.6))
+
+    def test_leading_silence_does_not_trigger(self):
+        """Silence before the user starts talking is not an endpoint."""
+        calls = []
+        capture = self._capture(lambda: calls.append(True))
+        self.stream.feed(_silence(2.0))
+        self.stream.feed(_speech(0.5))
+        self.stream.feed(_silence(0.3))
+        self.assertEqual(calls, [])
+        capture.stop()
+
+    def test_pauses_between_words_reset_silence(self):
+        """Short pauses shorter than endpoint_silence do not stop the recording."""
+        calls = []
+        capture = self._capture(lambda: calls.append(True))
+        for _ in range(4):
+            self.stream.feed(_speech(0.4))
+            self.stream.feed(_silence(0.3))
+        self.assertEqual(calls, [])
+        capture.stop()
+
+    def test_endpointer_rearmed_for_next_recording(self):
+        """Each recording gets a fresh endpointer."""
+        calls = []
+        capture = self._capture(lambda: calls.append(True))
+        self.stream.feed(_speech(0.5))
+        self.stream.feed(_silence(0.6))
+        capture.stop()
+
+        capture.start()
+        self.stream.feed(_speech(0.5))
+        self.stream.feed(_silence(0.6))
+        capture.stop()
+        self.assertEqual(len(calls), 2)
+
+
+class TestIterSegments(AudioCaptureTestCase):
+    def test_yields_segments_while_recording_and_stops(self):
+        """Finished phrases are yielded during recording; the rest is the tail."""
+        capture = AudioCapture(max_duration=30.0)
+        capture.start()
+        self.stream.feed(_speech(2.0))
+        self.stream.feed(_silence(0.5))
+        self.stream.feed(_speech(1.0))
+
+        segments = capture.iter_segments(
+            min_seconds=1.0, max_seconds=10.0, poll_interval=0.01
+        )
+        start, segment = next(segments)
+        self.assertEqual(start, 0)
+        self.assertGreater(segment.size, 2 * 16_000)
+        self.assertLess(segment.size, int(2.5 * 16_000))
+
+        waveform = capture.stop()
+        with self.assertRaises(StopIteration):
+            next(segments)
+        np.testing.assert_array_equal(waveform[: segment.size], segment)
+        self.assertEqual(waveform.size, int(3.5 * 16_000))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from chirp.batching import MicroBatcher, plan_batches
+
+
+class TestPlanBatches(unittest.TestCase):
+    def test_sorted_by_length(self):
+        """Batches group neighbouring lengths, shortest first."""
+        lengths = [50, 10, 40, 20, 30]
+        self.assertEqual(
+            plan_batches(lengths, max_batch_size=2, max_batch_samples=1000),
+            [[1, 3], [4, 2], [0]],
+        )
+
+    def test_padded_size_limit(self):
+        """A batch closes before its padded size exceeds the limit."""
+        lengths = [10, 10, 30, 100]
+        self.assertEqual(
+            plan_batches(lengths, max_batch_size=8, max_batch_samples=60),
+            [[0, 1], [2], [3]],
+        )
+        self.assertEqual(plan_batches([], max_batch_size=8, max_batch_samples=60), [])
+
+
+class TestMicroBatcher(unittest.TestCase):
+    def test_requests_in_window_share_a_batch(self):
+        """Requests queued while the first waits are handled in one call."""
+        calls = []
+        release = threading.Event()
+
+        def handler(waveforms):
+            release.wait(5)
+            calls.append(len(waveforms))
+            return [f"n{audio.size}" for audio in waveforms]
+
+        batcher = MicroBatcher(handler=handler, window=0.5, max_batch_size=3)
+        futures = [batcher.submit(np.zeros(size, dtype=np.float32)) for size in (1, 2, 3, 4)]
+        release.set()
+        self.assertEqual([future.result(timeout=5) for future in futures], ["n1", "n2", "n3", "n4"])
+        batcher.close()
+
+        self.assertEqual(calls, [3, 1])
+        stats = batcher.stats()
+        self.assertEqual((stats.requests, stats.batches), (4, 2))
+        self.assertEqual(stats.mean_batch_size, 2.0)
+        with self.assertRaises(RuntimeError):
+            batcher.submit(np.zeros(1, dtype=np.float32))
+
+    def test_failure_reaches_every_caller(self):
+        """An error in the batch is raised from each request's future."""
+
+        def handler(_waveforms):
+            raise ValueError("boom")
+
+        batcher = MicroBatcher(handler=handler, window=0.2)
+        futures = [batcher.submit(np.zeros(1, dtype=np.float32)) for _ in range(2)]
+        for future in futures:
+            with self.assertRaisesRegex(ValueError, "boom"):
+                future.result(timeout=5)
+        batcher.close()
+
+    def test_short_result_fails_unmatched_requests(self):
+        """A handler returning too few transcripts fails the rest instead of hanging them."""
+        batcher = MicroBatcher(handler=lambda waveforms: ["only"], window=0.2, logger=MagicMock())
+        futures = [batcher.submit(np.zeros(1, dtype=np.float32)) for _ in range(2)]
+        self.assertEqual(futures[0].result(timeout=5), "only")
+        with self.assertRaisesRegex(RuntimeError, "1 transcripts for 2 requests"):
+            futures[1].result(timeout=5)
+        batcher.close()
+
+    def test_submit_racing_close_never_hangs(self):
+        """Each submit either raises or gets a result, even while close() runs."""
+        batcher = MicroBatcher(handler=lambda waveforms: ["ok"] * len(waveforms), window=0)
+        futures = []
+
+        def submit_until_closed():
+            while True:
+                try:
+                    futures.append(batcher.submit(np.zeros(1, dtype=np.float32)))
+                except RuntimeError:
+                    return
+
+        submitters = [threading.Thread(target=submit_until_closed) for _ in range(4)]
+        for thread in submitters:
+            thread.start()
+        batcher.close()
+        for thread in submitters:
+            thread.join(5)
+        self.assertTrue(all(future.result(timeout=5) == "ok" for future in futures))
+
+    def test_close_finishes_pending_requests(self):
+        """Requests submitted before close() still get their results."""
+        batcher = MicroBatcher(handler=lambda waveforms: ["ok"] * len(waveforms), window=10)
+        future = batcher.submit(np.zeros(1, dtype=np.float32))
+        batcher.close()
+        self.assertEqual(future.result(timeout=0), "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from chirp.config_manager import ChirpConfig
+from chirp.config_manager import DEFAULT_MODEL, ChirpConfig, ModelSpec, OnnxSettings
 
 
 class TestConfigValidation(unittest.TestCase):
@@ -34,6 +34,11 @@ class TestConfigValidation(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "model_timeout must be non-negative"):
             conf.validate()
 
+    def test_validate_model_warmup_seconds_negative(self):
+        """Negative model_warmup_seconds should fail validation."""
+        with self.assertRaisesRegex(ValueError, "model_warmup_seconds must be non-negative"):
+            ChirpConfig(model_warmup_seconds=-1.0).validate()
+
     def test_validate_max_recording_duration_negative(self):
         """Negative max_recording_duration should fail validation."""
         conf = ChirpConfig(max_recording_duration=-1.0)
@@ -46,6 +51,136 @@ class TestConfigValidation(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "max_recording_duration must be <="):
             conf.validate()
 
+    def test_validate_stream_idle_timeout_negative(self):
+        """Negative stream_idle_timeout should fail validation."""
+        conf = ChirpConfig(stream_idle_timeout=-1.0)
+        with self.assertRaisesRegex(ValueError, "stream_idle_timeout must be non-negative"):
+            conf.validate()
+
+    def test_validate_preroll_ms_out_of_range(self):
+        """preroll_ms must stay within the bounded ring size."""
+        for value in (-1.0, 2500.0):
+            conf = ChirpConfig(preroll_ms=value)
+            with self.assertRaisesRegex(ValueError, "preroll_ms must be between"):
+                conf.validate()
+
+    def test_validate_vad_settings(self):
+        """VAD threshold must be in dBFS and padding non-negative."""
+        with self.assertRaisesRegex(ValueError, "vad_threshold_db must be negative"):
+            ChirpConfig(vad_threshold_db=3.0).validate()
+        with self.assertRaisesRegex(ValueError, "vad_padding_ms must be non-negative"):
+            ChirpConfig(vad_padding_ms=-10.0).validate()
+
+    def test_validate_endpoint_silence_negative(self):
+        """Negative endpoint_silence should fail validation."""
+        conf = ChirpConfig(endpoint_silence=-0.5)
+        with self.assertRaisesRegex(ValueError, "endpoint_silence must be non-negative"):
+            conf.validate()
+
+    def test_validate_long_form_settings(self):
+        """Chunk windows must be 0 or at least 10s, overlap under half a window."""
+        with self.assertRaisesRegex(ValueError, "long_form_chunk_seconds must be 0 or >="):
+            ChirpConfig(long_form_chunk_seconds=5.0).validate()
+        with self.assertRaisesRegex(ValueError, "long_form_overlap_seconds must be"):
+            ChirpConfig(long_form_chunk_seconds=20.0, long_form_overlap_seconds=10.0).validate()
+        ChirpConfig(long_form_chunk_seconds=0).validate()
+
+    def test_validate_session_pool_size_negative(self):
+        """Negative session_pool_size should fail validation."""
+        with self.assertRaisesRegex(ValueError, "session_pool_size must be non-negative"):
+            ChirpConfig(session_pool_size=-1).validate()
+
+    def test_validate_onnx_settings(self):
+        """The [onnx] table rejects unknown levels/modes and malformed affinities."""
+        cases = [
+            (OnnxSettings(graph_optimization="max"), "onnx.graph_optimization must be one of"),
+            (OnnxSettings(execution_mode="async"), "onnx.execution_mode must be one of"),
+            (OnnxSettings(inter_op_threads=-1), "onnx.inter_op_threads must be non-negative"),
+            (OnnxSettings(intra_op_thread_affinities="1;x"), "must look like"),
+        ]
+        for settings, message in cases:
+            with self.assertRaisesRegex(ValueError, message):
+                ChirpConfig(threads=3, onnx=settings).validate()
+
+    def test_validate_onnx_affinities_match_threads(self):
+        """Affinities need one group per intra-op thread after the first."""
+        settings = OnnxSettings(intra_op_thread_affinities="2;3-4")
+        ChirpConfig(threads=3, onnx=settings).validate()
+        for threads in (None, 0, 4):
+            with self.assertRaisesRegex(ValueError, "one group per thread"):
+                ChirpConfig(threads=threads, onnx=settings).validate()
+
+    def test_from_dict_onnx_table(self):
+        """The [onnx] table is parsed into OnnxSettings and normalized."""
+        conf = ChirpConfig.from_dict(
+            {
+                "threads": 3,
+                "onnx": {
+                    "graph_optimization": "EXTENDED",
+                    "allow_spinning": False,
+                    "intra_op_thread_affinities": "2; 3",
+                },
+            }
+        )
+        conf.validate()
+        self.assertEqual(conf.onnx.graph_optimization, "extended")
+        self.assertFalse(conf.onnx.allow_spinning)
+        self.assertEqual(conf.onnx.intra_op_thread_affinities, "2;3")
+        self.assertEqual(conf.to_dict()["onnx"]["execution_mode"], "sequential")
+
+    def test_validate_mmap_weights_requires_cache(self):
+        """Weights can only be mapped from the optimized model cache."""
+        with self.assertRaisesRegex(ValueError, "mmap_weights requires optimized_model_cache"):
+            ChirpConfig(mmap_weights=True, optimized_model_cache=False).validate()
+        ChirpConfig(mmap_weights=True).validate()
+
+    def test_from_dict_models_table(self):
+        """[models.<name>] tables become ModelSpecs with defaults from the top level."""
+        conf = ChirpConfig.from_dict(
+            {
+                "language": "en",
+                "models": {"quick": {"quantization": "INT8", "shortcut": "Ctrl+Alt+Insert"}},
+            }
+        )
+        conf.validate()
+        spec = conf.model_spec("quick")
+        self.assertEqual(spec.model, conf.parakeet_model)
+        self.assertEqual(spec.quantization, "int8")
+        self.assertEqual(spec.language, "en")
+        self.assertEqual(spec.shortcut, "ctrl+alt+insert")
+        self.assertEqual(conf.model_spec(DEFAULT_MODEL).shortcut, conf.primary_shortcut)
+
+    def test_validate_models(self):
+        """Model names, quantizations and shortcuts are checked."""
+        cases = [
+            ({DEFAULT_MODEL: ModelSpec()}, "name must be non-empty"),
+            ({"quick": ModelSpec(quantization="fp8")}, "quantization must be 'int8' or empty"),
+            ({"quick": ModelSpec(shortcut="ctrl+shift")}, "already in use"),
+        ]
+        for models, message in cases:
+            with self.assertRaisesRegex(ValueError, message):
+                ChirpConfig(models=models).validate()
+        with self.assertRaisesRegex(ValueError, "model_memory_budget_mb must be non-negative"):
+            ChirpConfig(model_memory_budget_mb=-1).validate()
+
+    def test_validate_job_settings(self):
+        """Deadlines are non-negative and the cancel hotkey needs its own shortcut."""
+        with self.assertRaisesRegex(ValueError, "transcription_deadline must be non-negative"):
+            ChirpConfig(transcription_deadline=-1).validate()
+        with self.assertRaisesRegex(ValueError, "cancel_shortcut must differ"):
+            ChirpConfig(cancel_shortcut="ctrl+shift").validate()
+        with self.assertRaisesRegex(ValueError, "already in use"):
+            ChirpConfig(
+                cancel_shortcut="ctrl+alt+x", models={"quick": ModelSpec(shortcut="ctrl+alt+x")}
+            ).validate()
+
+    def test_validate_pipeline_settings(self):
+        """Pipeline queues and inference workers need at least one slot."""
+        with self.assertRaisesRegex(ValueError, "pipeline_queue_size must be at least 1"):
+            ChirpConfig(pipeline_queue_size=0).validate()
+        with self.assertRaisesRegex(ValueError, "inference_workers must be at least 1"):
+            ChirpConfig(inference_workers=0).validate()
+
     def test_validate_sound_path_missing(self):
         """Non-existent sound paths should fail validation."""
         conf = ChirpConfig(start_sound_path="/this/path/absolutely/should/not/exist.wav")
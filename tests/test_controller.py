@@ -0,0 +1,77 @@
+import logging
+import threading
+import time
+import unittest
+
+from chirp.controller import Controller
+
+
+class TestController(unittest.TestCase):
+    def _controller(self):
+        controller = Controller(logger=logging.getLogger("chirp.test_controller"))
+        self.addCleanup(controller.close)
+        return controller
+
+    def test_commands_run_in_order_on_controller_thread(self):
+        """Posted commands run one at a time, in order, on the controller thread."""
+        controller = self._controller()
+        ran = []
+        for value in range(5):
+            controller.post("append", lambda v: ran.append((v, threading.current_thread().name)), value)
+        controller.close()
+        self.assertEqual(ran, [(v, "Controller") for v in range(5)])
+        self.assertEqual(controller.stats().commands, 5)
+
+    def test_hotkey_callback_returns_while_command_blocks(self):
+        """The hook callback only queues; a slow command does not hold it up."""
+        controller = self._controller()
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+
+        on_hotkey = controller.hotkey("slow", slow)
+        began = time.perf_counter()
+        on_hotkey()
+        self.assertTrue(started.wait(5))
+        on_hotkey()  # the controller is busy; this still returns at once
+        self.assertLess(time.perf_counter() - began, 0.1)
+        release.set()
+        controller.close()
+
+        stats = controller.stats()
+        self.assertEqual((stats.hook_calls, stats.commands), (2, 2))
+        self.assertLess(stats.max_hook_seconds, 0.01)
+        self.assertGreater(stats.max_queue_seconds, 0.0)
+
+    def test_inline_hotkey_runs_in_the_hook_while_command_blocks(self):
+        """An inline hotkey runs at once in the hook and is timed like the others."""
+        controller = self._controller()
+        release = threading.Event()
+        started = threading.Event()
+        ran = []
+        controller.post("slow", lambda: started.set() or release.wait(5))
+        self.assertTrue(started.wait(5))
+        controller.inline_hotkey(lambda: ran.append(threading.current_thread().name))()
+        self.assertEqual(ran, [threading.current_thread().name])
+        release.set()
+        controller.close()
+        self.assertEqual(controller.stats().hook_calls, 1)
+
+    def test_failing_command_is_logged_and_loop_continues(self):
+        """An exception in one command does not stop later ones."""
+        controller = self._controller()
+        ran = []
+        with self.assertLogs("chirp.test_controller", level="ERROR") as logs:
+            controller.post("boom", lambda: 1 / 0)
+            controller.post("after", ran.append, "ok")
+            controller.close()
+        self.assertEqual(ran, ["ok"])
+        self.assertIn("Command boom failed", logs.output[0])
+        self.assertEqual(controller.stats().failed, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import logging
+import os
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from chirp.inference_worker import InferenceWorker, WorkerCrashedError
+from chirp.parakeet_manager import ModelNotPreparedError
+
+
+# A real logger: its level is sent to the worker process.
+LOGGER = logging.getLogger("chirp.test_inference_worker")
+
+
+class FakeManager:
+    """ParakeetManager stand-in run in the worker process."""
+
+    def __init__(self, *, logger, timeout, model_dir, **_kwargs):
+        if model_dir == "missing":
+            raise ModelNotPreparedError("Model not found")
+
+    def weights_bytes(self):
+        return 1234
+
+    def transcribe(self, audio, *, sample_rate, language):
+        if language == "crash":
+            os._exit(3)
+        if language == "fail":
+            raise ValueError("bad audio")
+        if language == "slow":
+            time.sleep(1.0)
+        return f"{audio.size} {audio.sum():.0f} {sample_rate} pid={os.getpid()}"
+
+    def close(self):
+        pass
+
+
+class TestInferenceWorker(unittest.TestCase):
+    def _worker(self, **kwargs):
+        worker = InferenceWorker(
+            logger=LOGGER,
+            timeout=kwargs.pop("timeout", 0),
+            manager_factory=FakeManager,
+            model_dir=kwargs.pop("model_dir", "model"),
+            **kwargs,
+        )
+        self.addCleanup(worker.close)
+        return worker
+
+    def test_round_trip_through_shared_memory(self):
+        """Audio reaches the child intact; only the text comes back."""
+        worker = self._worker()
+        self.assertTrue(worker.is_loaded)
+        self.assertEqual(worker.weights_bytes(), 1234)
+        text = worker.transcribe(np.full(1000, 2.0, dtype=np.float32), sample_rate=8000)
+        size, total, rate, pid = text.split()
+        self.assertEqual((size, total, rate), ("1000", "2000", "8000"))
+        self.assertNotEqual(pid, f"pid={os.getpid()}")
+        self.assertEqual(worker.transcribe(np.zeros(0, dtype=np.float32)), "")
+
+        # A longer recording grows the buffer; the shorter one still fits.
+        long_audio = np.ones(300_000, dtype=np.float32)
+        self.assertTrue(worker.transcribe(long_audio).startswith("300000 300000"))
+        metrics = worker.metrics
+        self.assertEqual((metrics.starts, metrics.requests), (1, 2))
+        self.assertGreaterEqual(metrics.last_ipc_seconds, 0.0)
+
+    def test_errors_keep_worker_and_crashes_restart_it(self):
+        """Exceptions are re-raised; a dead worker is restarted and the request retried."""
+        worker = self._worker()
+        audio = np.ones(10, dtype=np.float32)
+        with self.assertRaisesRegex(RuntimeError, "ValueError: bad audio"):
+            worker.transcribe(audio, language="fail")
+        self.assertEqual(worker.metrics.starts, 1)
+
+        worker._process.kill()
+        worker._process.join()
+        self.assertTrue(worker.transcribe(audio).startswith("10 10"))
+        self.assertEqual((worker.metrics.crashes, worker.metrics.restarts), (1, 1))
+
+        with self.assertRaises(WorkerCrashedError):
+            worker.transcribe(audio, language="crash")
+        self.assertTrue(worker.transcribe(audio).startswith("10 10"))
+        self.assertEqual(worker.metrics.crashes, 3)
+
+    def test_unload_stops_process_and_preload_restarts_it(self):
+        """Unloading ends the worker process; preload() brings it back."""
+        worker = self._worker()
+        process = worker._process
+        self.assertTrue(worker.unload())
+        self.assertFalse(process.is_alive())
+        self.assertFalse(worker.is_loaded)
+        self.assertFalse(worker.unload())
+
+        self.assertTrue(worker.preload())
+        worker._preload_thread.join(30)
+        self.assertTrue(worker.is_loaded)
+        self.assertFalse(worker.preload())
+        self.assertEqual(worker.metrics.crashes, 0)
+
+    def test_preload_does_not_wait_for_a_request(self):
+        """preload() returns at once while a transcription is in flight."""
+        worker = self._worker()
+        request = threading.Thread(
+            target=worker.transcribe,
+            args=(np.ones(10, dtype=np.float32),),
+            kwargs={"language": "slow"},
+        )
+        request.start()
+        deadline = time.monotonic() + 5
+        while not worker._lock.locked() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        started = time.perf_counter()
+        self.assertFalse(worker.preload())
+        self.assertLess(time.perf_counter() - started, 0.5)
+        request.join(30)
+        self.assertEqual(worker.metrics.requests, 1)
+
+    def test_idle_worker_is_stopped_off_the_scheduler_thread(self):
+        """The idle timeout stops the worker on its own thread, not the shared scheduler."""
+        worker = self._worker(timeout=0.2)
+        process = worker._process
+        stop = worker._stop_locked
+        stopped_on = []
+
+        def record_stop():
+            stopped_on.append(threading.current_thread().name)
+            stop()
+
+        worker._stop_locked = record_stop
+        deadline = time.monotonic() + 10
+        while worker.is_loaded and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertFalse(worker.is_loaded)
+        with worker._lock:  # held until the stop has finished
+            self.assertFalse(process.is_alive())
+        self.assertEqual(stopped_on, ["WorkerStop"])
+
+    def test_missing_model_raises_from_constructor(self):
+        """ModelNotPreparedError from the child surfaces in the parent."""
+        with self.assertRaisesRegex(ModelNotPreparedError, "Model not found"):
+            InferenceWorker(
+                logger=LOGGER, timeout=0, manager_factory=FakeManager, model_dir="missing"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import sys
+import threading
+import time
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+# sounddevice needs PortAudio, which the test environment lacks.
+if "sounddevice" not in sys.modules:
+    mock_sd = types.ModuleType("sounddevice")
+    mock_sd.InputStream = MagicMock()
+    sys.modules["sounddevice"] = mock_sd
+
+from chirp.config_manager import DEFAULT_MODEL
+from chirp.jobs import DeadlineExceededError, JobCancelledError, TranscriptionJob
+from chirp.main import ChirpApp, _Dictation
+
+
+class TestTranscriptionJob(unittest.TestCase):
+    def test_cancel_and_deadline(self):
+        """check() raises once cancelled, or once the deadline has passed."""
+        job = TranscriptionJob()
+        job.check()
+        job.cancel("superseded")
+        with self.assertRaisesRegex(JobCancelledError, "superseded"):
+            job.check()
+
+        expired = TranscriptionJob(deadline=0.01)
+        time.sleep(0.02)
+        self.assertTrue(expired.expired)
+        with self.assertRaises(DeadlineExceededError):
+            expired.check()
+        expired.check(deadline=False)
+        self.assertIsNone(TranscriptionJob(deadline=0).deadline)
+
+
+@patch("chirp.main.TextInjector")
+@patch("chirp.main.AudioFeedback")
+@patch("chirp.main.AudioCapture")
+@patch("chirp.main.KeyboardShortcutManager")
+@patch("chirp.main.ConfigManager")
+class TestAppJobs(unittest.TestCase):
+    def _app(self, mock_config, manager, **settings):
+        config = mock_config.return_value.load.return_value
+        config.vad_trim = False
+        config.language = None
+        config.models = {}
+        config.model_memory_budget_mb = 0.0
+        config.inference_process = False
+        config.transcription_deadline = 0.0
+        config.latest_wins = False
+        config.pipeline_queue_size = 4
+        config.inference_workers = 1
+        config.async_core = False
+        for key, value in settings.items():
+            setattr(config, key, value)
+        mock_config.return_value.model_dir.return_value = "models/test-model"
+        with patch("chirp.main.ParakeetManager", return_value=manager):
+            app = ChirpApp()
+            app.parakeet  # wait for the background load
+        return app
+
+    def _blocking_manager(self):
+        """Manager whose first transcription waits for ``release``."""
+        release = threading.Event()
+        started = threading.Event()
+        # Later calls are named in the order they get past the job check.
+        texts = iter(["second", "third"])
+
+        def transcribe(audio, **kwargs):
+            if not started.is_set():
+                started.set()
+                release.wait(5)
+                kwargs["job"].check()
+                return "first"
+            kwargs["job"].check()
+            return next(texts)
+
+        manager = MagicMock()
+        manager.transcribe.side_effect = transcribe
+        return manager, started, release
+
+    def _submit(self, app):
+        return app._submit_job(
+            _Dictation(waveform=np.ones(16000, dtype=np.float32), model=DEFAULT_MODEL)
+        )
+
+    def test_latest_wins_cancels_older_jobs(
+        self, mock_config, mock_keyboard, mock_capture, mock_feedback, mock_injector
+    ):
+        """A newer recording supersedes running and queued ones; only it is pasted."""
+        manager, started, release = self._blocking_manager()
+        app = self._app(mock_config, manager, latest_wins=True)
+        first = self._submit(app)
+        started.wait(5)
+        second = self._submit(app)
+        third = self._submit(app)
+        self.assertTrue(first.cancelled and second.cancelled)
+        release.set()
+        app._pipeline.join()
+
+        injector = mock_injector.return_value
+        injector.process.assert_called_once_with("second")
+        injector.paste.assert_called_once_with(injector.process.return_value)
+        self.assertFalse(third.cancelled)
+        stats = app._job_stats
+        self.assertEqual((stats.submitted, stats.completed, stats.cancelled), (3, 1, 2))
+        self.assertEqual(app._jobs, [])
+
+    def test_deadline_and_user_cancel(
+        self, mock_config, mock_keyboard, mock_capture, mock_feedback, mock_injector
+    ):
+        """A job queued past its deadline is dropped; cancel_transcriptions() stops the rest."""
+        manager, started, release = self._blocking_manager()
+        app = self._app(mock_config, manager, transcription_deadline=0.05)
+        self._submit(app)
+        started.wait(5)
+        queued = self._submit(app)
+        time.sleep(0.1)
+        release.set()
+        app._pipeline.join()
+        self.assertTrue(queued.expired)
+        # The slow job expired at its next check, the queued one before starting.
+        self.assertEqual(app._job_stats.deadline_missed, 2)
+        mock_injector.return_value.paste.assert_not_called()
+
+        manager.transcribe.side_effect = lambda audio, **kwargs: release.wait(5) and "late"
+        release.clear()
+        app.config.transcription_deadline = 0.0
+        self._submit(app)
+        self.assertEqual(app.cancel_transcriptions(), 1)
+        self.assertEqual(app.cancel_transcriptions(), 0)
+        release.set()
+        app._pipeline.join()
+        self.assertEqual(app._job_stats.cancelled, 1)
+        mock_injector.return_value.paste.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -44,6 +44,11 @@ class TestLoggingSecurity(unittest.TestCase):
         mock_config_instance.load.return_value.start_sound_path = None
         mock_config_instance.load.return_value.stop_sound_path = None
         mock_config_instance.load.return_value.model_timeout = 300.0
+        mock_config_instance.load.return_value.vad_trim = False
+        mock_config_instance.load.return_value.inference_process = False
+        mock_config_instance.load.return_value.pipeline_queue_size = 4
+        mock_config_instance.load.return_value.inference_workers = 1
+        mock_config_instance.load.return_value.async_core = False
         mock_config_instance.model_dir.return_value = "models/test-model"
 
         # Capture logs
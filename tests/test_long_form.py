@@ -0,0 +1,102 @@
+import unittest
+
+import numpy as np
+
+from chirp.long_form import Chunk, find_segment_end, merge_transcripts, plan_chunks
+
+SR = 16_000
+
+
+def _noise(seconds: float, level: float = 0.2, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return (level * rng.standard_normal(int(SR * seconds))).astype(np.float32)
+
+
+class TestPlanChunks(unittest.TestCase):
+    def test_short_audio_is_single_chunk(self):
+        """Audio within one window is not split."""
+        self.assertEqual(
+            plan_chunks(_noise(5.0), SR, chunk_seconds=10.0, overlap_seconds=1.0),
+            [Chunk(0, 5 * SR)],
+        )
+
+    def test_prefers_silence_near_boundary(self):
+        """A pause shortly before the window end becomes the cut, with no overlap."""
+        waveform = np.concatenate(
+            [_noise(8.0), np.zeros(SR // 2, dtype=np.float32), _noise(6.0, seed=1)]
+        )
+        chunks = plan_chunks(waveform, SR, chunk_seconds=10.0, overlap_seconds=1.0)
+
+        self.assertEqual(len(chunks), 2)
+        self.assertGreaterEqual(chunks[0].end, 8 * SR)
+        self.assertLessEqual(chunks[0].end, int(8.5 * SR))
+        self.assertEqual(chunks[1].start, chunks[0].end)
+        self.assertFalse(chunks[1].overlaps_previous)
+
+    def test_fixed_windows_overlap_without_silence(self):
+        """Continuous speech is cut at fixed windows that overlap."""
+        chunks = plan_chunks(_noise(25.0), SR, chunk_seconds=10.0, overlap_seconds=1.0)
+
+        self.assertEqual([c.start for c in chunks], [0, 9 * SR, 18 * SR])
+        self.assertTrue(all(c.overlaps_previous for c in chunks[1:]))
+        self.assertEqual(chunks[-1].end, 25 * SR)
+        self.assertTrue(all(c.samples <= 10 * SR for c in chunks))
+
+
+class TestMergeTranscripts(unittest.TestCase):
+    def test_removes_duplicated_overlap(self):
+        """Words decoded twice in an overlap appear once."""
+        chunks = [Chunk(0, 10), Chunk(8, 20, overlaps_previous=True)]
+        merged = merge_transcripts(
+            ["we went to the store and then", "the store and then we left."], chunks
+        )
+        self.assertEqual(merged, "we went to the store and then we left.")
+
+    def test_tolerates_garbled_edge_words(self):
+        """Partial words at the cut do not prevent the splice."""
+        chunks = [Chunk(0, 10), Chunk(8, 20, overlaps_previous=True)]
+        merged = merge_transcripts(
+            ["the quick brown fox jum", "own fox jumps over the lazy dog"], chunks
+        )
+        self.assertEqual(merged, "the quick brown fox jumps over the lazy dog")
+
+    def test_silence_cuts_are_concatenated(self):
+        """Chunks split at silence are joined verbatim."""
+        chunks = [Chunk(0, 10), Chunk(10, 20)]
+        self.assertEqual(merge_transcripts(["Hello there.", "Hello again."], chunks), "Hello there. Hello again.")
+
+
+class TestFindSegmentEnd(unittest.TestCase):
+    def test_waits_for_min_seconds(self):
+        """Nothing is closed before min_seconds of audio have arrived."""
+        waveform = np.concatenate([_noise(1.0), np.zeros(SR, dtype=np.float32)])
+        self.assertIsNone(
+            find_segment_end(waveform, SR, min_seconds=3.0, max_seconds=10.0)
+        )
+
+    def test_closes_at_first_pause_after_min(self):
+        """The segment ends inside the first sufficiently long pause."""
+        waveform = np.concatenate(
+            [
+                _noise(1.0),
+                np.zeros(SR // 2, dtype=np.float32),  # too early
+                _noise(2.0, seed=1),
+                np.zeros(SR // 2, dtype=np.float32),
+                _noise(1.0, seed=2),
+            ]
+        )
+        end = find_segment_end(waveform, SR, min_seconds=2.0, max_seconds=10.0)
+        self.assertIsNotNone(end)
+        self.assertGreater(end / SR, 3.5)
+        self.assertLess(end / SR, 4.0)
+
+    def test_forces_cut_at_max_without_pause(self):
+        """Continuous speech is cut no later than max_seconds."""
+        end = find_segment_end(_noise(12.0), SR, min_seconds=2.0, max_seconds=8.0)
+        self.assertIsNotNone(end)
+        self.assertLessEqual(end, 8 * SR)
+        self.assertIsNone(find_segment_end(_noise(6.0), SR, min_seconds=2.0, max_seconds=8.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
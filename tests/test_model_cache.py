@@ -0,0 +1,116 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import onnxruntime as ort
+
+from chirp.model_cache import MANIFEST_NAME, OptimizedModelCache
+
+
+def _fake_session(path, sess_options=None, providers=None):
+    """Stand-in for InferenceSession that 'optimizes' by copying the file."""
+    Path(sess_options.optimized_model_filepath).write_bytes(
+        b"optimized:" + Path(path).read_bytes()
+    )
+    return MagicMock()
+
+
+@patch("chirp.model_cache.ort.InferenceSession", side_effect=_fake_session)
+class TestOptimizedModelCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.model_dir = root / "model"
+        self.model_dir.mkdir()
+        (self.model_dir / "encoder-model.int8.onnx").write_bytes(b"encoder")
+        (self.model_dir / "config.json").write_text("{}")
+        self.files = sorted(self.model_dir.iterdir())
+        self.cache = OptimizedModelCache(root=root / "model.ort-cache", logger=MagicMock())
+        self.options = ort.SessionOptions()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _prepare(self, quantization="int8"):
+        return self.cache.prepare(
+            model_name="test",
+            quantization=quantization,
+            source_files=self.files,
+            session_options=self.options,
+            providers=["CPUExecutionProvider"],
+        )
+
+    def test_build_then_hit(self, mock_session):
+        """The first prepare builds the entry; the second reuses it."""
+        entry = self._prepare()
+        self.assertEqual(mock_session.call_count, 1)
+        self.assertTrue((entry / MANIFEST_NAME).is_file())
+        self.assertEqual(
+            (entry / "encoder-model.int8.onnx").read_bytes(), b"optimized:encoder"
+        )
+        self.assertEqual((entry / "config.json").read_text(), "{}")
+
+        self.assertEqual(self._prepare(), entry)
+        self.assertEqual(mock_session.call_count, 1)
+
+    @patch("chirp.model_cache.STALE_ENTRY_SECONDS", -1.0)
+    def test_changed_inputs_invalidate_entry(self, mock_session):
+        """A new quantization, option or model file gets a new entry; unused old ones go."""
+        first = self._prepare()
+
+        self.options.graph_optimization_level = (
+            ort.GraphOptimizationLevel.ORT_ENABLE_BASIC
+        )
+        second = self._prepare()
+        self.assertNotEqual(first, second)
+        self.assertFalse(first.exists())
+
+        (self.model_dir / "encoder-model.int8.onnx").write_bytes(b"encoder v2")
+        third = self._prepare()
+        self.assertNotEqual(second, third)
+        self.assertEqual(
+            (third / "encoder-model.int8.onnx").read_bytes(), b"optimized:encoder v2"
+        )
+        self.assertEqual([p.name for p in self.cache.root.iterdir()], [third.name])
+
+        with patch("chirp.model_cache.ort.__version__", "0.0.0"):
+            self.assertNotEqual(self._prepare(), third)
+        with patch("chirp.model_cache.cpu_key", return_value="other-cpu-8t"):
+            self.assertNotEqual(self._prepare(), third)
+
+    def test_recently_used_entries_are_kept(self, mock_session):
+        """An entry loaded recently may belong to another process and survives."""
+        first = self._prepare()
+        self.options.graph_optimization_level = (
+            ort.GraphOptimizationLevel.ORT_ENABLE_BASIC
+        )
+        second = self._prepare()
+        self.assertTrue((first / MANIFEST_NAME).is_file())
+
+        old = time.time() - 30 * 24 * 3600
+        os.utime(first / MANIFEST_NAME, (old, old))
+        self.options.graph_optimization_level = (
+            ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+        )
+        self._prepare()
+        self.assertFalse(first.exists())
+        self.assertTrue(second.exists())
+
+    def test_failed_build_falls_back(self, mock_session):
+        """A build error returns None and leaves no partial entry behind."""
+        mock_session.side_effect = RuntimeError("boom")
+        self.assertIsNone(self._prepare())
+        self.assertEqual(list(self.cache.root.iterdir()), [])
+
+    def test_no_model_files(self, mock_session):
+        """Without ONNX files there is nothing to cache."""
+        self.files = [self.model_dir / "config.json"]
+        self.assertIsNone(self._prepare())
+        mock_session.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
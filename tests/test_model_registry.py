@@ -0,0 +1,202 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from chirp.model_registry import ModelRegistry
+
+MIB = 2**20
+
+
+class FakeManager:
+    """ParakeetManager stand-in that tracks load state and refuses unloads while leased."""
+
+    def __init__(self, name, size_mb):
+        self.name = name
+        self.size = size_mb * MIB
+        self.is_loaded = True
+        self.leased = False
+        self.loads = 1
+        self.closed = False
+
+    def weights_bytes(self):
+        return self.size
+
+    def unload(self):
+        if self.leased or not self.is_loaded:
+            return False
+        self.is_loaded = False
+        return True
+
+    def preload(self):
+        if self.is_loaded:
+            return False
+        self.is_loaded = True
+        self.loads += 1
+        return True
+
+    def transcribe(self, audio, **_kwargs):
+        if not self.is_loaded:
+            self.preload()
+        return self.name
+
+    def close(self):
+        self.closed = True
+
+
+class TestModelRegistry(unittest.TestCase):
+    def setUp(self):
+        self.managers = {}
+
+    def _factory(self, name):
+        manager = FakeManager(name, {"big": 600, "small": 200, "tiny": 100}[name])
+        self.managers[name] = manager
+        return manager
+
+    def _registry(self, budget_mb=0):
+        return ModelRegistry(
+            factory=self._factory, budget_bytes=int(budget_mb * MIB), logger=MagicMock()
+        )
+
+    def test_hits_and_misses(self):
+        """The first use of a model is a miss; later uses of the loaded model are hits."""
+        registry = self._registry()
+        audio = np.zeros(16, dtype=np.float32)
+        self.assertEqual(registry.transcribe(audio, model="small"), "small")
+        registry.transcribe(audio, model="small")
+        registry.transcribe(audio, model="tiny")
+        stats = registry.stats()
+        self.assertEqual((stats["small"].hits, stats["small"].misses), (1, 1))
+        self.assertEqual((stats["tiny"].hits, stats["tiny"].misses), (0, 1))
+        self.assertEqual(list(registry.loaded()), ["small", "tiny"])
+
+    def test_evicts_least_recently_used(self):
+        """Loading past the budget unloads the least recently used model first."""
+        registry = self._registry(budget_mb=800)
+        registry.get("small")
+        registry.get("tiny")
+        registry.get("small")  # tiny is now least recently used
+        registry.get("big")
+        self.assertFalse(self.managers["tiny"].is_loaded)
+        self.assertTrue(self.managers["small"].is_loaded)
+        self.assertEqual(registry.stats()["tiny"].evictions, 1)
+        self.assertEqual(list(registry.loaded()), ["small", "big"])
+
+        # An evicted model reloads on demand (a miss) and makes room again.
+        registry.transcribe(np.zeros(16, dtype=np.float32), model="tiny")
+        self.assertTrue(self.managers["tiny"].is_loaded)
+        self.assertFalse(self.managers["small"].is_loaded)
+        self.assertEqual(registry.stats()["tiny"].misses, 2)
+        self.assertEqual(self.managers["tiny"].loads, 2)
+
+    def test_leased_model_is_not_evicted(self):
+        """A model in use stays loaded; the budget is exceeded with a warning."""
+        registry = self._registry(budget_mb=700)
+        registry.get("small")
+        self.managers["small"].leased = True
+        registry.get("big")
+        self.assertTrue(self.managers["small"].is_loaded)
+        self.assertEqual(registry.stats()["small"].evictions, 0)
+        registry._logger.warning.assert_called_once()
+
+    def test_prepare_creates_and_reloads_in_background(self):
+        """prepare() builds a new model off-thread and preloads an evicted one."""
+        registry = self._registry(budget_mb=300)
+        registry.prepare("small")
+        deadline = time.monotonic() + 5
+        while "small" not in registry.loaded() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertIn("small", registry.loaded())
+        self.assertEqual(registry.stats(), {})  # preparing is neither a hit nor a miss
+
+        registry.get("big")
+        self.assertFalse(self.managers["small"].is_loaded)
+        registry.prepare("small")
+        self.assertTrue(self.managers["small"].is_loaded)
+        self.assertEqual(self.managers["small"].loads, 2)
+        self.assertFalse(self.managers["big"].is_loaded)
+
+    def test_model_is_created_once(self):
+        """Concurrent requests for a new model share one manager."""
+        registry = self._registry()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.get("small")))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(manager) for manager in results}), 1)
+
+    def test_build_does_not_hold_the_registry_lock(self):
+        """A cold load of one model does not stall prepare() or stats() for another."""
+        registry = self._registry()
+        registry.get("small")
+        building = threading.Event()
+        release = threading.Event()
+        built = []
+
+        def slow_factory(name):
+            built.append(name)
+            building.set()
+            release.wait(5)
+            return self._factory(name)
+
+        registry._factory = slow_factory
+        loader = threading.Thread(target=registry.get, args=("big",))
+        loader.start()
+        self.assertTrue(building.wait(5))
+        started = time.perf_counter()
+        registry.prepare("small")
+        registry.prepare("big")  # already being built; no second build
+        registry.stats()
+        self.assertLess(time.perf_counter() - started, 0.5)
+        release.set()
+        loader.join(5)
+        self.assertEqual(set(registry.loaded()), {"small", "big"})
+        self.assertEqual(built, ["big"])
+
+    def test_eviction_does_not_hold_the_registry_lock(self):
+        """A slow unload does not stall stats() or a hit on another model."""
+        registry = self._registry(budget_mb=800)
+        registry.get("small")
+        registry.get("tiny")
+        registry.get("big")  # evicts small
+        unloading = threading.Event()
+        release = threading.Event()
+        tiny = self.managers["tiny"]
+        unload = tiny.unload
+
+        def slow_unload():
+            unloading.set()
+            release.wait(5)
+            return unload()
+
+        tiny.unload = slow_unload
+        loader = threading.Thread(target=registry.get, args=("small",))
+        loader.start()
+        self.assertTrue(unloading.wait(5))
+        started = time.perf_counter()
+        registry.stats()
+        registry.get("big")
+        self.assertLess(time.perf_counter() - started, 0.5)
+        release.set()
+        loader.join(5)
+        self.assertFalse(tiny.is_loaded)
+        self.assertEqual(registry.stats()["tiny"].evictions, 1)
+
+    def test_close_closes_all_managers(self):
+        """close() closes every manager the registry created."""
+        registry = self._registry()
+        registry.get("small")
+        registry.get("tiny")
+        registry.close()
+        self.assertTrue(all(manager.closed for manager in self.managers.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
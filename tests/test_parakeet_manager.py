@@ -1,3 +1,5 @@
+import tempfile
+import threading
 import time
 import unittest
 from pathlib import Path
@@ -5,7 +7,10 @@ from unittest.mock import MagicMock, patch
 
 import numpy as np
 
+from chirp.config_manager import OnnxSettings
+from chirp.jobs import DeadlineExceededError, JobCancelledError, TranscriptionJob
 from chirp.parakeet_manager import ParakeetManager
+from chirp.scheduler import Scheduler
 
 
 class TestParakeetManager(unittest.TestCase):
@@ -47,7 +52,7 @@ class TestParakeetManager(unittest.TestCase):
         self.assertEqual(mock_onnx.load_model.call_count, load_count_initial + 1)
 
         # 4. Cleanup
-        manager._stop_monitor.set()
+        manager.close()
         time.sleep(0.05)
 
     @patch("chirp.parakeet_manager.onnx_asr")
@@ -85,13 +90,15 @@ class TestParakeetManager(unittest.TestCase):
         self.assertIsNotNone(manager._model)
         self.assertEqual(manager._last_access, 2000.0)
 
-        manager._stop_monitor.set()
+        manager.close()
         time.sleep(0.05)
 
     @patch("chirp.parakeet_manager.onnx_asr")
-    def test_timeout_zero_disables_monitor(self, mock_onnx):
-        """Test that timeout=0 disables the monitor thread."""
+    def test_timeout_zero_schedules_no_unload(self, mock_onnx):
+        """Test that timeout=0 schedules no unload timer."""
         mock_onnx.load_model.return_value = MagicMock()
+        scheduler = Scheduler()
+        self.addCleanup(scheduler.close)
 
         manager = ParakeetManager(
             model_name="test",
@@ -101,12 +108,552 @@ class TestParakeetManager(unittest.TestCase):
             logger=self.logger,
             model_dir=self.model_dir,
             timeout=0,
+            scheduler=scheduler,
         )
 
-        # Monitor thread should not be started
-        self.assertIsNone(manager._monitor_thread)
+        self.assertEqual(scheduler.pending(), [])
         self.assertIsNotNone(manager._model)
 
+    @patch("chirp.parakeet_manager.onnx_asr")
+    def test_long_audio_is_chunked(self, mock_onnx):
+        """Audio longer than chunk_seconds is recognized window by window."""
+        mock_model_instance = MagicMock()
+        mock_model_instance.recognize.side_effect = ["one two three", "three four"]
+        mock_onnx.load_model.return_value = mock_model_instance
+
+        manager = ParakeetManager(
+            model_name="test",
+            quantization=None,
+            provider_key="cpu",
+            threads=1,
+            logger=self.logger,
+            model_dir=self.model_dir,
+            timeout=0,
+            chunk_seconds=10.0,
+            chunk_overlap=1.0,
+        )
+        rng = np.random.default_rng(0)
+        audio = (0.2 * rng.standard_normal(16000 * 15)).astype(np.float32)
+        result = manager.transcribe(audio)
+
+        self.assertEqual(result, "one two three four")
+        self.assertEqual(mock_model_instance.recognize.call_count, 2)
+        first = mock_model_instance.recognize.call_args_list[0].args[0]
+        self.assertEqual(first.size, 16000 * 10)
+        self.assertTrue(np.shares_memory(first, audio))
+
+    @patch("chirp.parakeet_manager.onnx_asr")
+    def test_cancelled_job_stops_between_chunks(self, mock_onnx):
+        """Long-form decoding checks the job before each chunk."""
+        job = TranscriptionJob()
+        mock_model_instance = MagicMock()
+        mock_model_instance.recognize.side_effect = lambda *_a, **_kw: job.cancel() or "one"
+        mock_onnx.load_model.return_value = mock_model_instance
+        manager = ParakeetManager(
+            model_name="test",
+            quantization=None,
+            provider_key="cpu",
+            threads=1,
+            logger=self.logger,
+            model_dir=self.model_dir,
+            timeout=0,
+            chunk_seconds=10.0,
+        )
+        audio = np.ones(16000 * 35, dtype=np.float32)
+        with self.assertRaises(JobCancelledError):
+            manager.transcribe(audio, job=job)
+        self.assertEqual(mock_model_instance.recognize.call_count, 1)
+
+        with self.assertRaises(DeadlineExceededError):
+            manager.transcribe(audio, job=TranscriptionJob(deadline=1e-9))
+        self.assertEqual(mock_model_instance.recognize.call_count, 1)
+
+    @patch("chirp.parakeet_manager.onnx_asr")
+    def test_transcribe_batch_sorts_and_restores_order(self, mock_onnx):
+        """Utterances are batched by length; results come back in input order."""
+        mock_model = MagicMock()
+        mock_model.recognize.side_effect = lambda batch, **_kw: [
+            f"len{audio.size}" for audio in batch
+        ]
+        mock_onnx.load_model.return_value = mock_model
+        manager = ParakeetManager(
+            model_name="test",
+            quantization=None,
+            provider_key="cpu",
+            threads=1,
+            logger=self.logger,
+            model_dir=self.model_dir,
+            timeout=0,
+        )
+        sizes = [500, 100, 0, 400, 200]
+        waveforms = [np.ones(size, dtype=np.float32) for size in sizes]
+        texts = manager.transcribe_batch(
+            waveforms, max_batch_size=2, max_batch_seconds=1.0, language="en"
+        )
+
+        self.assertEqual(texts, ["len500", "len100", "", "len400", "len200"])
+        batches = [
+            [audio.size for audio in call.args[0]]
+            for call in mock_model.recognize.call_args_list
+        ]
+        self.assertEqual(batches, [[100, 200], [400, 500]])
+        self.assertEqual(mock_model.recognize.call_args.kwargs["language"], "en")
+        self.assertEqual(manager.transcribe_batch([]), [])
+
+    @patch("chirp.parakeet_manager.onnx_asr")
+    def test_chunks_decoded_on_session_pool_in_order(self, mock_onnx):
+        """With pool_size > 1 chunks go to separate sessions and merge in order."""
+        sessions = []
+
+        def _make_session(*_args, **_kwargs):
+            session = MagicMock()
+
+            def _recognize(waveform, **_kw):
+                # Later chunks finish first to prove ordering is restored.
+                index = int(round(float(waveform[0]) * 10)) - 1
+                time.sleep(0.01 * (3 - index))
+                return f"w{index}"
+
+            session.recognize.side_effect = _recognize
+            sessions.append(session)
+            return session
+
+        mock_onnx.load_model.side_effect = _make_session
+        manager = ParakeetManager(
+            model_name="test",
+            quantization=None,
+            provider_key="cpu",
+            threads=8,
+            logger=self.logger,
+            model_dir=self.model_dir,
+            timeout=0,
+            chunk_seconds=10.0,
+            chunk_overlap=0.0,
+            pool_size=2,
+        )
+        # Three 10 s windows of constant "speech", each tagged with its index.
+        audio = np.concatenate(
+            [np.full(16000 * 10, (i + 1) / 10, dtype=np.float32) for i in range(3)]
+        )
+        result = manager.transcribe(audio)
+
+        self.assertEqual(result, "w0 w1 w2")
+        # Primary model plus two pool sessions.
+        self.assertEqual(len(sessions), 3)
+        self.assertEqual(sessions[0].recognize.call_count, 0)
+        self.assertEqual(
+            sessions[1].recognize.call_count + sessions[2].recognize.call_count, 3
+        )
+        self.assertEqual(manager._pool_threads(), 4)
+
+    @patch("chirp.parakeet_manager.onnx_asr")
+    @patch("chirp.parakeet_manager.time.time")
+    def test_warmup_after_every_load(self, mock_time, mock_onnx):
+        """A dummy inference runs after the initial load and after each reload."""
+        mock_model_instance = MagicMock()
+        mock_model_instance.recognize.return_value = ""
+        mock_onnx.load_model.return_value = mock_model_instance
+        mock_time.return_value = 1000.0
+
+        manager = ParakeetManager(
+            model_name="test",
+            quantization=None,
+            provider_key="cpu",
+            threads=1,
+            logger=self.logger,
+            model_dir=self.model_dir,
+            timeout=100.0,
+            warmup_seconds=0.5,
+        )
+        self.assertEqual(mock_model_instance.recognize.call_count, 1)
+        warmup_audio = mock_model_instance.recognize.call_args.args[0]
+        self.assertEqual(warmup_audio.size, 8000)
+        self.assertFalse(warmup_audio.any())
+
+        mock_time.return_value = 1200.0
+        manager._unload_model()
+        manager.ensure_loaded()
+        self.assertEqual(mock_model_instance.recognize.call_count, 2)
+
+        manager.close()
+
+    @patch("chirp.parakeet_manager.onnx_asr")
+    def test_first_transcription_after_load_is_logged(self, mock_onnx):
+        """Only the first transcription after a load reports its duration."""
+        mock_model_instance = MagicMock()
+        mock_model_instance.recognize.return_value = "hi"
+        mock_onnx.load_model.return_value = mock_model_instance
+
+        manager = ParakeetManager(
+            model_name="test",
+            quantization=None,
+            provider_key="cpu",
+            threads=1,
+            logger=self.logger,
+            model_dir=self.model_dir,
+            timeout=0,
+        )
+        audio = np.ones(16000, dtype=np.float32)
+        manager.transcribe(audio)
+        manager.transcribe(audio)
+
+        messages = [call.args[0] for call in self.logger.info.call_args_list]
+        self.assertEqual(
+            sum(m.startswith("First transcription after model load") for m in messages), 1
+        )
+
+    @patch("chirp.parakeet_manager.onnx_asr")
+    @patch("chirp.parakeet_manager.time.time")
+    def test_preload_reloads_in_background(self, mock_time, mock_onnx):
+        """preload() reloads an unloaded model before transcribe() needs it."""
+        mock_model_instance = MagicMock()
+        mock_model_instance.recognize.return_value = "hello"
+        mock_onnx.load_model.return_value = mock_model_instance
+        mock_time.return_value = 1000.0
+
+        manager = ParakeetManager(
+            model_name="test",
+            quantization=None,
+            provider_key="cpu",
+            threads=1,
+            logger=self.logger,
+            model_dir=self.model_dir,
+            timeout=100.0,
+        )
+        self.assertFalse(manager.preload())  # already loaded
+
+        mock_time.return_value = 1200.0
+        manager._unload_model()
+        self.assertTrue(manager.preload())
+        manager._preload_thread.join(timeout=5)
+        self.assertIsNotNone(manager._model)
+        self.assertEqual(mock_onnx.load_model.call_count, 2)
+
+        self.assertEqual(manager.transcribe(np.ones(16000, dtype=np.float32)), "hello")
+        self.assertEqual(mock_onnx.load_model.call_count, 2)
+        messages = [call.args[0] for call in self.logger.info.call_args_list]
+        self.assertTrue(any("hidden behind recording" in m for m in messages))
+
+        manager.close()
+
+    @patch("chirp.parakeet_manager.onnx_asr")
+    def test_load_runs_outside_the_lock(self, mock_onnx):
+        """preload() and metrics never wait for a reload; concurrent callers share it."""
+        mock_onnx.load_model.return_value = MagicMock()
+        manager = ParakeetManager(
+            model_name="test",
+            quantization=None,
+            provider_key="cpu",
+            threads=1,
+            logger=self.logger,
+            model_dir=self.model_dir,
+            timeout=0,
+        )
+        self.assertTrue(manager.unload())
+        loading = threading.Event()
+        release = threading.Event()
+
+        def slow_load(*_args, **_kwargs):
+            loading.set()
+            release.wait(5)
+            return MagicMock()
+
+        mock_onnx.load_model.side_effect = slow_load
+
+        self.assertTrue(manager.preload())
+        self.assertTrue(loading.wait(5))
+        started = time.perf_counter()
+        self.assertFalse(manager.preload())  # a load is already running
+        self.assertEqual(manager.metrics.loads, 1)
+        self.assertLess(time.perf_counter() - started, 0.5)
+
+        waiter = threading.Thread(target=manager.ensure_loaded)
+        waiter.start()
+        release.set()
+        waiter.join(5)
+        manager._preload_thread.join(5)
+        self.assertTrue(manager.is_loaded)
+        self.assertEqual(mock_onnx.load_model.call_count, 2)
+        self.assertEqual(manager.metrics.loads, 2)
+        manager.close()
+
+    @patch("chirp.parakeet_manager.onnx_asr")
+    def test_prefetch_reads_only_configured_variant(self, mock_onnx):
+        """Prefetch covers the int8 files plus shared assets, not the fp32 weights."""
+        mock_onnx.load_model.return_value = MagicMock()
+        with tempfile.TemporaryDirectory() as tmp:
+            model_dir = Path(tmp)
+            for name in (
+                "config.json",
+                "vocab.txt",
+                "encoder-model.onnx",
+                "encoder-model.onnx.data",
+                "encoder-model.int8.onnx",
+                "decoder_joint-model.onnx",
+                "decoder_joint-model.int8.onnx",
+                "nemo128.onnx",
+            ):
+                (model_dir / name).write_bytes(b"x" * 10)
+
+            manager = ParakeetManager(
+                model_name="test",
+                quantization="int8",
+                provider_key="cpu",
+                threads=1,
+                logger=self.logger,
+                model_dir=model_dir,
+                timeout=0,
+            )
+            names = sorted(path.name for path in manager._model_files())
+            self.assertEqual(
+                names,
+                [
+                    "config.json",
+                    "decoder_joint-model.int8.onnx",
+                    "encoder-model.int8.onnx",
+                    "nemo128.onnx",
+                    "vocab.txt",
+                ],
+            )
+            self.assertEqual(manager._prefetch_model_files(), 50)
+
+    @patch("chirp.model_cache.ort.InferenceSession")
+    @patch("chirp.parakeet_manager.onnx_asr")
+    def test_loads_from_optimized_cache(self, mock_onnx, mock_session):
+        """With a cache directory the loader reads saved graphs without re-optimizing."""
+        import onnxruntime as ort
+
+        mock_onnx.load_model.return_value = MagicMock()
+        mock_session.side_effect = lambda path, sess_options, providers: Path(
+            sess_options.optimized_model_filepath
+        ).write_bytes(b"optimized")
+        with tempfile.TemporaryDirectory() as tmp:
+            model_dir = Path(tmp) / "model"
+            model_dir.mkdir()
+            (model_dir / "config.json").write_text("{}")
+            (model_dir / "encoder-model.onnx").write_bytes(b"raw")
+
+            manager = ParakeetManager(
+                model_name="test",
+                quantization=None,
+                provider_key="cpu",
+                threads=2,
+                logger=self.logger,
+                model_dir=model_dir,
+                timeout=0,
+                cache_dir=Path(tmp) / "model.ort-cache",
+            )
+            kwargs = mock_onnx.load_model.call_args.kwargs
+            cache_path = Path(kwargs["path"])
+            self.assertEqual(cache_path.parent, Path(tmp) / "model.ort-cache")
+            self.assertEqual((cache_path / "encoder-model.onnx").read_bytes(), b"optimized")
+            options = kwargs["sess_options"]
+            self.assertEqual(
+                options.graph_optimization_level,
+                ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+            )
+            self.assertEqual(options.intra_op_num_threads, 2)
+
+            # A reload hits the cache instead of optimizing again.
+            manager._model = None
+            manager.ensure_loaded()
+            self.assertEqual(mock_session.call_count, 1)
+            self.assertEqual(Path(mock_onnx.load_model.call_args.kwargs["path"]), cache_path)
+            with self.assertRaises(RuntimeError):  # prepacking stays on by default
+                options.get_session_config_entry("session.disable_prepacking")
+
+            # Prefetching before a reload reads the cached graphs, not the originals.
+            self.assertEqual(
+                [path.name for path in manager._load_files()],
+                sorted(path.name for path in cache_path.iterdir()),
+            )
+
+            manager = ParakeetManager(
+                model_name="test",
+                quantization=None,
+                provider_key="cpu",
+                threads=2,
+                logger=self.logger,
+                model_dir=model_dir,
+                timeout=0,
+                cache_dir=Path(tmp) / "model.ort-cache",
+                mmap_weights=True,
+            )
+            options = mock_onnx.load_model.call_args.kwargs["sess_options"]
+            self.assertEqual(options.get_session_config_entry("session.disable_prepacking"), "1")
+
+    @patch("chirp.parakeet_manager.onnx_asr")
+    def test_session_options_from_onnx_settings(self, mock_onnx):
+        """[onnx] settings are applied to the session options passed to the loader."""
+        import onnxruntime as ort
+
+        mock_onnx.load_model.return_value = MagicMock()
+        settings = OnnxSettings(
+            graph_optimization="basic",
+            execution_mode="parallel",
+            inter_op_threads=2,
+            enable_mem_pattern=False,
+            enable_cpu_mem_arena=False,
+            allow_spinning=False,
+            flush_denormals=True,
+            intra_op_thread_affinities="2;3",
+        )
+        ParakeetManager(
+            model_name="test",
+            quantization=None,
+            provider_key="cpu",
+            threads=3,
+            logger=self.logger,
+            model_dir=self.model_dir,
+            timeout=0,
+            onnx_settings=settings,
+        )
+        options = mock_onnx.load_model.call_args.kwargs["sess_options"]
+        self.assertEqual(
+            options.graph_optimization_level, ort.GraphOptimizationLevel.ORT_ENABLE_BASIC
+        )
+        self.assertEqual(options.execution_mode, ort.ExecutionMode.ORT_PARALLEL)
+        self.assertEqual(options.inter_op_num_threads, 2)
+        self.assertEqual(options.intra_op_num_threads, 3)
+        self.assertFalse(options.enable_mem_pattern)
+        self.assertFalse(options.enable_cpu_mem_arena)
+        self.assertEqual(options.get_session_config_entry("session.intra_op.allow_spinning"), "0")
+        self.assertEqual(options.get_session_config_entry("session.set_denormal_as_zero"), "1")
+        self.assertEqual(
+            options.get_session_config_entry("session.intra_op_thread_affinities"), "2;3"
+        )
+        messages = [call.args[0] for call in self.logger.debug.call_args_list]
+        self.assertTrue(any(m.startswith("ONNX Runtime session:") for m in messages))
+
+    @patch("chirp.parakeet_manager.onnx_asr")
+    @patch("chirp.parakeet_manager.time.time")
+    def test_lease_defers_unload_and_collects_outside_lock(self, mock_time, mock_onnx):
+        """No unload while a transcription holds a lease; gc runs without the lock."""
+        mock_onnx.load_model.return_value = MagicMock()
+        mock_time.return_value = 1000.0
+        manager = ParakeetManager(
+            model_name="test",
+            quantization=None,
+            provider_key="cpu",
+            threads=1,
+            logger=self.logger,
+            model_dir=self.model_dir,
+            timeout=100.0,
+        )
+        with manager._lease():
+            mock_time.return_value = 1200.0
+            self.assertFalse(manager._unload_model())
+            self.assertIsNotNone(manager._model)
+        # Releasing the lease restarts the idle deadline.
+        self.assertFalse(manager._unload_model())
+
+        lock_held = []
+        mock_time.return_value = 1400.0
+        with patch(
+            "chirp.parakeet_manager.gc.collect",
+            side_effect=lambda: lock_held.append(manager._lock.locked()),
+        ):
+            self.assertTrue(manager._unload_model())
+        self.assertEqual(lock_held, [False])
+        self.assertIsNone(manager._model)
+        self.assertEqual(manager.metrics.unloads, 1)
+
+        manager.close()
+
+    @patch("chirp.parakeet_manager.onnx_asr")
+    def test_unload_now_respects_leases(self, mock_onnx):
+        """unload() ignores the idle deadline but never drops a leased model."""
+        mock_onnx.load_model.return_value = MagicMock()
+        manager = ParakeetManager(
+            model_name="test",
+            quantization=None,
+            provider_key="cpu",
+            threads=1,
+            logger=self.logger,
+            model_dir=self.model_dir,
+            timeout=0,
+        )
+        with manager._lease():
+            self.assertFalse(manager.unload())
+            self.assertTrue(manager.is_loaded)
+        self.assertTrue(manager.unload())
+        self.assertFalse(manager.is_loaded)
+        self.assertFalse(manager.unload())
+        self.assertTrue(manager.preload())
+        manager.close()
+
+    @patch("chirp.parakeet_manager.onnx_asr")
+    def test_forced_unload_cancels_timer_and_timer_unloads_off_scheduler(self, mock_onnx):
+        """unload() drops the idle timer; the timer releases the model on its own thread."""
+        mock_onnx.load_model.return_value = MagicMock()
+        scheduler = Scheduler()
+        self.addCleanup(scheduler.close)
+        manager = ParakeetManager(
+            model_name="test",
+            quantization=None,
+            provider_key="cpu",
+            threads=1,
+            logger=self.logger,
+            model_dir=self.model_dir,
+            timeout=60.0,
+            scheduler=scheduler,
+        )
+        self.assertEqual([t.name for t in scheduler.pending()], ["model-unload"])
+        self.assertTrue(manager.unload())
+        self.assertEqual(scheduler.pending(), [])
+
+        manager._timeout = 0.05
+        manager.ensure_loaded()
+        threads = []
+        with patch(
+            "chirp.parakeet_manager.gc.collect",
+            side_effect=lambda: threads.append(threading.current_thread().name),
+        ):
+            deadline = time.monotonic() + 5
+            while manager.metrics.unloads < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        self.assertEqual(threads, ["ModelUnload"])
+        manager.close()
+
+    @patch("chirp.parakeet_manager.onnx_asr")
+    def test_unload_timer_fires_at_deadline(self, mock_onnx):
+        """The unload timer fires once the idle deadline passes and re-arms after reload."""
+        mock_model = MagicMock()
+        mock_model.recognize.return_value = "hello"
+        mock_onnx.load_model.return_value = mock_model
+        scheduler = Scheduler()
+        self.addCleanup(scheduler.close)
+        manager = ParakeetManager(
+            model_name="test",
+            quantization=None,
+            provider_key="cpu",
+            threads=1,
+            logger=self.logger,
+            model_dir=self.model_dir,
+            timeout=0.1,
+            scheduler=scheduler,
+        )
+
+        def wait_for_unloads(count):
+            deadline = time.monotonic() + 5
+            while manager.metrics.unloads < count and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(manager.metrics.unloads, count)
+
+        wait_for_unloads(1)
+        self.assertIsNone(manager._model)
+
+        self.assertEqual(manager.transcribe(np.ones(1600, dtype=np.float32)), "hello")
+        metrics = manager.metrics
+        self.assertEqual((metrics.loads, metrics.reloads), (2, 1))
+        wait_for_unloads(2)
+
+        manager.ensure_loaded()
+        self.assertEqual([t.name for t in scheduler.pending()], ["model-unload"])
+        manager.close()
+        self.assertEqual(scheduler.pending(), [])
+        self.assertEqual(scheduler.stats().fired, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,300 @@
+import asyncio
+import sys
+import threading
+import time
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+# sounddevice needs PortAudio, which the test environment lacks.
+if "sounddevice" not in sys.modules:
+    mock_sd = types.ModuleType("sounddevice")
+    mock_sd.InputStream = MagicMock()
+    sys.modules["sounddevice"] = mock_sd
+
+from chirp.jobs import TranscriptionJob
+from chirp.main import ChirpApp, _Dictation, _IncrementalSession
+from chirp.pipeline import Pipeline, Stage
+
+
+class TestPipeline(unittest.TestCase):
+    def _pipeline(self, stages, **kwargs):
+        done = []
+        pipeline = Pipeline(
+            stages, on_done=lambda item, error: done.append((item, error)), **kwargs
+        )
+        self.addCleanup(pipeline.close)
+        return pipeline, done
+
+    def test_items_flow_in_order(self):
+        """Every item passes each stage once, in submission order."""
+        pipeline, done = self._pipeline(
+            [Stage("double", lambda x: x * 2), Stage("inc", lambda x: x + 1)]
+        )
+        for value in range(5):
+            pipeline.submit(value)
+        pipeline.join()
+        self.assertEqual(done, [(v * 2 + 1, None) for v in range(5)])
+        stats = pipeline.stats()
+        self.assertEqual(pipeline.stage_names, ["double", "inc"])
+        self.assertEqual(stats["inc"].processed, 5)
+        self.assertEqual(stats["inc"].depth, 0)
+
+    def test_drop_and_failure_finish_item(self):
+        """A stage returning None or raising ends the item; later stages never see it."""
+        seen = []
+
+        def check(x):
+            if x == 2:
+                raise ValueError("bad")
+            return None if x == 1 else x
+
+        pipeline, done = self._pipeline([Stage("check", check), Stage("tail", seen.append)])
+        for value in range(3):
+            pipeline.submit(value)
+        pipeline.join()
+        self.assertEqual(seen, [0])
+        # Dropped and failed items finish on the first stage's thread, so
+        # they may overtake item 0.
+        outcomes = {item: error for item, error in done}
+        self.assertIsNone(outcomes[1])
+        self.assertIsInstance(outcomes[2], ValueError)
+        stats = pipeline.stats()["check"]
+        self.assertEqual((stats.processed, stats.dropped, stats.failed), (3, 1, 1))
+
+    def test_backpressure_bounds_queues(self):
+        """A blocked stage fills its queue, then stalls the stages before it."""
+        release = threading.Event()
+        pipeline, done = self._pipeline(
+            [Stage("fast", lambda x: x), Stage("slow", lambda x: release.wait(5) and x)],
+            queue_size=2,
+        )
+        submitter = threading.Thread(target=lambda: [pipeline.submit(v) for v in range(8)])
+        submitter.start()
+        submitter.join(0.3)
+        # slow holds 1 item + 2 queued; fast holds 1 + 2 queued; submit is blocked.
+        self.assertTrue(submitter.is_alive())
+        stats = pipeline.stats()
+        self.assertEqual(stats["slow"].depth, 2)
+        self.assertLessEqual(stats["fast"].max_depth, 2)
+        release.set()
+        submitter.join(5)
+        pipeline.join()
+        self.assertEqual([item for item, _ in done], list(range(8)))
+        self.assertGreater(pipeline.stats()["slow"].wait_seconds, 0)
+
+    def test_parallel_stage_keeps_submission_order(self):
+        """Items finishing early on a multi-worker stage wait for earlier ones."""
+        delays = [0.15, 0.0, 0.05, 0.0, 0.1, 0.0]
+
+        def work(x):
+            time.sleep(delays[x])
+            return None if x == 3 else x
+
+        pipeline, done = self._pipeline(
+            [Stage("work", work, workers=3), Stage("emit", lambda x: x)]
+        )
+        for value in range(len(delays)):
+            pipeline.submit(value)
+        pipeline.join()
+        finished = [item for item, error in done if item != 3]
+        self.assertEqual(finished, [0, 1, 2, 4, 5])
+        self.assertGreater(pipeline.stats()["work"].reordered, 0)
+        self.assertEqual(pipeline.stats()["emit"].processed, 5)
+
+    def test_run_inline(self):
+        """run() uses the same stages on the calling thread and re-raises errors."""
+        pipeline, done = self._pipeline([Stage("inc", lambda x: x + 1)])
+        self.assertEqual(pipeline.run(1), 2)
+        self.assertEqual(done, [(2, None)])
+
+        failing, done = self._pipeline([Stage("fail", lambda x: 1 / x)])
+        with self.assertRaises(ZeroDivisionError):
+            failing.run(0)
+        self.assertIsInstance(done[0][1], ZeroDivisionError)
+
+
+@patch("chirp.main.TextInjector")
+@patch("chirp.main.AudioFeedback")
+@patch("chirp.main.AudioCapture")
+@patch("chirp.main.KeyboardShortcutManager")
+@patch("chirp.main.ConfigManager")
+class TestDictationStages(unittest.TestCase):
+    def _app(self, mock_config, manager, **settings):
+        config = mock_config.return_value.load.return_value
+        config.vad_trim = False
+        config.language = None
+        config.models = {}
+        config.model_memory_budget_mb = 0.0
+        config.inference_process = False
+        config.transcription_deadline = 0.0
+        config.latest_wins = False
+        config.pipeline_queue_size = 4
+        config.inference_workers = 1
+        config.async_core = False
+        config.incremental_transcription = False
+        config.max_recording_duration = 0
+        for key, value in settings.items():
+            setattr(config, key, value)
+        mock_config.return_value.model_dir.return_value = "models/test-model"
+        with patch("chirp.main.ParakeetManager", return_value=manager):
+            app = ChirpApp()
+            app.parakeet  # wait for the background load
+        return app
+
+    def test_incremental_phrases_join_in_order(
+        self, mock_config, mock_keyboard, mock_capture, mock_feedback, mock_injector
+    ):
+        """Phrases decoded during recording and the final tail are pasted together."""
+        manager = MagicMock()
+        manager.transcribe.side_effect = lambda audio, **_kw: f"w{audio.size}"
+        app = self._app(mock_config, manager)
+        session = _IncrementalSession()
+        for size in (100, 200):
+            app._pipeline.submit(
+                _Dictation(waveform=np.ones(size, dtype=np.float32), session=session, segment=True)
+            )
+            session.consumed += size
+        app._submit_job(_Dictation(waveform=np.ones(350, dtype=np.float32), session=session))
+        app._pipeline.join()
+
+        mock_injector.return_value.process.assert_called_once_with("w100 w200 w50")
+        self.assertEqual(session.segments, 2)
+        self.assertEqual(app._job_stats.completed, 1)
+        self.assertEqual(app._pipeline.stats()["inference"].processed, 3)
+
+    def test_back_to_back_recordings_paste_in_order(
+        self, mock_config, mock_keyboard, mock_capture, mock_feedback, mock_injector
+    ):
+        """A new recording starts while the last decodes; pastes follow recording order."""
+        release = threading.Event()
+
+        def transcribe(audio, **_kw):
+            if audio.size == 100:  # the first recording decodes slowest
+                release.wait(5)
+            return f"w{audio.size}"
+
+        manager = MagicMock()
+        manager.transcribe.side_effect = transcribe
+        app = self._app(mock_config, manager, inference_workers=2)
+        capture = mock_capture.return_value
+        capture.stop.side_effect = [np.ones(n, dtype=np.float32) for n in (100, 200, 300)]
+
+        for _ in range(3):
+            app.toggle_recording()  # start
+            app.toggle_recording()  # stop; returns without waiting for the decode
+        self.assertEqual(capture.start.call_count, 3)
+        time.sleep(0.1)
+        mock_injector.return_value.process.assert_not_called()
+        release.set()
+        app._pipeline.join()
+
+        calls = [c.args[0] for c in mock_injector.return_value.process.call_args_list]
+        self.assertEqual(calls, ["w100", "w200", "w300"])
+        self.assertEqual(mock_injector.return_value.paste.call_count, 3)
+
+    def test_hotkey_does_not_wait_for_recording_to_start(
+        self, mock_config, mock_keyboard, mock_capture, mock_feedback, mock_injector
+    ):
+        """Opening the device runs on the controller thread, not in the hook callback."""
+        app = self._app(mock_config, MagicMock(), primary_shortcut="ctrl+alt+d", cancel_shortcut="")
+        opening = threading.Event()
+        release = threading.Event()
+        mock_capture.return_value.start.side_effect = lambda: opening.set() or release.wait(5)
+        app._register_hotkey()
+        on_hotkey = mock_keyboard.return_value.register.call_args.args[1]
+
+        began = time.perf_counter()
+        on_hotkey()
+        self.assertLess(time.perf_counter() - began, 0.05)
+        self.assertTrue(opening.wait(5))
+        release.set()
+        app.controller.close()
+        self.assertTrue(app._recording)
+        mock_feedback.return_value.play_start.assert_called_once()
+
+    def test_cancel_hotkey_bypasses_a_busy_controller(
+        self, mock_config, mock_keyboard, mock_capture, mock_feedback, mock_injector
+    ):
+        """The cancel hotkey cancels jobs while the controller is blocked, and logs later."""
+        app = self._app(
+            mock_config, MagicMock(), primary_shortcut="ctrl+alt+d", cancel_shortcut="ctrl+alt+x"
+        )
+        logged = []
+        app.logger = MagicMock()
+        app.logger.info.side_effect = lambda msg, *args: logged.append(
+            (msg % args, threading.current_thread().name)
+        )
+        opening = threading.Event()
+        release = threading.Event()
+        mock_capture.return_value.start.side_effect = lambda: opening.set() or release.wait(5)
+        app._register_hotkey()
+        hooks = {c.args[0]: c.args[1] for c in mock_keyboard.return_value.register.call_args_list}
+        job = TranscriptionJob()
+        app._jobs.append(job)
+
+        hooks["ctrl+alt+d"]()
+        self.assertTrue(opening.wait(5))  # the controller is now busy
+        hooks["ctrl+alt+x"]()
+        self.assertTrue(job.cancelled)
+        self.assertEqual(logged, [])  # queued behind the busy command
+        release.set()
+        app.controller.close()
+        self.assertIn(("Cancelling 1 transcription(s)", "Controller"), logged)
+        self.assertEqual(app.controller.stats().hook_calls, 2)
+
+    def test_async_core_runs_dictation_on_event_loop(
+        self, mock_config, mock_keyboard, mock_capture, mock_feedback, mock_injector
+    ):
+        """With async_core, toggles and stages run on the loop; pastes stay in order."""
+        manager = MagicMock()
+        manager.transcribe.side_effect = lambda audio, **_kw: f"w{audio.size}"
+        app = self._app(mock_config, manager, async_core=True)
+        injector = mock_injector.return_value
+        injector.process.side_effect = lambda text: text
+        pasted = []
+
+        async def paste_async(text):
+            pasted.append((text, threading.current_thread().name))
+
+        injector.paste_async.side_effect = paste_async
+        capture = mock_capture.return_value
+        capture.stop.side_effect = [np.ones(n, dtype=np.float32) for n in (100, 200)]
+        hand_offs = []
+        hand_off = app._hand_off
+
+        def record_hand_off(dictation):
+            hand_offs.append(threading.current_thread().name)
+            hand_off(dictation)
+
+        app._hand_off = record_hand_off
+        for _ in range(4):
+            app.controller.post("toggle", app.toggle_recording)
+        app.controller.run(asyncio.sleep(0))  # the toggles have run
+        app.controller.run_blocking("flush", lambda: None).result()  # so have the hand-offs
+        app._pipeline.join()
+
+        self.assertEqual(pasted, [("w100", "EventLoop"), ("w200", "EventLoop")])
+        self.assertEqual(len(hand_offs), 2)
+        self.assertTrue(all(name.startswith("Blocking") for name in hand_offs))
+        injector.paste.assert_not_called()
+        self.assertEqual(app._job_stats.completed, 2)
+        app.controller.close()
+
+    def test_stage_with_stand_in(
+        self, mock_config, mock_keyboard, mock_capture, mock_feedback, mock_injector
+    ):
+        """Stages are plain methods; a silent recording stops at preprocessing."""
+        app = self._app(mock_config, MagicMock())
+        app.config.vad_trim = True
+        app.config.vad_threshold_db = -45.0
+        app.config.vad_padding_ms = 200.0
+        silent = _Dictation(waveform=np.zeros(16000, dtype=np.float32))
+        self.assertIsNone(app._stage_preprocess(silent))
+        self.assertIsNone(app._stage_handoff(_Dictation(waveform=np.zeros(0))))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import logging
+import threading
+import time
+import unittest
+
+from chirp.scheduler import Scheduler
+
+
+class TestScheduler(unittest.TestCase):
+    def _scheduler(self):
+        scheduler = Scheduler(logger=logging.getLogger("chirp.test_scheduler"))
+        self.addCleanup(scheduler.close)
+        return scheduler
+
+    def _wait_fired(self, scheduler, count):
+        deadline = time.monotonic() + 5
+        while scheduler.stats().fired < count and time.monotonic() < deadline:
+            time.sleep(0.005)
+        self.assertEqual(scheduler.stats().fired, count)
+
+    def test_timers_fire_in_deadline_order_on_one_thread(self):
+        """Calls run at their deadlines, earliest first, on the scheduler thread."""
+        scheduler = self._scheduler()
+        fired = []
+        for delay in (0.06, 0.02, 0.04):
+            scheduler.call_later(
+                delay, lambda d: fired.append((d, threading.current_thread().name)), delay
+            )
+        self._wait_fired(scheduler, 3)
+        self.assertEqual(fired, [(d, "Scheduler") for d in (0.02, 0.04, 0.06)])
+        self.assertLess(scheduler.stats().max_lateness_seconds, 0.05)
+
+    def test_cancel_and_introspection(self):
+        """Cancelled timers never run; pending() lists the rest, earliest first."""
+        scheduler = self._scheduler()
+        fired = []
+        late = scheduler.call_later(60, fired.append, "late", name="late")
+        soon = scheduler.call_later(30, fired.append, "soon", name="soon")
+        self.assertEqual([t.name for t in scheduler.pending()], ["soon", "late"])
+        self.assertTrue(soon.cancel())
+        self.assertFalse(soon.cancel())
+        self.assertFalse(soon.pending)
+        pending = scheduler.pending()
+        self.assertEqual([t.name for t in pending], ["late"])
+        self.assertGreater(pending[0].remaining, 59)
+        self.assertTrue(late.pending)
+        self.assertEqual(scheduler.stats().cancelled, 1)
+
+    def test_same_key_coalesces(self):
+        """Re-scheduling a key replaces the pending timer; only the last one runs."""
+        scheduler = self._scheduler()
+        fired = []
+        for value in range(3):
+            scheduler.call_later(0.02, fired.append, value, key="clear")
+        self.assertEqual(len(scheduler.pending()), 1)
+        self._wait_fired(scheduler, 1)
+        self.assertEqual(fired, [2])
+        self.assertEqual(scheduler.stats().coalesced, 2)
+
+        scheduler.call_later(60, fired.append, "never", key="clear")
+        self.assertTrue(scheduler.cancel("clear"))
+        self.assertFalse(scheduler.cancel("clear"))
+
+    def test_earlier_timer_wakes_sleeping_thread(self):
+        """A new earliest deadline is honoured while the thread waits on a later one."""
+        scheduler = self._scheduler()
+        fired = threading.Event()
+        scheduler.call_later(60, lambda: None)
+        time.sleep(0.01)  # the thread is now waiting on the 60 s timer
+        started = time.monotonic()
+        scheduler.call_later(0.02, fired.set)
+        self.assertTrue(fired.wait(5))
+        self.assertLess(time.monotonic() - started, 1.0)
+
+    def test_failing_callback_is_logged_and_close_drops_pending(self):
+        """One failing timer does not stop the others; close() discards what is left."""
+        scheduler = self._scheduler()
+        fired = []
+        with self.assertLogs("chirp.test_scheduler", level="ERROR"):
+            scheduler.call_later(0.0, lambda: 1 / 0, name="boom")
+            scheduler.call_later(0.01, fired.append, "after")
+            self._wait_fired(scheduler, 2)
+        self.assertEqual(fired, ["after"])
+        self.assertEqual(scheduler.stats().failed, 1)
+
+        scheduler.call_later(60, fired.append, "never")
+        scheduler.close()
+        self.assertEqual(scheduler.pending(), [])
+        with self.assertRaises(RuntimeError):
+            scheduler.call_later(0, fired.append, "closed")
+
+
+if __name__ == "__main__":
+    unittest.main()
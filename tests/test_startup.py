@@ -0,0 +1,91 @@
+import concurrent.futures
+import sys
+import threading
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+# sounddevice needs PortAudio, which the test environment lacks.
+if "sounddevice" not in sys.modules:
+    mock_sd = types.ModuleType("sounddevice")
+    mock_sd.InputStream = MagicMock()
+    sys.modules["sounddevice"] = mock_sd
+
+from chirp.main import ChirpApp
+from chirp.parakeet_manager import ModelNotPreparedError
+
+
+@patch("chirp.main.TextInjector")
+@patch("chirp.main.AudioFeedback")
+@patch("chirp.main.AudioCapture")
+@patch("chirp.main.KeyboardShortcutManager")
+@patch("chirp.main.ConfigManager")
+class TestParallelStartup(unittest.TestCase):
+    def _configure(self, mock_config):
+        config = mock_config.return_value.load.return_value
+        config.vad_trim = False
+        config.language = None
+        config.primary_shortcut = "ctrl+shift+insert"
+        config.models = {}
+        config.model_memory_budget_mb = 0.0
+        config.inference_process = False
+        config.cancel_shortcut = ""
+        config.pipeline_queue_size = 4
+        config.inference_workers = 1
+        config.async_core = False
+        mock_config.return_value.model_dir.return_value = "models/test-model"
+        return config
+
+    def test_hotkey_ready_before_model_and_recording_queued(
+        self, mock_config, mock_keyboard, mock_capture, mock_feedback, mock_injector
+    ):
+        """The hotkey registers while the model loads; early audio waits for it."""
+        self._configure(mock_config)
+        release = threading.Event()
+        manager = MagicMock()
+        manager.transcribe.return_value = "hello"
+
+        def _slow_load(**_kwargs):
+            release.wait(5)
+            return manager
+
+        with patch("chirp.main.ParakeetManager", side_effect=_slow_load):
+            app = ChirpApp()
+            app._register_hotkey()
+            mock_keyboard.return_value.register.assert_called_once()
+            self.assertFalse(app._model_future.done())
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                job = executor.submit(
+                    app._transcribe_and_inject, np.ones(16000, dtype=np.float32)
+                )
+                self.assertFalse(job.done())
+                release.set()
+                job.result(timeout=5)
+
+        manager.transcribe.assert_called_once()
+        injector = mock_injector.return_value
+        injector.process.assert_called_once_with("hello")
+        injector.paste.assert_called_once_with(injector.process.return_value)
+        self.assertIn("model", app._phase_times)
+        self.assertIn("injector", app._phase_times)
+
+    def test_missing_model_exits_from_run(
+        self, mock_config, mock_keyboard, mock_capture, mock_feedback, mock_injector
+    ):
+        """A model that is not prepared still ends the app with exit code 1."""
+        self._configure(mock_config)
+        with patch(
+            "chirp.main.ParakeetManager", side_effect=ModelNotPreparedError("missing")
+        ):
+            app = ChirpApp()
+            with self.assertRaises(SystemExit) as ctx:
+                app.run()
+        self.assertEqual(ctx.exception.code, 1)
+        mock_keyboard.return_value.wait.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from chirp.config_manager import ChirpConfig, ConfigManager
+from chirp.tuning import Candidate, Measurement, Tuner, choose, thread_grid, word_error_rate
+from chirp.tuning_profile import TuningProfile, cpu_key
+
+
+class FakeManager:
+    """ParakeetManager stand-in: int8 drops a word and is faster with more threads."""
+
+    def __init__(self, *, quantization, threads, **_kwargs):
+        self.quantization = quantization
+        self.threads = threads
+
+    def transcribe(self, audio, **_kwargs):
+        return "hello there world" if self.quantization is None else "hello world"
+
+    def close(self):
+        pass
+
+
+class TestTuningHelpers(unittest.TestCase):
+    def test_word_error_rate(self):
+        """WER counts substitutions, insertions and deletions per reference word."""
+        self.assertEqual(word_error_rate("a b c d", "a b c d"), 0.0)
+        self.assertEqual(word_error_rate("a b c d", "a x c"), 0.5)
+        self.assertEqual(word_error_rate("Hello, world", "hello world"), 0.0)
+
+    def test_thread_grid(self):
+        """Powers of two plus the core count."""
+        self.assertEqual(thread_grid(6), [1, 2, 4, 6])
+        self.assertEqual(thread_grid(1), [1])
+
+    def test_choose_respects_accuracy_limit(self):
+        """The fastest setting wins only if its WER is within the limit."""
+        fast = Measurement(Candidate(8, "int8"), rtf=0.05, p95_latency=0.2, wer=0.10)
+        slow = Measurement(Candidate(8, None), rtf=0.10, p95_latency=0.4, wer=0.0)
+        self.assertIs(choose([fast, slow], baseline_wer=0.0, max_wer_delta=0.02), slow)
+        self.assertIs(choose([fast, slow], baseline_wer=0.0, max_wer_delta=0.2), fast)
+
+
+class TestTuningProfile(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_profile_is_keyed_by_cpu(self):
+        """A profile written on another CPU is ignored."""
+        path = self.root / "profile.json"
+        TuningProfile(cpu=cpu_key(), settings={"threads": 4}).save(path)
+        self.assertEqual(TuningProfile.load(path).settings, {"threads": 4})
+
+        TuningProfile(cpu="some-other-cpu-8t", settings={"threads": 4}).save(path)
+        self.assertIsNone(TuningProfile.load(path))
+        self.assertIsNone(TuningProfile.load(self.root / "missing.json"))
+
+    def test_config_manager_applies_profile(self):
+        """ConfigManager overlays the profile unless use_tuning_profile is false."""
+        config_path = self.root / "config.toml"
+        config_path.write_text('threads = 0\nparakeet_quantization = "int8"\n\n[onnx]\nallow_spinning = false\n')
+        manager = ConfigManager()
+        manager._config_path = config_path
+        manager._tuning_root = self.root / "tuning"
+        TuningProfile(
+            cpu=cpu_key(),
+            settings={
+                "threads": 6,
+                "parakeet_quantization": None,
+                "onnx": {"flush_denormals": True},
+            },
+        ).save(manager.tuning_profile_path)
+
+        config = manager.load()
+        self.assertEqual(config.threads, 6)
+        self.assertIsNone(config.parakeet_quantization)
+        self.assertTrue(config.onnx.flush_denormals)
+        self.assertFalse(config.onnx.allow_spinning)
+        self.assertIsNotNone(manager.tuning_profile)
+
+        self.assertEqual(
+            manager.tuning_overrides,
+            {"threads": (0, 6), "parakeet_quantization": ("int8", None)},
+        )
+
+        config_path.write_text("threads = 0\nuse_tuning_profile = false\n")
+        self.assertEqual(manager.load().threads, 0)
+        self.assertIsNone(manager.tuning_profile)
+
+    def test_profile_drops_affinities_that_no_longer_fit(self):
+        """Pinned affinities for the old thread count do not fail validation."""
+        config_path = self.root / "config.toml"
+        config_path.write_text('threads = 4\n\n[onnx]\nintra_op_thread_affinities = "2;3;4"\n')
+        manager = ConfigManager()
+        manager._config_path = config_path
+        manager._tuning_root = self.root / "tuning"
+        profile = TuningProfile(cpu=cpu_key(), settings={"threads": 8})
+        profile.save(manager.tuning_profile_path)
+
+        config = manager.load()
+        self.assertEqual(config.threads, 8)
+        self.assertEqual(config.onnx.intra_op_thread_affinities, "")
+        self.assertEqual(
+            manager.tuning_overrides["onnx.intra_op_thread_affinities"], ("2;3;4", None)
+        )
+
+        config_path.write_text('threads = 8\n\n[onnx]\nintra_op_thread_affinities = "2;3;4;5;6;7;8"\n')
+        self.assertEqual(manager.load().onnx.intra_op_thread_affinities, "2;3;4;5;6;7;8")
+        self.assertEqual(manager.tuning_overrides, {})
+
+
+@patch("chirp.tuning.thread_grid", return_value=[1, 4])
+@patch("chirp.tuning.ParakeetManager", side_effect=FakeManager)
+class TestTuner(unittest.TestCase):
+    def _tuner(self, references, max_wer_delta=0.02):
+        tuner = Tuner(
+            config=ChirpConfig(),
+            config_manager=MagicMock(),
+            waveforms=[np.ones(16_000, dtype=np.float32)],
+            references=references,
+            repeats=1,
+            max_wer_delta=max_wer_delta,
+            logger=MagicMock(),
+            report=lambda _line: None,
+        )
+        tuner.quantizations = lambda: ["int8", None]
+        return tuner
+
+    def _run(self, tuner, latency):
+        """Run the tuner with a fake clock advanced by ``latency(manager)`` per call."""
+        clock = [0.0]
+        transcribe = tuner._transcribe
+
+        def timed(manager, audio):
+            clock[0] += latency(manager)
+            return transcribe(manager, audio)
+
+        tuner._transcribe = timed
+        with patch("chirp.tuning.time.perf_counter", side_effect=lambda: clock[0]):
+            return tuner.run()
+
+    def test_picks_fastest_accurate_setting(self, _manager, _grid):
+        """Without labels fp32 output is the reference, so lossy int8 is rejected."""
+        tuner = self._tuner([])
+        profile = self._run(tuner, lambda m: 1.0 / m.threads)
+        self.assertEqual(profile.cpu, cpu_key())
+        self.assertEqual(profile.settings["threads"], 4)
+        self.assertIsNone(profile.settings["parakeet_quantization"])
+
+    def test_int8_allowed_within_limit(self, _manager, _grid):
+        """A looser accuracy limit lets the faster int8 model win."""
+        tuner = self._tuner(["hello there world"], max_wer_delta=0.5)
+        profile = self._run(
+            tuner, lambda m: (0.5 if m.quantization else 1.0) / m.threads
+        )
+        self.assertEqual(profile.settings["parakeet_quantization"], "int8")
+        self.assertEqual(profile.settings["threads"], 4)
+        # Session variants were measured at the winning thread count.
+        self.assertTrue(any("flush_denormals" in r["candidate"] for r in profile.results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+
+import numpy as np
+
+from chirp.vad import SilenceEndpointer, frame_features, speech_bounds, trim_silence
+
+SR = 16_000
+
+
+def _tone(seconds: float, amplitude: float = 0.3, freq: float = 220.0) -> np.ndarray:
+    t = np.arange(int(SR * seconds)) / SR
+    return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+
+
+def _silence(seconds: float, level: float = 1e-4) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return (level * rng.standard_normal(int(SR * seconds))).astype(np.float32)
+
+
+class TestVad(unittest.TestCase):
+    def test_frame_features_energy(self):
+        """A full-scale square wave sits at 0 dBFS; silence is far below."""
+        square = np.tile(np.array([1.0, -1.0], dtype=np.float32), 160)
+        energy_db, zcr = frame_features(square, 320)
+        self.assertAlmostEqual(float(energy_db[0]), 0.0, places=3)
+        self.assertAlmostEqual(float(zcr[0]), 1.0)
+
+        energy_db, _ = frame_features(np.zeros(640, dtype=np.float32), 320)
+        self.assertTrue(np.all(energy_db < -90))
+
+    def test_trims_leading_and_trailing_silence(self):
+        """Silence around speech is removed, keeping the requested padding."""
+        waveform = np.concatenate([_silence(1.0), _tone(2.0), _silence(1.5)])
+        result = trim_silence(waveform, SR, threshold_db=-45.0, padding_ms=100)
+
+        self.assertIsNotNone(result)
+        self.assertAlmostEqual(result.start / SR, 0.9, delta=0.03)
+        self.assertAlmostEqual(result.end / SR, 3.1, delta=0.03)
+        self.assertAlmostEqual(result.trimmed_samples / SR, 2.3, delta=0.05)
+        self.assertTrue(np.shares_memory(result.waveform, waveform))
+
+    def test_no_speech_returns_none(self):
+        """Recordings of pure background noise are reported as speechless."""
+        self.assertIsNone(trim_silence(_silence(3.0), SR, threshold_db=-45.0))
+        self.assertIsNone(trim_silence(np.zeros(10, dtype=np.float32), SR, threshold_db=-45.0))
+
+    def test_quiet_fricative_detected_by_zero_crossings(self):
+        """Low-energy noisy frames just under the threshold still count as speech."""
+        rng = np.random.default_rng(1)
+        fricative = (0.004 * rng.standard_normal(SR // 2)).astype(np.float32)  # ~ -48 dBFS
+        waveform = np.concatenate([_silence(1.0), fricative, _silence(1.0)])
+
+        bounds = speech_bounds(waveform, SR, threshold_db=-45.0)
+        self.assertIsNotNone(bounds)
+        self.assertAlmostEqual(bounds[0] / SR, 1.0, delta=0.03)
+
+    def test_padding_clamped_to_waveform(self):
+        """Padding never extends beyond the recording."""
+        waveform = _tone(1.0)
+        self.assertEqual(
+            speech_bounds(waveform, SR, threshold_db=-45.0, padding_ms=500),
+            (0, waveform.size),
+        )
+
+
+class TestSilenceEndpointer(unittest.TestCase):
+    def _feed(self, endpointer, waveform, block=160):
+        fired = []
+        for offset in range(0, waveform.size, block):
+            if endpointer.update(waveform[offset : offset + block]):
+                fired.append(offset + block)
+        return fired
+
+    def test_fires_after_silence_following_speech(self):
+        """The endpoint is reported once silence_seconds of quiet follow speech."""
+        endpointer = SilenceEndpointer(sample_rate=SR, threshold_db=-45.0, silence_seconds=0.8)
+        waveform = np.concatenate([_tone(1.0), _silence(2.0)])
+        fired = self._feed(endpointer, waveform)
+        self.assertEqual(len(fired), 1)
+        self.assertAlmostEqual(fired[0] / SR, 1.8, delta=0.02)
+
+    def test_requires_minimum_speech(self):
+        """A click shorter than min_speech does not arm the endpointer."""
+        endpointer = SilenceEndpointer(
+            sample_rate=SR, threshold_db=-45.0, silence_seconds=0.5, min_speech=0.2
+        )
+        waveform = np.concatenate([_tone(0.05), _silence(2.0)])
+        self.assertEqual(self._feed(endpointer, waveform), [])
+
+
+if __name__ == "__main__":
+    unittest.main()